@@ -1,7 +1,10 @@
+from django.conf import settings
 from django.urls import path
 
-from .views import AuthTokenView
+from .views import AsyncAuthTokenView, AuthTokenView
+
+AuthTokenViewClass = AsyncAuthTokenView if settings.ASYNC_API_VIEWS else AuthTokenView
 
 urlpatterns = [
-    path("token/", AuthTokenView.as_view(), name="auth_token"),
+    path("token/", AuthTokenViewClass.as_view(), name="auth_token"),
 ]
@@ -3,7 +3,8 @@ from rest_framework import serializers, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
-from backend.users.auth import auth_token_for_user_credentials
+from api.views import AsyncAPIView
+from backend.users.auth import aauth_token_for_user_credentials, auth_token_for_user_credentials
 
 
 class AuthTokenView(APIView):
@@ -35,3 +36,25 @@ class AuthTokenView(APIView):
                 {"error": str(e)},
                 status=status.HTTP_403_FORBIDDEN,
             )
+
+
+class AsyncAuthTokenView(AsyncAPIView, AuthTokenView):
+    async def post(self, request):
+        try:
+            validated_data = self._validate_post_data(post_data=request.POST)
+            auth_token = await aauth_token_for_user_credentials(**validated_data)
+            return Response(
+                {"token": auth_token},
+                status=status.HTTP_200_OK,
+            )
+        except serializers.ValidationError as e:
+            return Response(
+                {"error": e.detail},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except PermissionDenied as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_403_FORBIDDEN,
+            )
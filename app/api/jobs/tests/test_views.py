@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api.jobs.views import JobStatus
+from backend.jobs.services import enqueue_job
+from backend.tasks.services import enqueue_bulk_tasks_job
+from backend.users.tests.utils import UserTestUtils
+
+
+class JobStatusViewTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        cls.job = enqueue_bulk_tasks_job(
+            "tasks.bulk_update", owner_id=cls.user.id, items=[], atomic=True, indexes=[], errors=[]
+        )
+
+    def get_endpoint_url(self, job_uuid) -> str:
+        return f"/api/v1/jobs/{job_uuid}/"
+
+    def test_view_url(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(self.get_endpoint_url(self.job.uuid))
+        self.assertIs(response.resolver_match.func.view_class, JobStatus)
+
+    def test_not_authenticated_user_gets_401_error(self):
+        response = self.client.get(self.get_endpoint_url(self.job.uuid))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_returns_the_job_status(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(self.get_endpoint_url(self.job.uuid))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["uuid"], str(self.job.uuid))
+        self.assertEqual(data["name"], "tasks.bulk_update")
+        self.assertEqual(data["status"], "queued")
+        self.assertEqual((data["attempts"], data["max_attempts"]), (0, 3))
+        self.assertListEqual(
+            list(data),
+            [
+                "uuid",
+                "name",
+                "status",
+                "attempts",
+                "max_attempts",
+                "created",
+                "run_after",
+                "started_at",
+                "finished_at",
+                "last_error",
+                "result",
+            ],
+        )
+
+    def test_unknown_job_gets_400_error(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(self.get_endpoint_url(uuid4()))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertDictEqual(response.json(), {"error": "Job matching query does not exist."})
+
+    def test_other_users_job_gets_403_error(self):
+        other_user = UserTestUtils.create_user(username="new_user", password="new")
+        job = enqueue_job("tasks.bulk_delete", owner_id=other_user.id)
+
+        self.client.force_authenticate(self.user)
+        response = self.client.get(self.get_endpoint_url(job.uuid))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import JobStatus
+
+urlpatterns = [
+    path("<uuid:job_uuid>/", JobStatus.as_view(), name="job_status"),
+]
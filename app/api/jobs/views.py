@@ -0,0 +1,42 @@
+from backend.jobs.services import get_job_for_owner
+from backend.users.authentication import CachedTokenAuthentication
+from django.core.exceptions import ObjectDoesNotExist
+from rest_framework import serializers, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class JobStatus(APIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    class JobStatusSerializer(serializers.Serializer):
+        uuid = serializers.UUIDField()
+        name = serializers.CharField()
+        status = serializers.CharField()
+        attempts = serializers.IntegerField()
+        max_attempts = serializers.IntegerField()
+        created = serializers.DateTimeField()
+        run_after = serializers.DateTimeField()
+        started_at = serializers.DateTimeField()
+        finished_at = serializers.DateTimeField()
+        last_error = serializers.CharField()
+        result = serializers.JSONField()
+
+    def get(self, request, job_uuid):
+        try:
+            job = get_job_for_owner(job_uuid=str(job_uuid), owner_id=request.user.id)
+            return Response(self.JobStatusSerializer(job).data)
+
+        except ObjectDoesNotExist as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except PermissionError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_403_FORBIDDEN,
+            )
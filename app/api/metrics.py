@@ -0,0 +1,119 @@
+import threading
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Optional
+
+from django.db import connections
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+from backend.db.metrics import get_connection_stats
+from backend.users.authentication import get_token_cache
+
+VIEW_METRICS = [
+    ("api_requests_total", "requests", "Requests handled by the view."),
+    ("api_db_queries_total", "queries", "SQL queries executed by the view."),
+    ("api_db_query_seconds_total", "db_seconds", "Time spent executing SQL queries."),
+    ("api_serialization_seconds_total", "serialization_seconds", "Time spent rendering responses."),
+    ("api_response_size_bytes_total", "response_bytes", "Size of the response bodies."),
+    ("api_request_duration_seconds_total", "duration_seconds", "Time spent handling requests."),
+]
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.view = None
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialization_seconds = 0.0
+
+
+_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+_stats_lock = threading.Lock()
+_views_stats: dict[str, dict] = {}
+
+
+def start_request_metrics():
+    return _request_metrics.set(RequestMetrics())
+
+
+def get_request_metrics() -> Optional[RequestMetrics]:
+    return _request_metrics.get()
+
+
+def stop_request_metrics(token) -> RequestMetrics:
+    request_metrics = _request_metrics.get()
+    _request_metrics.reset(token)
+    return request_metrics
+
+
+def record_query(execute, sql, params, many, context):
+    request_metrics = _request_metrics.get()
+    if request_metrics is None:
+        return execute(sql, params, many, context)
+
+    start = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        request_metrics.queries += 1
+        request_metrics.db_seconds += perf_counter() - start
+
+
+def install_query_recorder(connection, **kwargs) -> None:
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def enable_query_recording() -> None:
+    connection_created.connect(install_query_recorder, dispatch_uid="api_metrics_query_recorder")
+    for connection in connections.all(initialized_only=True):
+        install_query_recorder(connection)
+
+
+def record_view_metrics(request_metrics: RequestMetrics, response_bytes: int, duration_seconds: float) -> None:
+    with _stats_lock:
+        view_stats = _views_stats.setdefault(
+            request_metrics.view, dict.fromkeys((key for _, key, _ in VIEW_METRICS), 0)
+        )
+        view_stats["requests"] += 1
+        view_stats["queries"] += request_metrics.queries
+        view_stats["db_seconds"] += request_metrics.db_seconds
+        view_stats["serialization_seconds"] += request_metrics.serialization_seconds
+        view_stats["response_bytes"] += response_bytes
+        view_stats["duration_seconds"] += duration_seconds
+
+
+def get_views_stats() -> dict[str, dict]:
+    with _stats_lock:
+        return {view: dict(view_stats) for view, view_stats in _views_stats.items()}
+
+
+def render_prometheus_metrics() -> str:
+    views_stats = sorted(get_views_stats().items())
+    lines = []
+    for name, key, help_text in VIEW_METRICS:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        lines += [f'{name}{{view="{view}"}} {view_stats[key]}' for view, view_stats in views_stats]
+
+    connection_stats = get_connection_stats()
+    lines += [
+        "# HELP db_connections_total Database connections opened.",
+        "# TYPE db_connections_total counter",
+        f"db_connections_total {connection_stats['connections']}",
+        "# HELP db_connection_setup_seconds_total Time spent opening database connections.",
+        "# TYPE db_connection_setup_seconds_total counter",
+        f"db_connection_setup_seconds_total {connection_stats['setup_seconds']}",
+    ]
+
+    token_cache_stats = get_token_cache().stats()
+    token_cache_backend = settings.TOKEN_AUTH_CACHE_BACKEND
+    lines += [
+        "# HELP token_cache_hits_total Authentication tokens found in the token cache by this process.",
+        "# TYPE token_cache_hits_total counter",
+        f'token_cache_hits_total{{backend="{token_cache_backend}"}} {token_cache_stats["hits"]}',
+        "# HELP token_cache_misses_total Authentication tokens looked up in the database by this process.",
+        "# TYPE token_cache_misses_total counter",
+        f'token_cache_misses_total{{backend="{token_cache_backend}"}} {token_cache_stats["misses"]}',
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,84 @@
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .metrics import (
+    enable_query_recording,
+    get_request_metrics,
+    record_view_metrics,
+    start_request_metrics,
+    stop_request_metrics,
+)
+
+API_ROUTE_PREFIX = "api/v1/"
+
+
+class ApiMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.API_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+        enable_query_recording()
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        start = perf_counter()
+        token = start_request_metrics()
+        try:
+            response = self.get_response(request)
+        finally:
+            request_metrics = stop_request_metrics(token)
+        return self.record(request_metrics, response, perf_counter() - start)
+
+    async def __acall__(self, request):
+        start = perf_counter()
+        token = start_request_metrics()
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_metrics = stop_request_metrics(token)
+        return self.record(request_metrics, response, perf_counter() - start)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request_metrics = get_request_metrics()
+        if request_metrics is not None and request.resolver_match.route.startswith(API_ROUTE_PREFIX):
+            view_class = getattr(view_func, "view_class", None)
+            request_metrics.view = view_class.__name__ if view_class else view_func.__name__
+
+    def process_template_response(self, request, response):
+        request_metrics = get_request_metrics()
+        if request_metrics is None or not request_metrics.view:
+            return response
+
+        start = perf_counter()
+
+        def record_render(rendered_response):
+            request_metrics.serialization_seconds += perf_counter() - start
+
+        response.add_post_render_callback(record_render)
+        return response
+
+    def record(self, request_metrics, response, duration_seconds: float):
+        if not request_metrics.view:
+            return response
+
+        response_bytes = 0 if response.streaming else len(response.content)
+        record_view_metrics(request_metrics, response_bytes, duration_seconds)
+
+        request_timing = (
+            f'db;desc="{request_metrics.queries} queries";dur={request_metrics.db_seconds * 1000:.2f}, '
+            f"serialize;dur={request_metrics.serialization_seconds * 1000:.2f}, "
+            f"total;dur={duration_seconds * 1000:.2f}"
+        )
+        server_timing = response.get("Server-Timing")
+        response["Server-Timing"] = f"{server_timing}, {request_timing}" if server_timing else request_timing
+        return response
@@ -0,0 +1,127 @@
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import Callable, Iterable, Iterator, Optional
+
+from django.db.models import QuerySet
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+STRFTIME_DIRECTIVES = {
+    "d": ("%02d", "day"),
+    "m": ("%02d", "month"),
+    "Y": ("%04d", "year"),
+    "H": ("%02d", "hour"),
+    "M": ("%02d", "minute"),
+    "S": ("%02d", "second"),
+    "f": ("%06d", "microsecond"),
+}
+
+
+@lru_cache(maxsize=None)
+def compile_strftime(output_format: str) -> Optional[Callable]:
+    pattern, attributes, index = [], [], 0
+    while index < len(output_format):
+        char = output_format[index]
+        if char != "%":
+            pattern.append(char)
+            index += 1
+            continue
+
+        directive = output_format[index + 1 : index + 2]
+        if directive == "%":
+            pattern.append("%%")
+        elif directive in STRFTIME_DIRECTIVES:
+            conversion, attribute = STRFTIME_DIRECTIVES[directive]
+            pattern.append(conversion)
+            attributes.append(attribute)
+        else:
+            return None
+        index += 2
+
+    pattern = "".join(pattern)
+    if not attributes:
+        return lambda value: pattern % ()
+    get_attributes = attrgetter(*attributes)
+    if len(attributes) == 1:
+        return lambda value: pattern % (get_attributes(value),)
+    return lambda value: pattern % get_attributes(value)
+
+
+def get_datetime_formatter(field: serializers.DateTimeField) -> Callable:
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    if output_format is None:
+        return lambda value: value
+
+    field_timezone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if output_format.lower() == ISO_8601:
+
+        def format_value(value):
+            value = value.isoformat()
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+    else:
+        format_value = compile_strftime(output_format) or (lambda value: value.strftime(output_format))
+
+    def format_datetime(value):
+        if not value:
+            return None
+        if isinstance(value, str):
+            return value
+        if field_timezone is not None and value.tzinfo is not None:
+            value = value.astimezone(field_timezone)
+        else:
+            value = field.enforce_timezone(value)
+        return format_value(value)
+
+    return format_datetime
+
+
+def get_formatter(field: serializers.Field) -> Callable:
+    if isinstance(field, serializers.DateTimeField):
+        return get_datetime_formatter(field)
+    if isinstance(field, serializers.CharField) or (
+        isinstance(field, serializers.UUIDField) and field.uuid_format == "hex_verbose"
+    ):
+        format_value = str
+    else:
+        format_value = field.to_representation
+    return lambda value: None if value is None else format_value(value)
+
+
+class ValuesListSerializer:
+    def __init__(self, serializer_class: type[serializers.Serializer], extra_fields: Iterable[str] = ()):
+        self.serializer_class = serializer_class
+        self.extra_fields = tuple(extra_fields)
+
+    @cached_property
+    def fields(self) -> dict:
+        return dict(self.serializer_class().fields)
+
+    @cached_property
+    def sources(self) -> list[str]:
+        return [field.source for field in self.fields.values()]
+
+    def can_serialize(self, instance) -> bool:
+        return isinstance(instance, QuerySet) and all(
+            source != "*" and "." not in source for source in self.sources
+        )
+
+    def get_rows(self, queryset: QuerySet) -> QuerySet:
+        extra_fields = [field for field in self.extra_fields if field not in self.sources]
+        return queryset.values_list(*self.sources, *extra_fields, named=True)
+
+    @cached_property
+    def formatters(self) -> list[Callable]:
+        return [get_formatter(field) for field in self.fields.values()]
+
+    def to_representation(self, rows: Iterable) -> list[dict]:
+        field_names, formatters = list(self.fields), self.formatters
+        return [
+            dict(zip(field_names, [format_value(value) for format_value, value in zip(formatters, row)]))
+            for row in rows
+        ]
+
+    def iter_representation(self, rows: Iterable) -> Iterator[dict]:
+        field_names, formatters = list(self.fields), self.formatters
+        for row in rows:
+            yield dict(zip(field_names, [format_value(value) for format_value, value in zip(formatters, row)]))
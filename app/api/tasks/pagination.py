@@ -0,0 +1,137 @@
+import base64
+import binascii
+import json
+from typing import Optional
+
+from django.conf import settings
+from django.core.paginator import InvalidPage, Paginator as DjangoPaginator
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TasksPageNumberPagination(PageNumberPagination):
+    def __init__(self, count: Optional[int] = None):
+        self.count = count
+
+    def django_paginator_class(self, queryset, page_size):
+        paginator = DjangoPaginator(queryset, page_size)
+        if self.count is not None:
+            paginator.count = self.count
+        return paginator
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        if self.count is None:
+            paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            raise NotFound(msg)
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+
+        self.request = request
+        self.page.object_list = [item async for item in self.page.object_list]
+        return self.page.object_list
+
+
+class TasksCursorPagination(BasePagination):
+    cursor_query_param = "cursor"
+    page_size = settings.PAGINATION_PAGE_SIZE
+    ordering = ("-created", "id")
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_queryset = self._get_page_queryset(queryset, request)
+        return self._set_page(list(page_queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        page_queryset = self._get_page_queryset(queryset, request)
+        return self._set_page([task async for task in page_queryset])
+
+    def _get_page_queryset(self, queryset, request):
+        self.request = request
+        self.cursor = self.decode_cursor(request)
+        queryset = queryset.order_by(*self.ordering)
+        if self.cursor is None:
+            return queryset[: self.page_size + 1]
+
+        # The redundant bound on created gives the index scan a range start, which the OR alone does not.
+        created, task_id, reverse = self.cursor
+        if reverse:
+            queryset = queryset.filter(
+                Q(created__gt=created) | Q(created=created, id__lt=task_id), created__gte=created
+            )
+            return queryset.order_by("created", "-id")[: self.page_size + 1]
+        queryset = queryset.filter(Q(created__lt=created) | Q(created=created, id__gt=task_id), created__lte=created)
+        return queryset[: self.page_size + 1]
+
+    def _set_page(self, tasks: list) -> list:
+        has_more = len(tasks) > self.page_size
+        tasks = tasks[: self.page_size]
+        if self.cursor is None:
+            self.has_next, self.has_previous = has_more, False
+        elif self.cursor[2]:
+            self.has_next, self.has_previous = True, has_more
+            tasks.reverse()
+        else:
+            self.has_next, self.has_previous = has_more, True
+        self.page = tasks
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self.build_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous or not self.page:
+            return None
+        return self.build_link(self.page[0], reverse=True)
+
+    def build_link(self, task, reverse: bool) -> str:
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(task, reverse))
+
+    def encode_cursor(self, task, reverse: bool) -> str:
+        position = {"c": task.created.isoformat(), "i": task.id, "r": int(reverse)}
+        encoded = json.dumps(position, separators=(",", ":")).encode("ascii")
+        return base64.urlsafe_b64encode(encoded).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            padding = "=" * (-len(encoded) % 4)
+            position = json.loads(base64.urlsafe_b64decode(encoded + padding))
+            created = parse_datetime(position["c"])
+            task_id = int(position["i"])
+            reverse = bool(position["r"])
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if created is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created, task_id, reverse
@@ -0,0 +1,72 @@
+import csv
+import io
+from itertools import islice
+from typing import Iterable, Iterator
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class TasksJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return ret.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+def chunked(rows: Iterable, chunk_size: int) -> Iterator[list]:
+    rows = iter(rows)
+    return iter(lambda: list(islice(rows, chunk_size)), [])
+
+
+class TasksNDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    json_renderer = TasksJSONRenderer()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return self.json_renderer.render(data) + b"\n"
+
+    def stream(self, rows: Iterable[dict], field_names: list[str], chunk_size: int) -> Iterator[bytes]:
+        for chunk in chunked(rows, chunk_size):
+            yield b"".join(self.render(row) for row in chunk)
+
+
+class TasksCSVRenderer(BaseRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+    def render_rows(self, rows: Iterable[list]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode(self.charset)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if not isinstance(data, dict):
+            data = {"detail": data}
+        return self.render_rows([list(data), list(data.values())])
+
+    def stream(self, rows: Iterable[dict], field_names: list[str], chunk_size: int) -> Iterator[bytes]:
+        yield self.render_rows([field_names])
+        for chunk in chunked(rows, chunk_size):
+            yield self.render_rows([row[field_name] for field_name in field_names] for row in chunk)
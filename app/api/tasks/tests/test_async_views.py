@@ -0,0 +1,136 @@
+from asgiref.sync import async_to_sync
+
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+
+from api.auth.views import AsyncAuthTokenView
+from api.tasks.views import AsyncCreateTask, AsyncDeleteTask, AsyncTasksList, AsyncUpdateTask, TasksList
+from backend.tasks.tests.utils import TaskTestUtils
+from backend.users.tests.utils import UserTestUtils
+
+
+class AsyncViewTestCase(APITestCase):
+    factory = APIRequestFactory()
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user", password="test123")
+        cls.new_user = UserTestUtils.create_user(username="new_user", password="new")
+
+    def call_view(self, view_class, method: str, path: str = "/", data=None, user=None, **kwargs):
+        request = getattr(self.factory, method)(path, data=data, **kwargs.pop("headers", {}))
+        if user is not None:
+            force_authenticate(request, user=user)
+        view = view_class.as_view()
+        response = async_to_sync(view)(request, **kwargs) if view_class.view_is_async else view(request, **kwargs)
+        return response.render()
+
+
+class AsyncTasksListTestCase(AsyncViewTestCase):
+    def test_view_is_async(self):
+        self.assertTrue(AsyncTasksList.view_is_async)
+
+    def test_not_authenticated_user_gets_401_error(self):
+        response = self.call_view(AsyncTasksList, "get")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_response_matches_sync_view(self):
+        for i in range(3):
+            TaskTestUtils.create_task(title=f"Task {i}", owner_id=self.user.id)
+        TaskTestUtils.create_task(title="Not listed", owner_id=self.new_user.id)
+        TaskTestUtils.create_task(
+            title="Chore", owner_id=self.user.id, due_at="2024-01-01T08:00:00Z", recurrence="FREQ=DAILY"
+        )
+        window = "due_after=2024-01-01T00:00:00Z&due_before=2024-01-04T00:00:00Z"
+
+        for path in ["/?page_size=2", "/?pagination=cursor", "/?status=to_do", f"/?{window}"]:
+            with self.subTest(path=path):
+                async_response = self.call_view(AsyncTasksList, "get", path, user=self.user)
+                sync_response = self.call_view(TasksList, "get", path, user=self.user)
+                self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+                self.assertEqual(async_response.content, sync_response.content)
+
+    def test_invalid_page_gets_404_error(self):
+        response = self.call_view(AsyncTasksList, "get", "/?page=5", user=self.user)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(TASKS_RECURRENCE_MAX_WINDOW_DAYS=2)
+    def test_due_window_longer_than_the_maximum_gets_400_error(self):
+        window = "due_after=2024-01-01T00:00:00Z&due_before=2024-01-04T00:00:00Z"
+        response = self.call_view(AsyncTasksList, "get", f"/?{window}", user=self.user)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(TASKS_LIST_CACHE_TIMEOUT=60)
+    def test_matching_etag_gets_304(self):
+        cache.clear()
+        response = self.call_view(AsyncTasksList, "get", user=self.user)
+
+        headers = {"HTTP_IF_NONE_MATCH": response["ETag"]}
+        cached_response = self.call_view(AsyncTasksList, "get", user=self.user, headers=headers)
+        self.assertEqual(cached_response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class AsyncCreateTaskTestCase(AsyncViewTestCase):
+    def test_task_creation(self):
+        task_data = {"title": "Test Task", "status": "to_do"}
+        response = self.call_view(AsyncCreateTask, "post", data=task_data, user=self.user)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        task = TaskTestUtils.get_first_task_for_user(owner_id=self.user.id, **task_data)
+        self.assertEqual(response.data, {"task_uuid": str(task.uuid)})
+
+    def test_title_is_required(self):
+        response = self.call_view(AsyncCreateTask, "post", data={"status": "to_do"}, user=self.user)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("title", response.data["error"])
+
+
+class AsyncUpdateTaskTestCase(AsyncViewTestCase):
+    def test_task_update(self):
+        task = TaskTestUtils.create_task(title="Test Task", owner_id=self.user.id)
+        task_data = {"title": "Test update", "status": "completed"}
+
+        response = self.call_view(AsyncUpdateTask, "post", data=task_data, user=self.user, task_uuid=task.uuid)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id, **task_data), 1)
+
+    def test_not_task_owner_gets_403_error(self):
+        task = TaskTestUtils.create_task(title="Test Task", owner_id=self.new_user.id)
+        task_data = {"title": "Test update", "status": "completed"}
+
+        response = self.call_view(AsyncUpdateTask, "post", data=task_data, user=self.user, task_uuid=task.uuid)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.data, {"error": "User is not task owner."})
+
+
+class AsyncDeleteTaskTestCase(AsyncViewTestCase):
+    def test_task_deletion(self):
+        task = TaskTestUtils.create_task(title="Test Task", owner_id=self.user.id)
+
+        response = self.call_view(AsyncDeleteTask, "delete", user=self.user, task_uuid=task.uuid)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id), 0)
+
+    def test_wrong_uuid_gets_400_error(self):
+        wrong_uuid = "ea0ec33b-30e2-9999-9011-e35e1e2b5e0d"
+        response = self.call_view(AsyncDeleteTask, "delete", user=self.user, task_uuid=wrong_uuid)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {"error": "Task matching query does not exist."})
+
+    def test_get_method_gets_405_error(self):
+        task_uuid = "ea0ec33b-30e2-9999-9011-e35e1e2b5e0d"
+        response = self.call_view(AsyncDeleteTask, "get", user=self.user, task_uuid=task_uuid)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+
+class AsyncAuthTokenViewTestCase(AsyncViewTestCase):
+    def test_view_gets_expected_response(self):
+        response = self.call_view(AsyncAuthTokenView, "post", data={"username": "test_user", "password": "test123"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["token"]), 40)
+
+    def test_invalid_credentials_gets_403_error(self):
+        response = self.call_view(AsyncAuthTokenView, "post", data={"username": "test_user", "password": "pass"})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,98 @@
+from datetime import datetime, timezone as dt_timezone
+
+from mock import patch
+from freezegun import freeze_time
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from api.tasks.fast_serializers import ValuesListSerializer, compile_strftime, get_formatter
+from api.tasks.renderers import TasksJSONRenderer
+from api.tasks.views import TasksList
+from backend.tasks.models import Task
+from backend.tasks.tests.utils import TaskTestUtils
+from backend.users.tests.utils import UserTestUtils
+
+
+class ValuesListSerializerTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        titles = [
+            "Plain",
+            'Quotes " and \\ backslash',
+            "Unicode ñ € 😀",
+            "Control \n\t\x01",
+            "Separators \u2028 \u2029",
+        ]
+        with freeze_time("2023-01-01 12:00:00.123456"):
+            for title in titles:
+                TaskTestUtils.create_task(title=title, owner_id=cls.user.id)
+
+    def get_tasks(self):
+        return Task.objects.filter(owner_id=self.user.id).order_by("id")
+
+    def test_output_matches_drf_serializer(self):
+        drf_data = TasksList.TasksListSerializer(self.get_tasks(), many=True).data
+        fast_data = TasksList.serialize_tasks(self.get_tasks())
+        self.assertListEqual(fast_data, [dict(task_data) for task_data in drf_data])
+
+    def test_rendered_bytes_match_drf_renderer(self):
+        drf_bytes = JSONRenderer().render(TasksList.TasksListSerializer(self.get_tasks(), many=True).data)
+        self.assertEqual(TasksJSONRenderer().render(TasksList.serialize_tasks(self.get_tasks())), drf_bytes)
+
+    def test_renderer_without_orjson_matches_drf_renderer(self):
+        data = TasksList.serialize_tasks(self.get_tasks())
+        with patch("api.tasks.renderers.orjson", None):
+            self.assertEqual(TasksJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_renderer_falls_back_for_values_orjson_cannot_encode(self):
+        data = {"created": timezone.now(), "count": 2**70}
+        self.assertEqual(TasksJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_fetches_only_serialized_columns(self):
+        with self.assertNumQueries(1) as context:
+            TasksList.serialize_tasks(self.get_tasks())
+        select_clause = context.captured_queries[0]["sql"].split(" FROM ")[0]
+        self.assertNotIn("description", select_clause)
+
+    def test_not_queryset_uses_drf_serializer(self):
+        tasks = list(self.get_tasks())
+        self.assertFalse(TasksList.tasks_list_serializer.can_serialize(tasks))
+        self.assertEqual(len(TasksList.serialize_tasks(tasks)), len(tasks))
+
+    def test_dotted_sources_are_not_supported(self):
+        class OwnerSerializer(serializers.Serializer):
+            owner = serializers.CharField(source="owner.username")
+
+        self.assertFalse(ValuesListSerializer(OwnerSerializer).can_serialize(self.get_tasks()))
+
+
+class DatetimeFormatterTestCase(TestCase):
+    value = datetime(2023, 1, 2, 3, 4, 5, 60708, tzinfo=dt_timezone.utc)
+
+    def assertFormatMatchesDrf(self, field):
+        self.assertEqual(get_formatter(field)(self.value), field.to_representation(self.value))
+
+    def test_formats_match_drf(self):
+        for output_format in ["%d-%m-%Y %H:%M:%S", "%Y%m%d %% %f", "%A %d", "iso-8601", "literal"]:
+            with self.subTest(output_format=output_format):
+                self.assertFormatMatchesDrf(serializers.DateTimeField(format=output_format))
+
+    def test_active_timezone_matches_drf(self):
+        with timezone.override("Europe/Madrid"):
+            self.assertFormatMatchesDrf(serializers.DateTimeField())
+
+    @override_settings(USE_TZ=False)
+    def test_naive_datetimes_match_drf(self):
+        self.value = self.value.replace(tzinfo=None)
+        self.assertFormatMatchesDrf(serializers.DateTimeField())
+
+    def test_none_is_kept(self):
+        self.assertIsNone(get_formatter(serializers.DateTimeField())(None))
+        self.assertIsNone(get_formatter(serializers.CharField())(None))
+
+    def test_unsupported_directive_is_not_compiled(self):
+        self.assertIsNone(compile_strftime("%A"))
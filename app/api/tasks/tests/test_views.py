@@ -1,19 +1,61 @@
+import base64
+import csv
+import io
+import json
+import tempfile
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+
 from mock import patch
 from freezegun import freeze_time
 
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.http import QueryDict
+from django.test import override_settings
+from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
-
-from api.tasks.views import TasksList, CreateTask, DeleteTask, UpdateTask
-from backend.tasks.tests.utils import TaskTestUtils
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from api.tasks.pagination import TasksCursorPagination
+
+from api.tasks.views import (
+    TasksList,
+    TaskChanges,
+    TasksSummary,
+    ExportTasks,
+    ImportTasks,
+    CreateTask,
+    DeleteTask,
+    UpdateTask,
+    UpdateTaskOccurrence,
+    BulkCreateTasks,
+    BulkUpdateTasks,
+    BulkDeleteTasks,
+)
+from backend.jobs.models import Job
+from backend.jobs.services import JobWorker
+from backend.tasks.models import Task
+from backend.tasks.services import create_task, delete_task
+from backend.tasks.tests.utils import QueryBudgetTestUtils, TaskTestUtils
 from backend.users.tests.utils import UserTestUtils
 
 
 class TasksListViewTestCase(APITestCase):
     endpoint_url = "/api/v1/tasks/list/"
     UUID = "ea0ec33b-30e2-4601-9011-e35e1e2b5e0d"
+    FORWARD_SEEK_PATTERNS = {
+        "postgresql": r"Index Cond: \(\(owner_id = \d+\) AND \(created <= ",
+        "sqlite": r"USING INDEX tasks_owner_created_id_idx \(owner_id=\? AND created<\?\)",
+    }
+    REVERSE_SEEK_PATTERNS = {
+        "postgresql": r"Index Cond: \(\(owner_id = \d+\) AND \(created >= ",
+        "sqlite": r"USING INDEX tasks_owner_created_id_idx \(owner_id=\? AND created>\?\)",
+    }
 
     @classmethod
     def setUpTestData(cls) -> None:
@@ -28,6 +70,11 @@ class TasksListViewTestCase(APITestCase):
                 "created": "01-01-2022 12:00:00",
                 "last_updated": "01-01-2022 12:00:00",
                 "status": "to_do",
+                "due_at": None,
+                "run_at": None,
+                "recurrence": None,
+                "template_uuid": None,
+                "occurrence_at": None,
             }
         ]
 
@@ -56,8 +103,9 @@ class TasksListViewTestCase(APITestCase):
         response = self.client.get(self.endpoint_url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    @patch("api.tasks.views.get_tasks_count_for_user", return_value=None)
     @patch("api.tasks.views.list_tasks_for_user")
-    def test_tasks_list(self, mock_service):
+    def test_tasks_list(self, mock_service, mock_count_service):
         mock_service.return_value = self.service_mock_data
 
         self.client.force_authenticate(self.user)
@@ -69,7 +117,23 @@ class TasksListViewTestCase(APITestCase):
     def test_tasks_list_service_only_called_once(self, mock_service):
         self.client.force_authenticate(self.user)
         self.client.get(self.endpoint_url)
-        mock_service.assert_called_once_with(user_id=self.user.id, query_params=QueryDict())
+        mock_service.assert_called_once_with(
+            user_id=self.user.id,
+            query_params=QueryDict(),
+            fields=[
+                "uuid",
+                "title",
+                "created",
+                "last_updated",
+                "status",
+                "due_at",
+                "run_at",
+                "recurrence",
+                "template_uuid",
+                "occurrence_at",
+            ],
+            expand_occurrences=True,
+        )
 
     @freeze_time("2023-01-01 12:00:00")
     def test_integration_with_service(self):
@@ -86,6 +150,11 @@ class TasksListViewTestCase(APITestCase):
                 "created": "01-01-2023 12:00:00",
                 "last_updated": "01-01-2023 12:00:00",
                 "status": "to_do",
+                "due_at": None,
+                "run_at": None,
+                "recurrence": None,
+                "template_uuid": None,
+                "occurrence_at": None,
             },
             {
                 "uuid": uuids[1],
@@ -93,6 +162,11 @@ class TasksListViewTestCase(APITestCase):
                 "created": "01-01-2023 12:00:00",
                 "last_updated": "01-01-2023 12:00:00",
                 "status": "to_do",
+                "due_at": None,
+                "run_at": None,
+                "recurrence": None,
+                "template_uuid": None,
+                "occurrence_at": None,
             },
         ]
 
@@ -107,6 +181,538 @@ class TasksListViewTestCase(APITestCase):
         for retrieved_task_data, expected_task_data in zip(results_list, expected_tasks):
             self.assertDictEqual(retrieved_task_data, expected_task_data)
 
+    @freeze_time("2023-01-01 12:00:00")
+    def test_cursor_pagination_walks_all_tasks(self):
+        tasks = [TaskTestUtils.create_task(title=f"Task {i}", owner_id=self.user.id) for i in range(25)]
+        expected_uuids = [str(task.uuid) for task in tasks]
+
+        self.client.force_authenticate(self.user)
+        retrieved_uuids = []
+        next_url = f"{self.endpoint_url}?pagination=cursor"
+        while next_url:
+            response = self.client.get(next_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.json())
+            retrieved_uuids.extend(task["uuid"] for task in response.json().get("results"))
+            next_url = response.json().get("next")
+
+        self.assertListEqual(retrieved_uuids, expected_uuids)
+
+    def test_cursor_pagination_previous_link(self):
+        tasks = [TaskTestUtils.create_task(title=f"Task {i}", owner_id=self.user.id) for i in range(15)]
+        expected_uuids = [str(task.uuid) for task in reversed(tasks)][:10]
+
+        self.client.force_authenticate(self.user)
+        first_page = self.client.get(f"{self.endpoint_url}?pagination=cursor").json()
+        self.assertIsNone(first_page.get("previous"))
+        second_page = self.client.get(first_page.get("next")).json()
+        self.assertIsNone(second_page.get("next"))
+        previous_page = self.client.get(second_page.get("previous")).json()
+
+        self.assertListEqual([task["uuid"] for task in previous_page.get("results")], expected_uuids)
+        self.assertIsNone(previous_page.get("previous"))
+
+    def test_cursor_pagination_seeks_with_an_index_range(self):
+        task = TaskTestUtils.create_task(title="Task", owner_id=self.user.id)
+        pagination = TasksCursorPagination()
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        for reverse, pattern in [(False, self.FORWARD_SEEK_PATTERNS), (True, self.REVERSE_SEEK_PATTERNS)]:
+            cursor = pagination.encode_cursor(task, reverse=reverse)
+            request = Request(APIRequestFactory().get(self.endpoint_url, {"cursor": cursor}))
+            page_queryset = pagination._get_page_queryset(Task.objects.filter(owner_id=self.user.id), request)
+            self.assertRegex(page_queryset.explain(), pattern[connection.vendor])
+
+    def test_cursor_pagination_invalid_cursor_gets_404_error(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(f"{self.endpoint_url}?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(TASKS_RECURRENCE_MAX_WINDOW_DAYS=7)
+    def test_due_window_longer_than_the_maximum_gets_400_error(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(
+            self.endpoint_url, {"due_after": "2024-01-01T00:00:00Z", "due_before": "2024-01-09T00:00:00Z"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertDictEqual(
+            response.json(), {"error": {"due_before": ["Ensure the window is no longer than 7 days."]}}
+        )
+
+
+@override_settings(TASKS_LIST_CACHE_TIMEOUT=60)
+class TasksListCacheTestCase(APITestCase):
+    endpoint_url = "/api/v1/tasks/list/"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        TaskTestUtils.create_task(title="Cached task", owner_id=cls.user.id)
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def test_repeated_request_is_served_from_cache(self):
+        first_response = self.client.get(self.endpoint_url)
+
+        with self.assertNumQueries(0):
+            second_response = self.client.get(self.endpoint_url)
+
+        self.assertEqual(second_response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(second_response.json(), first_response.json())
+        self.assertEqual(second_response["ETag"], first_response["ETag"])
+
+    def test_matching_etag_gets_304_without_queries(self):
+        etag = self.client.get(self.endpoint_url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.endpoint_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_if_none_match_compares_whole_etags(self):
+        etag = self.client.get(self.endpoint_url)["ETag"]
+
+        containing_response = self.client.get(self.endpoint_url, HTTP_IF_NONE_MATCH=f"W/{etag}-stale")
+        listed_response = self.client.get(self.endpoint_url, HTTP_IF_NONE_MATCH=f'"other", W/{etag}')
+        any_response = self.client.get(self.endpoint_url, HTTP_IF_NONE_MATCH="*")
+
+        self.assertEqual(containing_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(listed_response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(any_response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_query_params_order_does_not_change_etag(self):
+        first_etag = self.client.get(f"{self.endpoint_url}?status=to_do&title=task")["ETag"]
+        second_etag = self.client.get(f"{self.endpoint_url}?title=task&status=to_do")["ETag"]
+        other_etag = self.client.get(f"{self.endpoint_url}?title=task")["ETag"]
+
+        self.assertEqual(first_etag, second_etag)
+        self.assertNotEqual(first_etag, other_etag)
+
+    def test_task_changes_invalidate_cached_list(self):
+        etag = self.client.get(self.endpoint_url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            create_task(owner_id=self.user.id, title="New task", status="to_do")
+
+        response = self.client.get(self.endpoint_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json().get("count"), 2)
+
+    @override_settings(TASKS_LIST_CACHE_TIMEOUT=0)
+    def test_disabled_cache_does_not_send_etag(self):
+        response = self.client.get(self.endpoint_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header("ETag"))
+
+
+class TaskChangesTestCase(APITestCase):
+    endpoint_url = "/api/v1/tasks/changes/"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+
+    def sync_every_page(self) -> str:
+        response_data = {"since": "", "has_more": True}
+        while response_data["has_more"]:
+            response_data = self.client.get(f"{self.endpoint_url}?since={response_data['since']}").json()
+        return response_data["since"]
+
+    def test_view_url(self):
+        response = self.client.get(self.endpoint_url)
+        self.assertNotEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIs(response.resolver_match.func.view_class, TaskChanges)
+
+    def test_post_method_gets_405_error(self):
+        response = self.client.post(self.endpoint_url)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    def test_not_authenticated_user_gets_401_error(self):
+        self.client.force_authenticate(None)
+        response = self.client.get(self.endpoint_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_invalid_since_token_gets_400_error(self):
+        response = self.client.get(f"{self.endpoint_url}?since=not-a-token")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertDictEqual(response.json(), {"error": {"since": ["Invalid since token."]}})
+
+    def test_first_sync_returns_every_task(self):
+        task = TaskTestUtils.create_task(title="Task 1", owner_id=self.user.id)
+
+        response = self.client.get(self.endpoint_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertListEqual([task_data["uuid"] for task_data in response.json().get("changed")], [str(task.uuid)])
+        self.assertListEqual(response.json().get("deleted"), [])
+        self.assertIsNotNone(response.json().get("since"))
+
+    def test_sync_returns_only_changes_since_token(self):
+        with freeze_time("2023-01-01 12:00:00"):
+            TaskTestUtils.create_task(title="Unchanged", owner_id=self.user.id)
+            updated_task = TaskTestUtils.create_task(title="Updated", owner_id=self.user.id)
+            deleted_task = TaskTestUtils.create_task(title="Deleted", owner_id=self.user.id)
+        with freeze_time("2023-01-01 12:02:00"):
+            since = self.client.get(self.endpoint_url).json().get("since")
+
+        with freeze_time("2023-01-01 12:05:00"):
+            TaskTestUtils.update_task(task_id=updated_task.id, status="completed")
+            delete_task(task_uuid=deleted_task.uuid, owner_id=self.user.id)
+            created_task = TaskTestUtils.create_task(title="Created", owner_id=self.user.id)
+
+        with freeze_time("2023-01-01 12:05:01"):
+            response = self.client.get(f"{self.endpoint_url}?since={since}")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        changed_uuids = [task_data["uuid"] for task_data in response.json().get("changed")]
+        self.assertListEqual(changed_uuids, [str(updated_task.uuid), str(created_task.uuid)])
+        self.assertListEqual(response.json().get("deleted"), [str(deleted_task.uuid)])
+
+    @override_settings(TASKS_CHANGES_OVERLAP_SECONDS=60)
+    def test_since_token_overlaps_changes_that_commit_late(self):
+        with freeze_time("2023-01-01 12:00:00"):
+            TaskTestUtils.create_task(title="Old", owner_id=self.user.id)
+        with freeze_time("2023-01-01 12:10:00"):
+            since = self.client.get(self.endpoint_url).json().get("since")
+        # Stamped before the previous sync read the tasks, committed after it.
+        with freeze_time("2023-01-01 12:09:30"):
+            late_task = TaskTestUtils.create_task(title="Late", owner_id=self.user.id)
+
+        with freeze_time("2023-01-01 12:10:05"):
+            response = self.client.get(f"{self.endpoint_url}?since={since}")
+
+        self.assertListEqual([task_data["uuid"] for task_data in response.json().get("changed")], [str(late_task.uuid)])
+
+    @override_settings(TASKS_CHANGES_PAGE_SIZE=2)
+    def test_changes_are_paginated(self):
+        with freeze_time("2023-01-01 12:00:00"):
+            tasks = [TaskTestUtils.create_task(title=f"Task {index}", owner_id=self.user.id) for index in range(3)]
+            deleted_task = TaskTestUtils.create_task(title="Deleted", owner_id=self.user.id)
+        with freeze_time("2023-01-01 12:05:00"):
+            since = self.sync_every_page()
+        with freeze_time("2023-01-01 12:10:00"):
+            for task in tasks:
+                TaskTestUtils.update_task(task_id=task.id, status="completed")
+            delete_task(task_uuid=deleted_task.uuid, owner_id=self.user.id)
+
+        with freeze_time("2023-01-01 12:10:01"):
+            first_page = self.client.get(f"{self.endpoint_url}?since={since}").json()
+            second_page = self.client.get(f"{self.endpoint_url}?since={first_page['since']}").json()
+
+        self.assertListEqual(
+            [task_data["uuid"] for task_data in first_page["changed"]], [str(tasks[0].uuid), str(tasks[1].uuid)]
+        )
+        self.assertListEqual(first_page["deleted"], [])
+        self.assertTrue(first_page["has_more"])
+        self.assertListEqual([task_data["uuid"] for task_data in second_page["changed"]], [str(tasks[2].uuid)])
+        self.assertListEqual(second_page["deleted"], [str(deleted_task.uuid)])
+        self.assertFalse(second_page["has_more"])
+
+    @override_settings(TASKS_CHANGES_PAGE_SIZE=2)
+    def test_first_sync_is_paginated(self):
+        tasks = [TaskTestUtils.create_task(title=f"Task {index}", owner_id=self.user.id) for index in range(3)]
+
+        first_page = self.client.get(self.endpoint_url).json()
+        second_page = self.client.get(f"{self.endpoint_url}?since={first_page['since']}").json()
+
+        synced_uuids = [task_data["uuid"] for task_data in first_page["changed"] + second_page["changed"]]
+        self.assertEqual(len(first_page["changed"]), 2)
+        self.assertTrue(first_page["has_more"])
+        self.assertListEqual(sorted(synced_uuids), sorted(str(task.uuid) for task in tasks))
+        self.assertFalse(second_page["has_more"])
+
+    def test_sync_without_changes_gets_200(self):
+        with freeze_time("2023-01-01 12:00:00"):
+            TaskTestUtils.create_task(title="Unchanged", owner_id=self.user.id)
+        with freeze_time("2023-01-01 12:02:00"):
+            since = self.client.get(self.endpoint_url).json().get("since")
+
+        with freeze_time("2023-01-01 12:05:00"):
+            response = self.client.get(f"{self.endpoint_url}?since={since}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertListEqual(response.json().get("changed"), [])
+        self.assertListEqual(response.json().get("deleted"), [])
+
+    def test_conditional_sync_without_changes_gets_304(self):
+        with freeze_time("2023-01-01 12:00:00"):
+            TaskTestUtils.create_task(title="Unchanged", owner_id=self.user.id)
+            since = self.client.get(self.endpoint_url).json().get("since")
+
+        with freeze_time("2023-01-01 12:00:30"):
+            response = self.client.get(f"{self.endpoint_url}?since={since}")
+            not_modified_response = self.client.get(
+                f"{self.endpoint_url}?since={since}", HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+        self.assertEqual(not_modified_response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with freeze_time("2023-01-01 12:00:40"):
+            TaskTestUtils.create_task(title="Created", owner_id=self.user.id)
+            response = self.client.get(f"{self.endpoint_url}?since={since}", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_since_tokens_without_pagination_are_accepted(self):
+        with freeze_time("2023-01-01 12:00:00"):
+            since = base64.urlsafe_b64encode(timezone.now().isoformat().encode()).decode().rstrip("=")
+        with freeze_time("2023-01-01 12:05:00"):
+            task = TaskTestUtils.create_task(title="Created", owner_id=self.user.id)
+            response = self.client.get(f"{self.endpoint_url}?since={since}")
+
+        self.assertListEqual([task_data["uuid"] for task_data in response.json().get("changed")], [str(task.uuid)])
+
+    @override_settings(TASKS_TOMBSTONES_RETENTION_DAYS=1)
+    def test_expired_since_token_gets_410_error(self):
+        with freeze_time("2023-01-01 12:00:00"):
+            since = self.client.get(self.endpoint_url).json().get("since")
+
+        with freeze_time("2023-01-03 12:00:00"):
+            response = self.client.get(f"{self.endpoint_url}?since={since}")
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+
+class TasksSummaryTestCase(APITestCase):
+    endpoint_url = "/api/v1/tasks/summary/"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        cls.new_user = UserTestUtils.create_user(username="new_user")
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+
+    def test_view_url(self):
+        response = self.client.get(self.endpoint_url)
+        self.assertNotEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIs(response.resolver_match.func.view_class, TasksSummary)
+
+    def test_post_method_gets_405_error(self):
+        response = self.client.post(self.endpoint_url)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    def test_not_authenticated_user_gets_401_error(self):
+        self.client.force_authenticate(None)
+        response = self.client.get(self.endpoint_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_summary_counts_user_tasks_by_status(self):
+        task = create_task(owner_id=self.user.id, title="Task 1")
+        create_task(owner_id=self.user.id, title="Task 2", status="in_progress")
+        create_task(owner_id=self.new_user.id, title="Not counted")
+        self.client.post(f"/api/v1/tasks/update/{task.uuid}/", {"title": "Task 1", "status": "completed"})
+
+        response = self.client.get(self.endpoint_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(
+            response.json(), {"total": 2, "to_do": 0, "in_progress": 1, "completed": 1, "stand_by": 0}
+        )
+
+    def test_list_count_follows_the_summary(self):
+        for title in ["Task 1", "Task 2", "Task 3"]:
+            create_task(owner_id=self.user.id, title=title, status="stand_by")
+        delete_task(task_uuid=TaskTestUtils.get_first_task_for_user(owner_id=self.user.id).uuid, owner_id=self.user.id)
+
+        response = self.client.get("/api/v1/tasks/list/", {"status": "stand_by"})
+
+        self.assertEqual(response.json()["count"], 2)
+        self.assertEqual(len(response.json()["results"]), 2)
+        self.assertEqual(response.json()["count"], self.client.get(self.endpoint_url).json()["stand_by"])
+
+
+class ExportTasksTestCase(APITestCase):
+    endpoint_url = "/api/v1/tasks/export/"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        with freeze_time("2023-01-01 12:00:00"):
+            cls.task = TaskTestUtils.create_task(
+                title='Task, with "quotes"', description="Line\nbreak", status="completed", owner_id=cls.user.id
+            )
+        with freeze_time("2023-01-02 12:00:00"):
+            TaskTestUtils.create_task(title="Second Task", owner_id=cls.user.id)
+        TaskTestUtils.create_task(title="Other Task", owner_id=UserTestUtils.create_user(username="other").id)
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+
+    def get_content(self, response) -> str:
+        return b"".join(response.streaming_content).decode()
+
+    def get_exported_count(self) -> int:
+        return TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id)
+
+    def test_view_url(self):
+        response = self.client.get(self.endpoint_url)
+        self.assertIs(response.resolver_match.func.view_class, ExportTasks)
+
+    def test_not_authenticated_user_gets_401_error(self):
+        self.client.force_authenticate(None)
+        response = self.client.get(self.endpoint_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_exports_ndjson_by_default(self):
+        response = self.client.get(self.endpoint_url)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson; charset=utf-8")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="tasks.ndjson"')
+        tasks_data = [json.loads(line) for line in self.get_content(response).splitlines()]
+        self.assertEqual([task_data["title"] for task_data in tasks_data], ["Second Task", 'Task, with "quotes"'])
+        self.assertDictEqual(
+            tasks_data[1],
+            {
+                "uuid": str(self.task.uuid),
+                "title": 'Task, with "quotes"',
+                "description": "Line\nbreak",
+                "status": "completed",
+                "created": "01-01-2023 12:00:00",
+                "last_updated": "01-01-2023 12:00:00",
+                "due_at": None,
+                "run_at": None,
+                "scheduled_status": None,
+                "fired_at": None,
+                "recurrence": None,
+            },
+        )
+
+    def test_exports_csv(self):
+        response = self.client.get(self.endpoint_url, {"format": "csv"})
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(csv.reader(io.StringIO(self.get_content(response))))
+        self.assertListEqual(
+            rows[0],
+            [
+                "uuid",
+                "title",
+                "description",
+                "status",
+                "created",
+                "last_updated",
+                "due_at",
+                "run_at",
+                "scheduled_status",
+                "fired_at",
+                "recurrence",
+            ],
+        )
+        self.assertListEqual(rows[1][1:4], ["Second Task", "", "to_do"])
+        self.assertListEqual(rows[2][1:4], ['Task, with "quotes"', "Line\nbreak", "completed"])
+
+    def test_csv_is_negotiated_from_accept_header(self):
+        response = self.client.get(self.endpoint_url, HTTP_ACCEPT="text/csv")
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+
+    def test_applies_list_filters(self):
+        response = self.client.get(self.endpoint_url, {"status": "completed"})
+        self.assertEqual(len(self.get_content(response).splitlines()), 1)
+
+    def test_unknown_format_gets_404_error(self):
+        response = self.client.get(self.endpoint_url, {"format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(TASKS_EXPORT_CHUNK_SIZE=100)
+    def test_memory_does_not_grow_with_export_size(self):
+        def get_export_peak_memory(tasks_count):
+            TaskTestUtils.bulk_create_tasks(owner_id=self.user.id, count=tasks_count - self.get_exported_count())
+            tracemalloc.start()
+            try:
+                response = self.client.get(self.endpoint_url)
+                exported_lines = sum(chunk.count(b"\n") for chunk in response.streaming_content)
+                return exported_lines, tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small_export_lines, small_export_peak = get_export_peak_memory(500)
+        large_export_lines, large_export_peak = get_export_peak_memory(5000)
+
+        self.assertEqual((small_export_lines, large_export_lines), (500, 5000))
+        self.assertLess(large_export_peak, small_export_peak * 2)
+
+
+class ImportTasksTestCase(APITestCase):
+    endpoint_url = "/api/v1/tasks/import/"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+
+    def upload(self, name: str, content: str, **data):
+        return self.client.post(self.endpoint_url, {"file": SimpleUploadedFile(name, content.encode()), **data})
+
+    def test_view_url(self):
+        response = self.client.post(self.endpoint_url)
+        self.assertIs(response.resolver_match.func.view_class, ImportTasks)
+
+    def test_not_authenticated_user_gets_401_error(self):
+        self.client.force_authenticate(None)
+        response = self.upload("tasks.csv", "title\nTask\n")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_file_is_required(self):
+        response = self.client.post(self.endpoint_url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("file", response.data["error"])
+
+    def test_format_is_required_without_extension(self):
+        response = self.upload("tasks", "title\nTask\n")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("format", response.data["error"])
+
+    def test_imports_csv(self):
+        response = self.upload("tasks.csv", "title,status\nFirst,completed\nSecond,finished\n")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["imported"], 1)
+        self.assertEqual(response.data["failed"], 1)
+        self.assertEqual(response.data["errors"][0]["line"], 3)
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id, title="First"), 1)
+
+    def test_background_request_imports_the_file_in_a_job(self):
+        with tempfile.TemporaryDirectory() as files_dir, override_settings(JOBS_FILES_DIR=files_dir):
+            response = self.client.post(
+                f"{self.endpoint_url}?background=true",
+                {"file": SimpleUploadedFile("tasks.csv", b"title,status\nFirst,completed\nSecond,finished\n")},
+            )
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id), 0)
+
+            JobWorker().run_once()
+
+            job = Job.objects.get(uuid=response.json()["job_uuid"])
+            self.assertEqual(job.status, "succeeded")
+            self.assertEqual((job.result["imported"], job.result["failed"]), (1, 1))
+            self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id, title="First"), 1)
+            self.assertListEqual(list(Path(files_dir).rglob("*.*")), [])
+
+    def test_format_param_overrides_extension(self):
+        response = self.upload("tasks.txt", '{"title": "First"}\n', format="ndjson")
+        self.assertEqual(response.data["imported"], 1)
+
+    def test_exported_file_can_be_imported(self):
+        TaskTestUtils.create_task(title="Exported", description="Text", status="stand_by", owner_id=self.user.id)
+        exported = b"".join(self.client.get("/api/v1/tasks/export/", {"format": "csv"}).streaming_content)
+
+        response = self.upload("tasks.csv", exported.decode())
+
+        self.assertEqual(response.data["imported"], 1)
+        self.assertEqual(
+            TaskTestUtils.get_tasks_count_for_user(
+                owner_id=self.user.id, title="Exported", description="Text", status="stand_by"
+            ),
+            2,
+        )
+
 
 class CreateTaskTestCase(APITestCase):
     endpoint_url = "/api/v1/tasks/create/"
@@ -142,7 +748,7 @@ class CreateTaskTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_serializer_has_expected_fields(self):
-        expected_fields = ["title", "description", "status"]
+        expected_fields = ["title", "description", "status", "due_at", "run_at", "scheduled_status", "recurrence"]
         serializer_fields = list(CreateTask.CreateTaskSerializer().fields.keys())
         self.assertListEqual(expected_fields, serializer_fields)
 
@@ -298,7 +904,7 @@ class UpdateTaskTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_serializer_has_expected_fields(self):
-        expected_fields = ["title", "description", "status"]
+        expected_fields = ["title", "description", "status", "due_at", "run_at", "scheduled_status", "recurrence"]
         serializer_fields = list(UpdateTask.UpdateTaskSerializer().fields.keys())
         self.assertListEqual(expected_fields, serializer_fields)
 
@@ -376,3 +982,395 @@ class UpdateTaskTestCase(APITestCase):
         response = self.client.post(self.endpoint_url, data=task_data)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertIsNotNone(TaskTestUtils.get_first_task_for_user(uuid=self.UUID, owner_id=self.user.id, **task_data))
+
+
+class UpdateTaskOccurrenceTestCase(APITestCase):
+    UUID = "ea0ec33b-30e2-4601-9011-e35e1e2b5e0d"
+    endpoint_url = f"/api/v1/tasks/update/{UUID}/occurrence/"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test@example.com", password="test123")
+        TaskTestUtils.create_task(
+            uuid=cls.UUID,
+            title="Chore",
+            owner_id=cls.user.id,
+            due_at="2024-01-01T08:00:00Z",
+            recurrence="FREQ=WEEKLY;BYDAY=MO,TH",
+        )
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+
+    def test_view_url(self):
+        response = self.client.post(self.endpoint_url)
+        self.assertIs(response.resolver_match.func.view_class, UpdateTaskOccurrence)
+
+    def test_occurrence_at_is_required(self):
+        response = self.client.post(self.endpoint_url, data={"title": "Chore", "status": "completed"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("occurrence_at", response.json()["error"])
+
+    def test_completing_an_occurrence_saves_it(self):
+        task_data = {"title": "Chore", "status": "completed", "occurrence_at": "2024-01-04T08:00:00Z"}
+
+        response = self.client.post(self.endpoint_url, data=task_data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task_uuid = response.json()["task_uuid"]
+        list_response = self.client.get(
+            "/api/v1/tasks/list/",
+            {"due_after": "2024-01-01T00:00:00Z", "due_before": "2024-01-08T00:00:00Z", "pagination": "cursor"},
+        )
+        tasks_data = list_response.json()["results"]
+        self.assertEqual(list_response.json()["count"], 2)
+        self.assertListEqual([task_data["status"] for task_data in tasks_data], ["to_do", "completed"])
+        self.assertEqual(tasks_data[1]["uuid"], task_uuid)
+        self.assertEqual(tasks_data[0]["template_uuid"], self.UUID)
+        self.assertEqual(tasks_data[0]["occurrence_at"], "01-01-2024 08:00:00")
+
+    def test_date_that_is_not_an_occurrence_gets_400_error(self):
+        task_data = {"title": "Chore", "status": "completed", "occurrence_at": "2024-01-03T08:00:00Z"}
+
+        response = self.client.post(self.endpoint_url, data=task_data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertDictEqual(response.json(), {"error": "Task occurrence does not exist."})
+
+    def test_not_task_owner_gets_403_error(self):
+        self.client.force_authenticate(UserTestUtils.create_user(username="new_user"))
+        task_data = {"title": "Chore", "status": "completed", "occurrence_at": "2024-01-04T08:00:00Z"}
+
+        response = self.client.post(self.endpoint_url, data=task_data)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_invalid_recurrence_gets_400_error(self):
+        response = self.client.post(
+            "/api/v1/tasks/create/", data={"title": "Chore", "status": "to_do", "recurrence": "FREQ=HOURLY"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("recurrence", response.json()["error"])
+
+
+class BulkCreateTasksTestCase(APITestCase):
+    endpoint_url = "/api/v1/tasks/bulk/create/"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+
+    def test_view_url(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post(self.endpoint_url, data=[], format="json")
+        self.assertNotEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIs(response.resolver_match.func.view_class, BulkCreateTasks)
+
+    def test_get_method_gets_405_error(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(self.endpoint_url)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    def test_not_authenticated_user_gets_401_error(self):
+        response = self.client.post(self.endpoint_url, data=[], format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_body_must_be_a_list(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post(self.endpoint_url, data={"title": "Task"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertDictEqual(response.json(), {"error": {"non_field_errors": ["Expected a list of items."]}})
+
+    @override_settings(TASKS_BULK_MAX_ITEMS=1)
+    def test_body_cannot_exceed_max_items(self):
+        tasks_data = [{"title": "Task 1", "status": "to_do"}, {"title": "Task 2", "status": "to_do"}]
+
+        self.client.force_authenticate(self.user)
+        response = self.client.post(self.endpoint_url, data=tasks_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_atomic_request_with_invalid_item_gets_400_error(self):
+        tasks_data = [{"title": "Task 1", "status": "to_do"}, {"status": "to_do"}]
+
+        self.client.force_authenticate(self.user)
+        response = self.client.post(self.endpoint_url, data=tasks_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertDictEqual(
+            response.json(), {"error": [{"index": 1, "error": {"title": ["Este campo es requerido."]}}]}
+        )
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id), 0)
+
+    def test_partial_request_returns_per_item_results(self):
+        tasks_data = [
+            {"status": "to_do"},
+            {"title": "Task 2", "status": "finished"},
+            {"title": "Task 3", "status": "to_do"},
+        ]
+
+        self.client.force_authenticate(self.user)
+        response = self.client.post(f"{self.endpoint_url}?atomic=false", data=tasks_data, format="json")
+        results = response.json().get("results")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertListEqual([result["index"] for result in results], [0, 1, 2])
+        self.assertIn("title", results[0]["error"])
+        self.assertIn("status", results[1]["error"])
+        self.assertIsNotNone(TaskTestUtils.get_first_task_for_user(owner_id=self.user.id, uuid=results[2]["task_uuid"]))
+
+    def test_background_request_enqueues_a_job(self):
+        tasks_data = [{"status": "to_do"}, {"title": "Task 2", "status": "to_do", "due_at": "2024-02-01T10:00:00Z"}]
+        endpoint_url = f"{self.endpoint_url}?atomic=false&background=true"
+
+        self.client.force_authenticate(self.user)
+        response = self.client.post(endpoint_url, data=tasks_data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response["Location"], f"/api/v1/jobs/{response.json()['job_uuid']}/")
+        self.assertEqual(response.json()["status"], "queued")
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id), 0)
+
+        JobWorker().run_once()
+
+        job = Job.objects.get(uuid=response.json()["job_uuid"])
+        self.assertEqual((job.status, job.max_attempts), ("succeeded", 1))
+        self.assertListEqual([result["index"] for result in job.result["results"]], [0, 1])
+        self.assertIn("title", job.result["results"][0]["error"])
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id, due_at__isnull=False), 1)
+
+    def test_background_request_is_validated_before_enqueueing(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post(f"{self.endpoint_url}?background=true", data=[{"status": "to_do"}], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Job.objects.exists())
+
+    @patch("api.tasks.views.bulk_create_tasks")
+    def test_service_only_called_once(self, mock_service):
+        mock_service.return_value = []
+        tasks_data = [{"title": "Task 1", "description": "Description", "status": "to_do"}]
+
+        self.client.force_authenticate(self.user)
+        self.client.post(self.endpoint_url, data=tasks_data, format="json")
+        mock_service.assert_called_once_with(owner_id=self.user.id, tasks_data=tasks_data, atomic=True)
+
+
+class BulkUpdateTasksTestCase(APITestCase):
+    endpoint_url = "/api/v1/tasks/bulk/update/"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        cls.task = TaskTestUtils.create_task(title="Remove this title", owner_id=cls.user.id)
+
+    def test_view_url(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post(self.endpoint_url, data=[], format="json")
+        self.assertNotEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIs(response.resolver_match.func.view_class, BulkUpdateTasks)
+
+    def test_not_authenticated_user_gets_401_error(self):
+        response = self.client.post(self.endpoint_url, data=[], format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_uuid_is_required(self):
+        tasks_data = [{"title": "Test Update", "status": "to_do"}]
+
+        self.client.force_authenticate(self.user)
+        response = self.client.post(self.endpoint_url, data=tasks_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("uuid", response.json().get("error")[0]["error"])
+
+    def test_integration_with_service(self):
+        tasks_data = [{"uuid": str(self.task.uuid), "title": "Test Update", "status": "completed"}]
+
+        self.client.force_authenticate(self.user)
+        response = self.client.post(self.endpoint_url, data=tasks_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertListEqual(response.json().get("results"), [{"index": 0, "task_uuid": str(self.task.uuid)}])
+        self.assertIsNotNone(
+            TaskTestUtils.get_first_task_for_user(owner_id=self.user.id, title="Test Update", status="completed")
+        )
+
+    @override_settings(JOBS_MAX_ATTEMPTS=3)
+    def test_background_request_keeps_the_retries(self):
+        tasks_data = [{"uuid": str(self.task.uuid), "title": "Test Update", "status": "completed"}]
+
+        self.client.force_authenticate(self.user)
+        response = self.client.post(f"{self.endpoint_url}?background=true", data=tasks_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(Job.objects.get(uuid=response.json()["job_uuid"]).max_attempts, 3)
+
+    def test_background_request_resending_the_schedule_keeps_a_fired_task_fired(self):
+        run_at = timezone.now().replace(microsecond=0) - timedelta(hours=1)
+        task = TaskTestUtils.create_task(title="Fired", owner_id=self.user.id, run_at=run_at, fired_at=run_at)
+        tasks_data = [{"uuid": str(task.uuid), "title": "Renamed", "status": "to_do", "run_at": run_at.isoformat()}]
+
+        self.client.force_authenticate(self.user)
+        response = self.client.post(f"{self.endpoint_url}?background=true", data=tasks_data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        JobWorker().run_once()
+
+        self.assertEqual(Job.objects.get(uuid=response.json()["job_uuid"]).status, "succeeded")
+        task.refresh_from_db()
+        self.assertEqual((task.title, task.fired_at), ("Renamed", run_at))
+
+
+class BulkDeleteTasksTestCase(APITestCase):
+    endpoint_url = "/api/v1/tasks/bulk/delete/"
+    UUID = "ea0ec33b-30e2-4601-9011-e35e1e2b5e0d"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+
+    def test_view_url(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.delete(self.endpoint_url, data=[], format="json")
+        self.assertNotEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIs(response.resolver_match.func.view_class, BulkDeleteTasks)
+
+    def test_post_method_gets_405_error(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post(self.endpoint_url, data=[], format="json")
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    def test_not_authenticated_user_gets_401_error(self):
+        response = self.client.delete(self.endpoint_url, data=[], format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_invalid_uuid_gets_400_error(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.delete(self.endpoint_url, data=["not-a-uuid"], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json().get("error")[0]["index"], 0)
+
+    def test_integration_with_service(self):
+        TaskTestUtils.create_task(uuid=self.UUID, title="Test deletion", owner_id=self.user.id)
+
+        self.client.force_authenticate(self.user)
+        response = self.client.delete(self.endpoint_url, data=[self.UUID], format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertListEqual(response.json().get("results"), [{"index": 0, "task_uuid": self.UUID}])
+        self.assertIsNone(TaskTestUtils.get_first_task_for_user(owner_id=self.user.id))
+
+    def test_background_request_fails_the_job_when_an_atomic_delete_fails(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.delete(f"{self.endpoint_url}?background=1", data=[self.UUID], format="json")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        JobWorker().run_once()
+
+        job = Job.objects.get(uuid=response.json()["job_uuid"])
+        self.assertEqual((job.status, job.attempts, job.max_attempts), ("failed", 1, 1))
+        self.assertDictEqual(
+            job.result, {"error": [{"index": 0, "error": "Task matching query does not exist."}]}
+        )
+
+
+class TasksViewsQueryBudgetTestCase(APITestCase):
+    UUID = "ea0ec33b-30e2-4601-9011-e35e1e2b5e0d"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        with freeze_time("2023-01-15 12:00:00"):
+            cls.task = TaskTestUtils.create_task(title="Test Task", description="Test", owner_id=cls.user.id)
+        TaskTestUtils.set_task_count(owner_id=cls.user.id, status="completed", count=0)
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def test_list_tasks_with_each_filter(self):
+        list_filters = QueryBudgetTestUtils.LIST_FILTERS
+        counted_filters = {name: value for name, value in list_filters.items() if name != "status"}
+        for query_params in [*({name: value} for name, value in counted_filters.items()), list_filters]:
+            with self.subTest(query_params=query_params):
+                with QueryBudgetTestUtils.assert_queries(self, ["COUNT tasks_task", "SELECT tasks_task"]):
+                    response = self.client.get("/api/v1/tasks/list/", query_params)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_tasks_counted_from_task_counters(self):
+        for query_params in [{}, {"status": "to_do"}, {"status": "to_do", "page": 1}]:
+            with self.subTest(query_params=query_params):
+                with QueryBudgetTestUtils.assert_queries(self, ["SELECT tasks_taskcounter", "SELECT tasks_task"]):
+                    response = self.client.get("/api/v1/tasks/list/", query_params)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json()["count"], 1)
+
+    def test_list_tasks_in_a_due_window(self):
+        query_params = {"due_after": "2023-01-01T00:00:00Z", "due_before": "2023-02-01T00:00:00Z"}
+        # Recurring tasks, then the count of the tasks due in the window. An empty window has no page to read.
+        with QueryBudgetTestUtils.assert_queries(self, ["SELECT tasks_task", "COUNT tasks_task"]):
+            response = self.client.get("/api/v1/tasks/list/", query_params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        TaskTestUtils.create_task(title="Due", owner_id=self.user.id, due_at="2023-01-15T00:00:00Z")
+        expected_queries = ["SELECT tasks_task", "COUNT tasks_task", "SELECT tasks_task"]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            response = self.client.get("/api/v1/tasks/list/", query_params)
+        self.assertEqual(response.json()["count"], 1)
+
+    def test_tasks_summary(self):
+        with QueryBudgetTestUtils.assert_queries(self, ["SELECT tasks_taskcounter"]):
+            response = self.client.get("/api/v1/tasks/summary/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_tasks_with_cursor_pagination(self):
+        with QueryBudgetTestUtils.assert_queries(self, ["SELECT tasks_task"]):
+            response = self.client.get("/api/v1/tasks/list/", {"pagination": "cursor"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(TASKS_LIST_CACHE_TIMEOUT=60)
+    def test_cached_list_tasks(self):
+        self.client.get("/api/v1/tasks/list/")
+        with QueryBudgetTestUtils.assert_queries(self, []):
+            response = self.client.get("/api/v1/tasks/list/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_task_changes(self):
+        with QueryBudgetTestUtils.assert_queries(self, ["SELECT tasks_task"]):
+            response = self.client.get("/api/v1/tasks/changes/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_create_task(self):
+        expected_queries = [
+            "EXISTS auth_user",
+            "EXISTS tasks_task",
+            "INSERT tasks_task",
+            "UPDATE tasks_taskcounter",
+            "INSERT webhooks_outboxevent",
+        ]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            response = self.client.post("/api/v1/tasks/create/", {"title": "Test Task", "status": "to_do"})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_update_task(self):
+        expected_queries = [
+            "SELECT tasks_task",
+            "UPDATE tasks_task",
+            "UPDATE tasks_taskcounter",
+            "UPDATE tasks_taskcounter",
+            "INSERT webhooks_outboxevent",
+        ]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            response = self.client.post(
+                f"/api/v1/tasks/update/{self.task.uuid}/", {"title": "Test update", "status": "completed"}
+            )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_delete_task(self):
+        expected_queries = [
+            "SELECT tasks_task",
+            "DELETE tasks_task",
+            "INSERT tasks_deletedtask",
+            "UPDATE tasks_taskcounter",
+            "INSERT webhooks_outboxevent",
+        ]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            response = self.client.delete(f"/api/v1/tasks/delete/{self.task.uuid}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_delete_missing_task(self):
+        with QueryBudgetTestUtils.assert_queries(self, ["SELECT tasks_task", "EXISTS tasks_task"]):
+            response = self.client.delete(f"/api/v1/tasks/delete/{self.UUID}/")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
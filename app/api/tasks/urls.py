@@ -1,10 +1,44 @@
+from django.conf import settings
 from django.urls import path
 
-from .views import TasksList, CreateTask, DeleteTask, UpdateTask
+from .views import (
+    AsyncCreateTask,
+    AsyncDeleteTask,
+    AsyncTasksList,
+    AsyncUpdateTask,
+    TasksList,
+    TaskChanges,
+    TasksSummary,
+    ExportTasks,
+    ImportTasks,
+    CreateTask,
+    DeleteTask,
+    UpdateTask,
+    UpdateTaskOccurrence,
+    BulkCreateTasks,
+    BulkUpdateTasks,
+    BulkDeleteTasks,
+)
+
+TasksListView, CreateTaskView, UpdateTaskView, DeleteTaskView = (
+    (AsyncTasksList, AsyncCreateTask, AsyncUpdateTask, AsyncDeleteTask)
+    if settings.ASYNC_API_VIEWS
+    else (TasksList, CreateTask, UpdateTask, DeleteTask)
+)
 
 urlpatterns = [
-    path("list/", TasksList.as_view(), name="tasks_list"),
-    path("create/", CreateTask.as_view(), name="create_task"),
-    path("update/<uuid:task_uuid>/", UpdateTask.as_view(), name="update_task"),
-    path("delete/<uuid:task_uuid>/", DeleteTask.as_view(), name="delete_task"),
+    path("list/", TasksListView.as_view(), name="tasks_list"),
+    path("changes/", TaskChanges.as_view(), name="task_changes"),
+    path("summary/", TasksSummary.as_view(), name="tasks_summary"),
+    path("export/", ExportTasks.as_view(), name="export_tasks"),
+    path("import/", ImportTasks.as_view(), name="import_tasks"),
+    path("create/", CreateTaskView.as_view(), name="create_task"),
+    path("update/<uuid:task_uuid>/", UpdateTaskView.as_view(), name="update_task"),
+    path(
+        "update/<uuid:task_uuid>/occurrence/", UpdateTaskOccurrence.as_view(), name="update_task_occurrence"
+    ),
+    path("delete/<uuid:task_uuid>/", DeleteTaskView.as_view(), name="delete_task"),
+    path("bulk/create/", BulkCreateTasks.as_view(), name="bulk_create_tasks"),
+    path("bulk/update/", BulkUpdateTasks.as_view(), name="bulk_update_tasks"),
+    path("bulk/delete/", BulkDeleteTasks.as_view(), name="bulk_delete_tasks"),
 ]
@@ -1,21 +1,81 @@
+import base64
+import binascii
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+from api.views import AsyncAPIView
+from asgiref.sync import sync_to_async
+from backend.tasks.recurrence import validate_recurrence_rule
 from backend.tasks.services import (
+    BulkTasksError,
+    acreate_task,
+    adelete_task,
+    aget_tasks_count_for_user,
+    aupdate_task,
+    bulk_create_tasks,
+    bulk_delete_tasks,
+    bulk_update_tasks,
     create_task,
+    enqueue_bulk_tasks_job,
+    enqueue_import_tasks_job,
+    merge_bulk_results,
     delete_task,
+    get_task_summary_for_user,
+    get_tasks_count_for_user,
     update_task,
+    update_task_occurrence,
+    IMPORT_FORMATS,
+    get_import_format,
+    import_tasks,
+    iter_import_rows,
     list_tasks_for_user,
+    list_task_changes_for_user,
 )
-from django.core.exceptions import ObjectDoesNotExist
+from backend.tasks.services.list_cache import aget_tasks_list_generation, get_tasks_list_generation
+from backend.users.authentication import CachedTokenAuthentication
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.dateparse import parse_datetime
+from django.utils.http import parse_etags
 from rest_framework import serializers, status
-from rest_framework.authentication import TokenAuthentication
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .fast_serializers import ValuesListSerializer
+from .pagination import TasksCursorPagination, TasksPageNumberPagination
+from .renderers import TasksCSVRenderer, TasksJSONRenderer, TasksNDJSONRenderer
+
+
+def is_not_modified(request, etag: str) -> bool:
+    # If-None-Match uses the weak comparison, so W/ prefixes do not matter.
+    etags = parse_etags(request.headers.get("If-None-Match", ""))
+    return "*" in etags or etag in [request_etag.removeprefix("W/") for request_etag in etags]
+
+
+def is_background_request(request) -> bool:
+    return request.query_params.get("background", "false").lower() in ("true", "1")
+
+
+def get_job_accepted_response(job) -> Response:
+    response = Response({"job_uuid": str(job.uuid), "status": job.status}, status=status.HTTP_202_ACCEPTED)
+    response["Location"] = reverse("job_status", kwargs={"job_uuid": job.uuid})
+    return response
+
 
 class TasksList(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
+    renderer_classes = [TasksJSONRenderer, BrowsableAPIRenderer]
 
     class TasksListSerializer(serializers.Serializer):
         uuid = serializers.UUIDField()
@@ -23,22 +83,288 @@ class TasksList(APIView):
         created = serializers.DateTimeField()
         last_updated = serializers.DateTimeField()
         status = serializers.CharField()
+        due_at = serializers.DateTimeField()
+        run_at = serializers.DateTimeField()
+        recurrence = serializers.CharField()
+        template_uuid = serializers.UUIDField()
+        occurrence_at = serializers.DateTimeField()
+
+    tasks_list_serializer = ValuesListSerializer(TasksListSerializer, extra_fields=["id", "created"])
+
+    @classmethod
+    def serialize_tasks(cls, tasks_list, paginate=None) -> list:
+        fast_path = cls.tasks_list_serializer.can_serialize(tasks_list)
+        if fast_path:
+            tasks_list = cls.tasks_list_serializer.get_rows(tasks_list)
+        if paginate is not None:
+            tasks_list = paginate(tasks_list)
+        if fast_path:
+            return cls.tasks_list_serializer.to_representation(tasks_list)
+        return cls.TasksListSerializer(tasks_list, many=True).data
+
+    def is_cursor_mode(self, request) -> bool:
+        cursor_mode = request.GET.get("pagination") == "cursor"
+        return cursor_mode or TasksCursorPagination.cursor_query_param in request.GET
+
+    def get_paginator(self, request, tasks_list):
+        # Occurrence windows are built in memory and are always paginated by page number.
+        if self.is_cursor_mode(request) and isinstance(tasks_list, QuerySet):
+            return TasksCursorPagination()
+        return TasksPageNumberPagination(count=get_tasks_count_for_user(request.user.id, request.GET))
+
+    def _get_cache_digest(self, request, generation: int) -> str:
+        query_params = sorted((key, sorted(values)) for key, values in request.GET.lists())
+        cache_source = f"{request.user.id}:{generation}:{request.get_host()}{request.path}:{query_params}"
+        return hashlib.sha256(cache_source.encode()).hexdigest()
+
+    def _get_cache_key(self, request, digest: str) -> str:
+        return f"tasks:list:{request.user.id}:{digest}"
+
+    def _set_cache_headers(self, response, etag: str):
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+    def _list_tasks(self, request):
+        return list_tasks_for_user(
+            user_id=request.user.id,
+            query_params=request.GET,
+            fields=self.tasks_list_serializer.sources,
+            expand_occurrences=True,
+        )
+
+    def _get_tasks_list_data(self, request) -> dict:
+        tasks_list = self._list_tasks(request)
+        paginator = self.get_paginator(request, tasks_list)
+        tasks_list_data = self.serialize_tasks(
+            tasks_list, paginate=lambda tasks: paginator.paginate_queryset(tasks, request)
+        )
+        return paginator.get_paginated_response(tasks_list_data).data
+
+    def handle_exception(self, exc):
+        # Raised by the service for occurrence windows longer than TASKS_RECURRENCE_MAX_WINDOW_DAYS.
+        if isinstance(exc, ValidationError):
+            return Response(
+                {"error": exc.message_dict},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return super().handle_exception(exc)
+
+    def get(self, request):
+        if not settings.TASKS_LIST_CACHE_TIMEOUT:
+            return Response(self._get_tasks_list_data(request))
+
+        digest = self._get_cache_digest(request, generation=get_tasks_list_generation(request.user.id))
+        etag = f'"{digest}"'
+        if is_not_modified(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            cache_key = self._get_cache_key(request, digest)
+            tasks_list_data = cache.get(cache_key)
+            if tasks_list_data is None:
+                tasks_list_data = self._get_tasks_list_data(request)
+                cache.set(cache_key, tasks_list_data, timeout=settings.TASKS_LIST_CACHE_TIMEOUT)
+            response = Response(tasks_list_data)
+
+        return self._set_cache_headers(response, etag)
+
+
+class TaskChanges(APIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [TasksJSONRenderer, BrowsableAPIRenderer]
+
+    def _encode_since_token(self, since, started=None, after=None) -> str:
+        token = {"since": since.isoformat() if since else None}
+        if after:
+            token.update(started=started.isoformat(), after=[after[0].isoformat(), after[1]])
+        return base64.urlsafe_b64encode(json.dumps(token).encode("ascii")).decode("ascii").rstrip("=")
+
+    def _parse_token_datetime(self, value):
+        value = parse_datetime(value)
+        if value is None:
+            raise ValueError("Invalid datetime.")
+        return value
+
+    def _decode_since_token(self, token) -> dict:
+        since_token = {"since": None, "started": None, "after": None}
+        if not token:
+            return since_token
+        try:
+            decoded_token = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("ascii")
+            if not decoded_token.startswith("{"):
+                # Tokens issued before the changes were paginated only hold the since datetime.
+                return {**since_token, "since": self._parse_token_datetime(decoded_token)}
+            token = json.loads(decoded_token)
+            if token["since"] is not None:
+                since_token["since"] = self._parse_token_datetime(token["since"])
+            if "after" in token:
+                after_last_updated, after_id = token["after"]
+                if not isinstance(after_id, int):
+                    raise ValueError("Invalid id.")
+                since_token["started"] = self._parse_token_datetime(token["started"])
+                since_token["after"] = (self._parse_token_datetime(after_last_updated), after_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+            raise serializers.ValidationError({"since": ["Invalid since token."]})
+        return since_token
+
+    def _get_etag(self, changed_tasks_data: list, deleted_task_uuids: list) -> str:
+        changes = [(task_data["uuid"], task_data["last_updated"]) for task_data in changed_tasks_data]
+        digest = hashlib.sha256(json.dumps([changes, deleted_task_uuids], default=str).encode()).hexdigest()
+        return f'"{digest}"'
+
+    def get(self, request):
+        try:
+            since_token = self._decode_since_token(request.query_params.get("since"))
+        except serializers.ValidationError as e:
+            return Response(
+                {"error": e.detail},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        now = timezone.now()
+        since = since_token["since"]
+        if since and since < now - timedelta(days=settings.TASKS_TOMBSTONES_RETENTION_DAYS):
+            return Response(
+                {"error": "Since token has expired, a full sync is required."},
+                status=status.HTTP_410_GONE,
+            )
+
+        changed_tasks, deleted_tasks = list_task_changes_for_user(
+            user_id=request.user.id, since=since, after=since_token["after"]
+        )
+        page_size, page_rows = settings.TASKS_CHANGES_PAGE_SIZE, []
+
+        def paginate(rows):
+            page_rows.extend(rows[: page_size + 1])
+            return page_rows[:page_size]
+
+        changed_tasks_data = TasksList.serialize_tasks(changed_tasks, paginate=paginate)
+        started = since_token["started"] or now
+        has_more = len(page_rows) > page_size
+        if has_more:
+            # The rest of this round continues after the last task sent, tombstones come with its last page.
+            last_row = page_rows[page_size - 1]
+            deleted_task_uuids = []
+            next_since = self._encode_since_token(since, started, (last_row.last_updated, last_row.id))
+        else:
+            # Tasks stamped before the round started may commit after it was read, so the next round starts a bit
+            # earlier and resends what changed in that overlap. Clients deduplicate by uuid.
+            deleted_task_uuids = [str(task_uuid) for task_uuid in deleted_tasks.values_list("uuid", flat=True)]
+            next_since = self._encode_since_token(started - timedelta(seconds=settings.TASKS_CHANGES_OVERLAP_SECONDS))
+
+        etag = self._get_etag(changed_tasks_data, deleted_task_uuids)
+        if is_not_modified(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(
+                {
+                    "changed": changed_tasks_data,
+                    "deleted": deleted_task_uuids,
+                    "since": next_since,
+                    "has_more": has_more,
+                }
+            )
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+
+class TasksSummary(APIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response(get_task_summary_for_user(user_id=request.user.id))
+
+
+class ExportTasks(APIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [TasksNDJSONRenderer, TasksCSVRenderer]
+
+    class ExportTaskSerializer(serializers.Serializer):
+        uuid = serializers.UUIDField()
+        title = serializers.CharField()
+        description = serializers.CharField()
+        status = serializers.CharField()
+        created = serializers.DateTimeField()
+        last_updated = serializers.DateTimeField()
+        due_at = serializers.DateTimeField()
+        run_at = serializers.DateTimeField()
+        scheduled_status = serializers.CharField()
+        fired_at = serializers.DateTimeField()
+        recurrence = serializers.CharField()
+
+    export_serializer = ValuesListSerializer(ExportTaskSerializer)
 
     def get(self, request):
-        tasks_list = list_tasks_for_user(user_id=request.user.id, query_params=request.GET)
-        paginator = PageNumberPagination()
-        paginated_tasks_list = paginator.paginate_queryset(tasks_list, request)
-        return paginator.get_paginated_response(self.TasksListSerializer(paginated_tasks_list, many=True).data)
+        tasks = list_tasks_for_user(user_id=request.user.id, query_params=request.GET)
+        rows = self.export_serializer.get_rows(tasks).iterator(chunk_size=settings.TASKS_EXPORT_CHUNK_SIZE)
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            renderer.stream(
+                self.export_serializer.iter_representation(rows),
+                field_names=list(self.export_serializer.fields),
+                chunk_size=settings.TASKS_EXPORT_CHUNK_SIZE,
+            ),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        response["Content-Disposition"] = f'attachment; filename="tasks.{renderer.format}"'
+        return response
+
+
+class ImportTasks(APIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    class ImportTasksSerializer(serializers.Serializer):
+        file = serializers.FileField()
+        format = serializers.ChoiceField(choices=IMPORT_FORMATS, required=False)
+
+        def validate(self, data):
+            data["format"] = data.get("format") or get_import_format(data["file"].name)
+            if not data["format"]:
+                raise serializers.ValidationError({"format": ["Format is required for files without extension."]})
+            return data
+
+    def _validate_post_data(self, post_data) -> dict:
+        import_serializer = self.ImportTasksSerializer(data=post_data)
+        import_serializer.is_valid(raise_exception=True)
+        return import_serializer.validated_data
+
+    def post(self, request):
+        try:
+            validated_data = self._validate_post_data(post_data=request.data)
+            if is_background_request(request):
+                job = enqueue_import_tasks_job(
+                    owner_id=request.user.id, file=validated_data["file"], import_format=validated_data["format"]
+                )
+                return get_job_accepted_response(job)
+            import_result = import_tasks(
+                owner_id=request.user.id, rows=iter_import_rows(validated_data["file"], validated_data["format"])
+            )
+            return Response(import_result, status=status.HTTP_200_OK)
+
+        except serializers.ValidationError as e:
+            return Response(
+                {"error": e.detail},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
 
 class CreateTask(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     class CreateTaskSerializer(serializers.Serializer):
         title = serializers.CharField()
         description = serializers.CharField(required=False)
         status = serializers.CharField()
+        due_at = serializers.DateTimeField(required=False, allow_null=True)
+        run_at = serializers.DateTimeField(required=False, allow_null=True)
+        scheduled_status = serializers.CharField(required=False, allow_null=True)
+        recurrence = serializers.CharField(required=False, allow_null=True, validators=[validate_recurrence_rule])
 
     def _validate_post_data(self, post_data) -> dict:
         task_data_serializer = self.CreateTaskSerializer(data=post_data)
@@ -62,13 +388,17 @@ class CreateTask(APIView):
 
 
 class UpdateTask(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     class UpdateTaskSerializer(serializers.Serializer):
         title = serializers.CharField()
         description = serializers.CharField(required=False)
         status = serializers.CharField()
+        due_at = serializers.DateTimeField(required=False, allow_null=True)
+        run_at = serializers.DateTimeField(required=False, allow_null=True)
+        scheduled_status = serializers.CharField(required=False, allow_null=True)
+        recurrence = serializers.CharField(required=False, allow_null=True, validators=[validate_recurrence_rule])
 
     def _validate_post_data(self, post_data) -> dict:
         task_data_serializer = self.UpdateTaskSerializer(data=post_data)
@@ -102,8 +432,47 @@ class UpdateTask(APIView):
             )
 
 
+class UpdateTaskOccurrence(UpdateTask):
+    class UpdateTaskOccurrenceSerializer(UpdateTask.UpdateTaskSerializer):
+        occurrence_at = serializers.DateTimeField()
+
+    def _validate_post_data(self, post_data) -> dict:
+        task_data_serializer = self.UpdateTaskOccurrenceSerializer(data=post_data)
+        task_data_serializer.is_valid(raise_exception=True)
+        return task_data_serializer.validated_data
+
+    def post(self, request, task_uuid):
+        try:
+            validated_data = self._validate_post_data(post_data=request.POST)
+            occurrence_uuid = update_task_occurrence(
+                template_uuid=str(task_uuid), owner_id=request.user.id, **validated_data
+            )
+            return Response(
+                {"task_uuid": str(occurrence_uuid)},
+                status=status.HTTP_200_OK,
+            )
+
+        except ObjectDoesNotExist as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except PermissionError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        except serializers.ValidationError as e:
+            return Response(
+                {"error": e.detail},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
 class DeleteTask(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def delete(self, request, task_uuid):
@@ -124,3 +493,219 @@ class DeleteTask(APIView):
                 {"error": str(e)},
                 status=status.HTTP_403_FORBIDDEN,
             )
+
+
+class BulkTasksView(ABC, APIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    success_status = status.HTTP_200_OK
+    job_name = None
+
+    def _is_atomic(self, request) -> bool:
+        return request.query_params.get("atomic", "true").lower() not in ("false", "0")
+
+    @abstractmethod
+    def _validate_item(self, item):
+        pass
+
+    @abstractmethod
+    def _run_service(self, owner_id: int, items: list, atomic: bool) -> list[dict]:
+        pass
+
+    def _validate_items(self, items) -> tuple[list[tuple[int, object]], list[dict]]:
+        if not isinstance(items, list):
+            raise serializers.ValidationError({"non_field_errors": ["Expected a list of items."]})
+        if len(items) > settings.TASKS_BULK_MAX_ITEMS:
+            raise serializers.ValidationError(
+                {"non_field_errors": [f"Ensure this list has no more than {settings.TASKS_BULK_MAX_ITEMS} items."]}
+            )
+
+        valid_items, errors = [], []
+        for index, item in enumerate(items):
+            try:
+                valid_items.append((index, self._validate_item(item)))
+            except serializers.ValidationError as e:
+                errors.append({"index": index, "error": e.detail})
+        return valid_items, errors
+
+    def _process(self, request):
+        try:
+            atomic = self._is_atomic(request)
+            valid_items, errors = self._validate_items(request.data)
+            if atomic and errors:
+                raise BulkTasksError(errors)
+
+            items, indexes = [item for _, item in valid_items], [index for index, _ in valid_items]
+            if is_background_request(request):
+                job = enqueue_bulk_tasks_job(
+                    self.job_name, owner_id=request.user.id, items=items, atomic=atomic, indexes=indexes, errors=errors
+                )
+                return get_job_accepted_response(job)
+
+            results = self._run_service(owner_id=request.user.id, items=items, atomic=atomic)
+            return Response(
+                {"results": merge_bulk_results(results, indexes, errors)},
+                status=self.success_status,
+            )
+
+        except serializers.ValidationError as e:
+            return Response(
+                {"error": e.detail},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except BulkTasksError as e:
+            return Response(
+                {"error": e.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
+class BulkCreateTasks(BulkTasksView):
+    success_status = status.HTTP_201_CREATED
+    job_name = "tasks.bulk_create"
+
+    def _validate_item(self, item) -> dict:
+        task_data_serializer = CreateTask.CreateTaskSerializer(data=item)
+        task_data_serializer.is_valid(raise_exception=True)
+        return task_data_serializer.validated_data
+
+    def _run_service(self, owner_id: int, items: list, atomic: bool) -> list[dict]:
+        return bulk_create_tasks(owner_id=owner_id, tasks_data=items, atomic=atomic)
+
+    def post(self, request):
+        return self._process(request)
+
+
+class BulkUpdateTasks(BulkTasksView):
+    job_name = "tasks.bulk_update"
+
+    class BulkUpdateTaskSerializer(UpdateTask.UpdateTaskSerializer):
+        uuid = serializers.UUIDField()
+
+    def _validate_item(self, item) -> dict:
+        task_data_serializer = self.BulkUpdateTaskSerializer(data=item)
+        task_data_serializer.is_valid(raise_exception=True)
+        return task_data_serializer.validated_data
+
+    def _run_service(self, owner_id: int, items: list, atomic: bool) -> list[dict]:
+        return bulk_update_tasks(owner_id=owner_id, tasks_data=items, atomic=atomic)
+
+    def post(self, request):
+        return self._process(request)
+
+
+class BulkDeleteTasks(BulkTasksView):
+    job_name = "tasks.bulk_delete"
+
+    def _validate_item(self, item) -> str:
+        return str(serializers.UUIDField().run_validation(item))
+
+    def _run_service(self, owner_id: int, items: list, atomic: bool) -> list[dict]:
+        return bulk_delete_tasks(owner_id=owner_id, task_uuids=items, atomic=atomic)
+
+    def delete(self, request):
+        return self._process(request)
+
+
+class AsyncTasksList(AsyncAPIView, TasksList):
+    async def aget_paginator(self, request, tasks_list):
+        if self.is_cursor_mode(request) and isinstance(tasks_list, QuerySet):
+            return TasksCursorPagination()
+        return TasksPageNumberPagination(count=await aget_tasks_count_for_user(request.user.id, request.GET))
+
+    async def _aget_tasks_list_data(self, request) -> dict:
+        tasks_list = self._list_tasks(request)
+        paginator = await self.aget_paginator(request, tasks_list)
+        if self.tasks_list_serializer.can_serialize(tasks_list):
+            rows = await paginator.apaginate_queryset(self.tasks_list_serializer.get_rows(tasks_list), request)
+            tasks_list_data = self.tasks_list_serializer.to_representation(rows)
+        else:
+            tasks_list_data = await sync_to_async(self.serialize_tasks)(
+                tasks_list, paginate=lambda tasks: paginator.paginate_queryset(tasks, request)
+            )
+        return paginator.get_paginated_response(tasks_list_data).data
+
+    async def get(self, request):
+        if not settings.TASKS_LIST_CACHE_TIMEOUT:
+            return Response(await self._aget_tasks_list_data(request))
+
+        digest = self._get_cache_digest(request, generation=await aget_tasks_list_generation(request.user.id))
+        etag = f'"{digest}"'
+        if is_not_modified(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            cache_key = self._get_cache_key(request, digest)
+            tasks_list_data = await cache.aget(cache_key)
+            if tasks_list_data is None:
+                tasks_list_data = await self._aget_tasks_list_data(request)
+                await cache.aset(cache_key, tasks_list_data, timeout=settings.TASKS_LIST_CACHE_TIMEOUT)
+            response = Response(tasks_list_data)
+
+        return self._set_cache_headers(response, etag)
+
+
+class AsyncCreateTask(AsyncAPIView, CreateTask):
+    async def post(self, request):
+        try:
+            validated_data = self._validate_post_data(post_data=request.POST)
+            task = await acreate_task(owner_id=request.user.id, **validated_data)
+            return Response(
+                {"task_uuid": str(task.uuid)},
+                status=status.HTTP_201_CREATED,
+            )
+
+        except serializers.ValidationError as e:
+            return Response(
+                {"error": e.detail},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
+class AsyncUpdateTask(AsyncAPIView, UpdateTask):
+    async def post(self, request, task_uuid):
+        try:
+            validated_data = self._validate_post_data(post_data=request.POST)
+            await aupdate_task(task_uuid=str(task_uuid), owner_id=request.user.id, **validated_data)
+            return Response(
+                status=status.HTTP_204_NO_CONTENT,
+            )
+
+        except ObjectDoesNotExist as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except PermissionError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        except serializers.ValidationError as e:
+            return Response(
+                {"error": e.detail},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
+class AsyncDeleteTask(AsyncAPIView, DeleteTask):
+    async def delete(self, request, task_uuid):
+        try:
+            await adelete_task(task_uuid=str(task_uuid), owner_id=request.user.id)
+            return Response(
+                status=status.HTTP_204_NO_CONTENT,
+            )
+
+        except ObjectDoesNotExist as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        except PermissionError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_403_FORBIDDEN,
+            )
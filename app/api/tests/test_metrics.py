@@ -0,0 +1,100 @@
+from asgiref.sync import async_to_sync, sync_to_async
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api.metrics import get_request_metrics, get_views_stats, render_prometheus_metrics
+from api.middleware import ApiMetricsMiddleware
+from backend.tasks.models import Task
+from backend.tasks.tests.utils import TaskTestUtils
+from backend.users.authentication import get_token_cache
+from backend.users.tests.utils import AuthTokenTestUtils, UserTestUtils
+
+
+@override_settings(API_METRICS_ENABLED=True)
+class ApiMetricsMiddlewareTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        TaskTestUtils.create_task(title="Test Task", owner_id=cls.user.id)
+
+    def get_view_stats(self, view: str) -> dict:
+        return get_views_stats().get(view, {"requests": 0, "queries": 0, "response_bytes": 0})
+
+    def test_records_view_metrics(self):
+        self.client.force_authenticate(self.user)
+        view_stats = self.get_view_stats("TasksList")
+
+        response = self.client.get("/api/v1/tasks/list/")
+
+        new_view_stats = self.get_view_stats("TasksList")
+        self.assertEqual(new_view_stats["requests"], view_stats["requests"] + 1)
+        self.assertEqual(new_view_stats["queries"], view_stats["queries"] + 2)
+        self.assertEqual(new_view_stats["response_bytes"], view_stats["response_bytes"] + len(response.content))
+
+    def test_adds_server_timing_header(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get("/api/v1/tasks/list/")
+        self.assertRegex(response["Server-Timing"], r'db;desc="2 queries";dur=[\d.]+, serialize;dur=[\d.]+, total;dur=')
+
+    def test_non_api_views_are_not_recorded(self):
+        views_stats = get_views_stats()
+        self.client.get("/metrics")
+        self.assertEqual(get_views_stats(), views_stats)
+
+    def test_metrics_endpoint_renders_prometheus_format(self):
+        self.client.post("/api/v1/auth/token/", {"username": "test_user", "password": "wrong"})
+
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        self.assertIn('api_requests_total{view="AuthTokenView"}', response.content.decode())
+        self.assertIn("# TYPE api_db_queries_total counter", response.content.decode())
+        self.assertIn("db_connections_total", response.content.decode())
+
+    def test_metrics_endpoint_exports_the_token_cache_counters(self):
+        token = AuthTokenTestUtils.create_auth_token_for_user(user_id=self.user.id)
+        token_cache_stats = get_token_cache().stats()
+
+        for _ in range(2):
+            self.client.get("/api/v1/tasks/list/", HTTP_AUTHORIZATION=f"Token {token.key}")
+        response = self.client.get("/metrics")
+
+        self.assertIn("# TYPE token_cache_hits_total counter", response.content.decode())
+        self.assertIn(
+            f'token_cache_hits_total{{backend="django"}} {token_cache_stats["hits"] + 1}', response.content.decode()
+        )
+        self.assertIn(
+            f'token_cache_misses_total{{backend="django"}} {token_cache_stats["misses"] + 1}', response.content.decode()
+        )
+
+    def test_async_requests_record_queries_run_in_threads(self):
+        async def get_response(request):
+            get_request_metrics().view = "AsyncView"
+            await sync_to_async(Task.objects.count)()
+            return HttpResponse("async")
+
+        view_stats = self.get_view_stats("AsyncView")
+
+        async_to_sync(ApiMetricsMiddleware(get_response))(RequestFactory().get("/"))
+
+        self.assertEqual(self.get_view_stats("AsyncView")["queries"], view_stats["queries"] + 1)
+
+
+class ApiMetricsDisabledTestCase(TestCase):
+    @override_settings(API_METRICS_ENABLED=False)
+    def test_middleware_is_not_used(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            ApiMetricsMiddleware(lambda request: HttpResponse())
+
+    @override_settings(API_METRICS_ENABLED=False)
+    def test_metrics_endpoint_not_found(self):
+        self.assertEqual(self.client.get("/metrics").status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn("Server-Timing", self.client.get("/api/v1/tasks/list/"))
+
+    def test_prometheus_output_ends_with_newline(self):
+        self.assertTrue(render_prometheus_metrics().endswith("\n"))
@@ -4,4 +4,5 @@ from django.urls import path
 urlpatterns = [
     path("auth/", include("api.auth.urls")),
     path("tasks/", include("api.tasks.urls")),
+    path("jobs/", include("api.jobs.urls")),
 ]
@@ -0,0 +1,40 @@
+import threading
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Optional
+
+_request_connection_timings: ContextVar[Optional[list]] = ContextVar("request_connection_timings", default=None)
+_stats_lock = threading.Lock()
+_connection_stats = {"connections": 0, "setup_seconds": 0.0}
+
+
+def record_connection_setup(seconds: float) -> None:
+    with _stats_lock:
+        _connection_stats["connections"] += 1
+        _connection_stats["setup_seconds"] += seconds
+    request_timings = _request_connection_timings.get()
+    if request_timings is not None:
+        request_timings.append(seconds)
+
+
+def get_connection_stats() -> dict:
+    with _stats_lock:
+        return dict(_connection_stats)
+
+
+def start_request_tracking():
+    return _request_connection_timings.set([])
+
+
+def stop_request_tracking(token) -> list[float]:
+    request_timings = _request_connection_timings.get()
+    _request_connection_timings.reset(token)
+    return request_timings or []
+
+
+class ConnectionSetupTimingMixin:
+    def get_new_connection(self, conn_params):
+        start = perf_counter()
+        connection = super().get_new_connection(conn_params)
+        record_connection_setup(perf_counter() - start)
+        return connection
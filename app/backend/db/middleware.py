@@ -0,0 +1,39 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from .metrics import start_request_tracking, stop_request_tracking
+
+
+class ConnectionSetupTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = start_request_tracking()
+        try:
+            response = self.get_response(request)
+        finally:
+            connection_timings = stop_request_tracking(token)
+        return self.add_server_timing(response, connection_timings)
+
+    async def __acall__(self, request):
+        token = start_request_tracking()
+        try:
+            response = await self.get_response(request)
+        finally:
+            connection_timings = stop_request_tracking(token)
+        return self.add_server_timing(response, connection_timings)
+
+    def add_server_timing(self, response, connection_timings: list[float]):
+        if connection_timings:
+            connection_timing = f"db-connect;dur={sum(connection_timings) * 1000:.2f}"
+            server_timing = response.get("Server-Timing")
+            response["Server-Timing"] = f"{server_timing}, {connection_timing}" if server_timing else connection_timing
+        return response
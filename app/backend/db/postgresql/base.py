@@ -0,0 +1,7 @@
+from django.db.backends.postgresql import base
+
+from backend.db.metrics import ConnectionSetupTimingMixin
+
+
+class DatabaseWrapper(ConnectionSetupTimingMixin, base.DatabaseWrapper):
+    pass
@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+
+def _recent_write_key(owner_id: int) -> str:
+    return f"db:recent_write:{owner_id}"
+
+
+def get_read_database(owner_id: int) -> str:
+    if not settings.READ_REPLICA_DATABASE or cache.get(_recent_write_key(owner_id)):
+        return DEFAULT_DB_ALIAS
+    return settings.READ_REPLICA_DATABASE
+
+
+def mark_recent_write(owner_id: int) -> None:
+    if not settings.READ_REPLICA_DATABASE:
+        return
+    transaction.on_commit(
+        lambda: cache.set(_recent_write_key(owner_id), True, timeout=settings.READ_REPLICA_STICKINESS_SECONDS)
+    )
+
+
+async def amark_recent_write(owner_id: int) -> None:
+    if not settings.READ_REPLICA_DATABASE:
+        return
+    await cache.aset(_recent_write_key(owner_id), True, timeout=settings.READ_REPLICA_STICKINESS_SECONDS)
+
+
+class PrimaryReplicaRouter:
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, settings.READ_REPLICA_DATABASE}
+        return obj1._state.db in databases and obj2._state.db in databases
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,79 @@
+from asgiref.sync import async_to_sync
+
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from backend.db.metrics import (
+    ConnectionSetupTimingMixin,
+    get_connection_stats,
+    record_connection_setup,
+    start_request_tracking,
+    stop_request_tracking,
+)
+from backend.db.middleware import ConnectionSetupTimingMiddleware
+from backend.db.postgresql.base import DatabaseWrapper
+
+
+class TimedSQLiteDatabaseWrapper(ConnectionSetupTimingMixin, SQLiteDatabaseWrapper):
+    pass
+
+
+class ConnectionSetupTimingTestCase(SimpleTestCase):
+    def test_postgresql_backend_times_new_connections(self):
+        self.assertTrue(issubclass(DatabaseWrapper, ConnectionSetupTimingMixin))
+
+    def test_new_connection_is_recorded(self):
+        timed_connection = TimedSQLiteDatabaseWrapper({**connection.settings_dict, "NAME": ":memory:"}, alias="timed")
+        connections_count = get_connection_stats()["connections"]
+
+        token = start_request_tracking()
+        try:
+            timed_connection.connect()
+        finally:
+            request_timings = stop_request_tracking(token)
+            timed_connection.close()
+
+        self.assertEqual(get_connection_stats()["connections"], connections_count + 1)
+        self.assertEqual(len(request_timings), 1)
+
+    def test_connections_outside_requests_are_not_tracked(self):
+        record_connection_setup(0.001)
+        token = start_request_tracking()
+        self.assertListEqual(stop_request_tracking(token), [])
+
+
+class ConnectionSetupTimingMiddlewareTestCase(SimpleTestCase):
+    def setUp(self) -> None:
+        self.request = RequestFactory().get("/")
+
+    def test_adds_server_timing_for_new_connections(self):
+        def get_response(request):
+            record_connection_setup(0.0015)
+            return HttpResponse()
+
+        response = ConnectionSetupTimingMiddleware(get_response)(self.request)
+        self.assertEqual(response["Server-Timing"], "db-connect;dur=1.50")
+
+    def test_reused_connections_do_not_add_server_timing(self):
+        response = ConnectionSetupTimingMiddleware(lambda request: HttpResponse())(self.request)
+        self.assertNotIn("Server-Timing", response)
+
+    def test_appends_to_existing_server_timing(self):
+        def get_response(request):
+            record_connection_setup(0.002)
+            response = HttpResponse()
+            response["Server-Timing"] = "app;dur=10"
+            return response
+
+        response = ConnectionSetupTimingMiddleware(get_response)(self.request)
+        self.assertEqual(response["Server-Timing"], "app;dur=10, db-connect;dur=2.00")
+
+    def test_async_requests_are_tracked(self):
+        async def get_response(request):
+            record_connection_setup(0.001)
+            return HttpResponse()
+
+        response = async_to_sync(ConnectionSetupTimingMiddleware(get_response))(self.request)
+        self.assertEqual(response["Server-Timing"], "db-connect;dur=1.00")
@@ -0,0 +1,61 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from backend.db.routers import PrimaryReplicaRouter, get_read_database
+from backend.tasks.models import Task
+from backend.tasks.services import create_task, list_task_changes_for_user, list_tasks_for_user
+from backend.users.tests.utils import UserTestUtils
+
+
+@override_settings(READ_REPLICA_DATABASE="replica", READ_REPLICA_STICKINESS_SECONDS=5)
+class ReadReplicaRoutingTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_read_only_queries_use_replica(self):
+        self.assertEqual(list_tasks_for_user(user_id=self.user.id).db, "replica")
+
+    def test_task_changes_use_primary(self):
+        changed_tasks, deleted_tasks = list_task_changes_for_user(user_id=self.user.id, since=timezone.now())
+        self.assertEqual(changed_tasks.db, "default")
+        self.assertEqual(deleted_tasks.db, "default")
+
+    def test_reads_after_write_use_primary(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            create_task(owner_id=self.user.id, title="Test Task")
+
+        self.assertEqual(list_tasks_for_user(user_id=self.user.id).db, "default")
+
+    def test_stickiness_is_per_owner(self):
+        other_user = UserTestUtils.create_user(username="other_user")
+        with self.captureOnCommitCallbacks(execute=True):
+            create_task(owner_id=self.user.id, title="Test Task")
+
+        self.assertEqual(get_read_database(other_user.id), "replica")
+
+    def test_write_is_not_sticky_until_commit(self):
+        with self.captureOnCommitCallbacks(execute=False):
+            create_task(owner_id=self.user.id, title="Test Task")
+            self.assertEqual(get_read_database(self.user.id), "replica")
+
+
+class NoReadReplicaRoutingTestCase(TestCase):
+    @override_settings(READ_REPLICA_DATABASE=None)
+    def test_reads_use_primary_without_replica(self):
+        self.assertEqual(get_read_database(owner_id=1), "default")
+
+
+class PrimaryReplicaRouterTestCase(TestCase):
+    router = PrimaryReplicaRouter()
+
+    def test_writes_use_primary(self):
+        self.assertEqual(self.router.db_for_write(Task), "default")
+
+    def test_migrations_only_run_on_primary(self):
+        self.assertTrue(self.router.allow_migrate("default", "tasks"))
+        self.assertFalse(self.router.allow_migrate("replica", "tasks"))
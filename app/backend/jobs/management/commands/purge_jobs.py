@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from backend.jobs.services import purge_finished_jobs
+
+
+class Command(BaseCommand):
+    help = "Removes finished background jobs older than the retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.JOBS_RETENTION_DAYS,
+            help="Jobs finished more than this number of days ago are removed.",
+        )
+
+    def handle(self, *args, **options):
+        purged_jobs = purge_finished_jobs(before=timezone.now() - timedelta(days=options["days"]))
+        self.stdout.write(f"Purged {purged_jobs} finished jobs.")
@@ -0,0 +1,67 @@
+import multiprocessing
+import signal
+import threading
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from backend.jobs.services import JobWorker
+
+
+def run_worker_process(batch_size, lease, poll_interval) -> None:
+    worker = JobWorker(batch_size=batch_size, lease=lease, poll_interval=poll_interval)
+    signal.signal(signal.SIGTERM, lambda signum, frame: worker.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: worker.stop())
+    worker.run()
+
+
+class Command(BaseCommand):
+    help = "Runs the background jobs in worker processes. Several commands can run side by side."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=1, help="Worker processes, each running a job at a time.")
+        parser.add_argument("--batch-size", type=int, help="Jobs claimed by a worker at once.")
+        parser.add_argument("--lease", type=float, help="Seconds a claim lasts if its worker stops extending it.")
+        parser.add_argument("--poll-interval", type=float, help="Seconds a worker waits when there are no jobs.")
+        parser.add_argument("--once", action="store_true", help="Run a batch of queued jobs in this process and exit.")
+
+    def handle(self, *args, **options):
+        if options["processes"] < 1:
+            raise CommandError("Processes must be a positive number.")
+        worker_options = {name: options[name] for name in ["batch_size", "lease", "poll_interval"]}
+
+        if options["once"]:
+            worker = JobWorker(**worker_options)
+            worker.run_once()
+            status_counts = worker.status_counts
+            self.stdout.write(
+                f"Ran {sum(status_counts.values())} jobs: {status_counts['succeeded']} succeeded, "
+                f"{status_counts['failed']} failed, {status_counts['queued']} retried."
+            )
+            return
+
+        # Children must not share the parent's database connections.
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        stopping = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: stopping.set())
+        signal.signal(signal.SIGINT, lambda signum, frame: stopping.set())
+
+        def start_process():
+            process = context.Process(target=run_worker_process, kwargs=worker_options, daemon=True)
+            process.start()
+            return process
+
+        processes = [start_process() for _ in range(options["processes"])]
+        self.stdout.write(f"Started {len(processes)} workers.")
+        while not stopping.wait(1):
+            for index, process in enumerate(processes):
+                if not process.is_alive():
+                    self.stderr.write(f"Worker {process.pid} exited with code {process.exitcode}, restarting it.")
+                    processes[index] = start_process()
+
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+        self.stdout.write(f"Stopped {len(processes)} workers.")
@@ -0,0 +1,32 @@
+from typing import Callable, NamedTuple, Optional
+
+
+class RegisteredJob(NamedTuple):
+    function: Callable[..., object]
+    max_attempts: Optional[int]
+
+
+JOBS: dict[str, RegisteredJob] = {}
+
+
+class PermanentJobError(Exception):
+    # Fails the job without retrying it, keeping result as the job result.
+    def __init__(self, message: str, result: object = None):
+        super().__init__(message)
+        self.result = result
+
+
+def register_job(name: str, max_attempts: Optional[int] = None):
+    # Jobs are called with owner_id and their payload as keyword arguments. They run again after a failure or a lost
+    # worker, so jobs that are not safe to repeat are registered with max_attempts=1.
+    def decorator(function: Callable[..., object]) -> Callable[..., object]:
+        JOBS[name] = RegisteredJob(function, max_attempts)
+        return function
+
+    return decorator
+
+
+def get_registered_job(name: str) -> RegisteredJob:
+    if name not in JOBS:
+        raise ValueError(f"Job {name!r} is not registered.")
+    return JOBS[name]
@@ -0,0 +1,23 @@
+from .job_services import (
+    claim_jobs,
+    enqueue_job,
+    extend_claimed_jobs,
+    get_job_for_owner,
+    get_retry_delay,
+    purge_finished_jobs,
+    release_claimed_jobs,
+    run_job,
+)
+from .worker_services import JobWorker
+
+__all__ = [
+    "claim_jobs",
+    "enqueue_job",
+    "extend_claimed_jobs",
+    "get_job_for_owner",
+    "get_retry_delay",
+    "purge_finished_jobs",
+    "release_claimed_jobs",
+    "run_job",
+    "JobWorker",
+]
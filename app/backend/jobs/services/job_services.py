@@ -0,0 +1,140 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from backend.jobs.models import Job
+from backend.jobs.registry import PermanentJobError, get_registered_job
+
+logger = logging.getLogger(__name__)
+
+LEASE_EXPIRED_ERROR = "Lease expired while the job was running."
+
+
+def enqueue_job(
+    name: str,
+    owner_id: Optional[int] = None,
+    payload: Optional[dict] = None,
+    run_after: Optional[datetime] = None,
+    max_attempts: Optional[int] = None,
+) -> Job:
+    registered_job = get_registered_job(name)
+    return Job.objects.create(
+        name=name,
+        owner_id=owner_id,
+        payload=payload or {},
+        run_after=run_after or timezone.now(),
+        max_attempts=max_attempts or registered_job.max_attempts or settings.JOBS_MAX_ATTEMPTS,
+    )
+
+
+def get_job_for_owner(job_uuid: str, owner_id: int) -> Job:
+    try:
+        return Job.objects.get(uuid=job_uuid, owner_id=owner_id)
+    except Job.DoesNotExist:
+        if Job.objects.filter(uuid=job_uuid).exists():
+            raise PermissionError("User is not job owner.")
+        raise Job.DoesNotExist("Job matching query does not exist.")
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    delay = settings.JOBS_RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1)
+    return timedelta(seconds=min(delay, settings.JOBS_RETRY_MAX_BACKOFF_SECONDS))
+
+
+def claim_jobs(claim_token: UUID, lease: timedelta, limit: int) -> list[Job]:
+    # Jobs whose worker died are taken over when their lease expires, or failed if they have no attempts left.
+    now = timezone.now()
+    with transaction.atomic():
+        Job.objects.filter(
+            status=Job.StatusChoices.RUNNING, claimed_until__lt=now, attempts__gte=F("max_attempts")
+        ).update(
+            status=Job.StatusChoices.FAILED,
+            finished_at=now,
+            last_error=LEASE_EXPIRED_ERROR,
+            claim_token=None,
+            claimed_until=None,
+        )
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=Job.StatusChoices.QUEUED, run_after__lte=now)
+                | Q(status=Job.StatusChoices.RUNNING, claimed_until__lt=now)
+            )
+            .order_by("run_after", "id")[:limit]
+        )
+        if jobs:
+            Job.objects.filter(id__in=[job.id for job in jobs]).update(
+                status=Job.StatusChoices.RUNNING,
+                attempts=F("attempts") + 1,
+                started_at=now,
+                claim_token=claim_token,
+                claimed_until=now + lease,
+            )
+    for job in jobs:
+        job.status, job.attempts, job.started_at = Job.StatusChoices.RUNNING, job.attempts + 1, now
+        job.claim_token, job.claimed_until = claim_token, now + lease
+    return jobs
+
+
+def extend_claimed_jobs(claim_token: UUID, lease: timedelta) -> int:
+    return Job.objects.filter(claim_token=claim_token, status=Job.StatusChoices.RUNNING).update(
+        claimed_until=timezone.now() + lease
+    )
+
+
+def release_claimed_jobs(claim_token: UUID) -> int:
+    return Job.objects.filter(claim_token=claim_token, status=Job.StatusChoices.RUNNING).update(
+        status=Job.StatusChoices.QUEUED, attempts=F("attempts") - 1, claim_token=None, claimed_until=None
+    )
+
+
+def _finish_job(job: Job, **fields) -> Job:
+    # Only the worker holding the claim records the outcome, a worker that lost its lease leaves it to the new one.
+    fields = {**fields, "claim_token": None, "claimed_until": None}
+    Job.objects.filter(id=job.id, claim_token=job.claim_token).update(**fields)
+    for field, value in fields.items():
+        setattr(job, field, value)
+    return job
+
+
+def run_job(job: Job) -> Job:
+    try:
+        registered_job = get_registered_job(job.name)
+    except ValueError as e:
+        return _finish_job(job, status=Job.StatusChoices.FAILED, finished_at=timezone.now(), last_error=str(e))
+
+    try:
+        result = registered_job.function(owner_id=job.owner_id, **job.payload)
+    except PermanentJobError as e:
+        logger.warning("Job %s (%s) failed: %s", job.uuid, job.name, e)
+        return _finish_job(
+            job, status=Job.StatusChoices.FAILED, finished_at=timezone.now(), last_error=str(e), result=e.result
+        )
+    except Exception as e:
+        logger.exception("Job %s (%s) failed on attempt %s.", job.uuid, job.name, job.attempts)
+        error = f"{type(e).__name__}: {e}"
+        if job.attempts < job.max_attempts:
+            return _finish_job(
+                job,
+                status=Job.StatusChoices.QUEUED,
+                run_after=timezone.now() + get_retry_delay(job.attempts),
+                last_error=error,
+            )
+        return _finish_job(job, status=Job.StatusChoices.FAILED, finished_at=timezone.now(), last_error=error)
+
+    return _finish_job(
+        job, status=Job.StatusChoices.SUCCEEDED, finished_at=timezone.now(), last_error=None, result=result
+    )
+
+
+def purge_finished_jobs(before: datetime) -> int:
+    purged_jobs, _ = Job.objects.filter(
+        status__in=[Job.StatusChoices.SUCCEEDED, Job.StatusChoices.FAILED], finished_at__lt=before
+    ).delete()
+    return purged_jobs
@@ -0,0 +1,63 @@
+import threading
+from collections import Counter
+from datetime import timedelta
+from typing import Optional
+from uuid import uuid4
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from .job_services import claim_jobs, extend_claimed_jobs, release_claimed_jobs, run_job
+
+
+class JobWorker:
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        lease: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        self.batch_size = batch_size or settings.JOBS_BATCH_SIZE
+        self.lease = timedelta(seconds=lease or settings.JOBS_LEASE_SECONDS)
+        self.poll_interval = settings.JOBS_POLL_INTERVAL_SECONDS if poll_interval is None else poll_interval
+        self.claim_token = uuid4()
+        self.stopping = threading.Event()
+        self.status_counts = Counter()
+
+    def run_once(self) -> int:
+        # Runs one batch of claimed jobs one after another, giving back the ones left when the worker is stopped.
+        jobs = claim_jobs(self.claim_token, self.lease, self.batch_size)
+        run_count = 0
+        try:
+            for job in jobs:
+                if self.stopping.is_set():
+                    break
+                self.status_counts[run_job(job).status] += 1
+                run_count += 1
+        finally:
+            if run_count < len(jobs):
+                release_claimed_jobs(self.claim_token)
+        return len(jobs)
+
+    def extend_leases(self) -> None:
+        # Long jobs keep their claim while the worker is alive, so only the jobs of dead workers are taken over.
+        try:
+            while not self.stopping.wait(self.lease.total_seconds() / 3):
+                extend_claimed_jobs(self.claim_token, self.lease)
+        finally:
+            connection.close()
+
+    def run(self) -> None:
+        heartbeat = threading.Thread(target=self.extend_leases, daemon=True)
+        heartbeat.start()
+        try:
+            while not self.stopping.is_set():
+                close_old_connections()
+                if self.run_once() < self.batch_size:
+                    self.stopping.wait(self.poll_interval)
+        finally:
+            self.stop()
+            heartbeat.join()
+
+    def stop(self) -> None:
+        self.stopping.set()
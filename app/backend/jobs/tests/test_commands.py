@@ -0,0 +1,41 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from backend.jobs.models import Job
+from backend.jobs.services import enqueue_job
+
+from .test_job_services import BaseJobTestCase
+
+
+class RunWorkersCommandTestCase(BaseJobTestCase):
+    def test_once_runs_a_batch_of_queued_jobs(self):
+        for _ in range(3):
+            enqueue_job("tests.echo")
+
+        stdout = StringIO()
+        call_command("run_workers", once=True, batch_size=2, stdout=stdout)
+
+        self.assertEqual(stdout.getvalue(), "Ran 2 jobs: 2 succeeded, 0 failed, 0 retried.\n")
+        self.assertEqual(Job.objects.filter(status="queued").count(), 1)
+
+    def test_processes_must_be_positive(self):
+        with self.assertRaises(CommandError):
+            call_command("run_workers", processes=0, stdout=StringIO())
+
+
+class PurgeJobsCommandTestCase(TestCase):
+    def test_purges_jobs_finished_before_the_retention_period(self):
+        now = timezone.now()
+        Job.objects.create(name="tests.echo", status="succeeded", finished_at=now - timedelta(days=8))
+        Job.objects.create(name="tests.echo", status="failed", finished_at=now - timedelta(days=1))
+        Job.objects.create(name="tests.echo")
+
+        stdout = StringIO()
+        call_command("purge_jobs", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue(), "Purged 1 finished jobs.\n")
+        self.assertEqual(Job.objects.count(), 2)
@@ -0,0 +1,224 @@
+from datetime import timedelta
+from uuid import uuid4
+
+from mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from backend.jobs.models import Job
+from backend.jobs.registry import PermanentJobError, register_job
+from backend.jobs.services import (
+    JobWorker,
+    claim_jobs,
+    enqueue_job,
+    extend_claimed_jobs,
+    get_job_for_owner,
+    get_retry_delay,
+    purge_finished_jobs,
+    release_claimed_jobs,
+    run_job,
+)
+from backend.users.tests.utils import UserTestUtils
+
+
+@register_job("tests.echo")
+def echo_job(owner_id, **payload):
+    return {"owner_id": owner_id, **payload}
+
+
+@register_job("tests.flaky")
+def flaky_job(owner_id):
+    raise ConnectionError("Connection reset.")
+
+
+@register_job("tests.rejected", max_attempts=5)
+def rejected_job(owner_id):
+    raise PermanentJobError("Rejected.", result={"reason": "invalid"})
+
+
+class BaseJobTestCase(TestCase):
+    LEASE = timedelta(seconds=30)
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+
+    def setUp(self) -> None:
+        self.claim_token = uuid4()
+
+    def get_job(self, job: Job) -> Job:
+        return Job.objects.get(id=job.id)
+
+
+class EnqueueJobTestCase(BaseJobTestCase):
+    def test_enqueues_registered_jobs(self):
+        job = enqueue_job("tests.echo", owner_id=self.user.id, payload={"value": 1})
+
+        job = self.get_job(job)
+        self.assertEqual((job.status, job.attempts, job.max_attempts), ("queued", 0, 3))
+        self.assertDictEqual(job.payload, {"value": 1})
+
+    def test_max_attempts_default_to_the_registered_ones(self):
+        self.assertEqual(enqueue_job("tests.rejected").max_attempts, 5)
+        self.assertEqual(enqueue_job("tests.rejected", max_attempts=2).max_attempts, 2)
+
+    def test_unknown_jobs_are_rejected(self):
+        with self.assertRaises(ValueError):
+            enqueue_job("tests.unknown")
+
+    def test_get_job_for_owner(self):
+        job = enqueue_job("tests.echo", owner_id=self.user.id)
+        other_user = UserTestUtils.create_user(username="new_user", password="new")
+
+        self.assertEqual(get_job_for_owner(job_uuid=str(job.uuid), owner_id=self.user.id), job)
+        with self.assertRaises(PermissionError):
+            get_job_for_owner(job_uuid=str(job.uuid), owner_id=other_user.id)
+        with self.assertRaises(Job.DoesNotExist):
+            get_job_for_owner(job_uuid=str(uuid4()), owner_id=self.user.id)
+
+
+class ClaimJobsTestCase(BaseJobTestCase):
+    def test_claims_queued_jobs_in_run_order(self):
+        later_job = enqueue_job("tests.echo", run_after=timezone.now() - timedelta(seconds=10))
+        first_job = enqueue_job("tests.echo", run_after=timezone.now() - timedelta(seconds=20))
+        enqueue_job("tests.echo", run_after=timezone.now() + timedelta(seconds=60))
+
+        jobs = claim_jobs(self.claim_token, self.LEASE, limit=10)
+
+        self.assertListEqual([job.id for job in jobs], [first_job.id, later_job.id])
+        first_job = self.get_job(first_job)
+        self.assertEqual((first_job.status, first_job.attempts), ("running", 1))
+        self.assertEqual(first_job.claim_token, self.claim_token)
+        self.assertListEqual(claim_jobs(uuid4(), self.LEASE, limit=10), [])
+
+    def test_claims_are_limited(self):
+        for _ in range(3):
+            enqueue_job("tests.echo")
+
+        self.assertEqual(len(claim_jobs(self.claim_token, self.LEASE, limit=2)), 2)
+        self.assertEqual(len(claim_jobs(self.claim_token, self.LEASE, limit=2)), 1)
+
+    def test_jobs_of_dead_workers_are_claimed_again_or_failed(self):
+        retried_job = enqueue_job("tests.echo")
+        exhausted_job = enqueue_job("tests.echo", max_attempts=1)
+        claim_jobs(self.claim_token, self.LEASE, limit=10)
+        Job.objects.update(claimed_until=timezone.now() - timedelta(seconds=1))
+
+        jobs = claim_jobs(uuid4(), self.LEASE, limit=10)
+
+        self.assertListEqual([job.id for job in jobs], [retried_job.id])
+        self.assertEqual(self.get_job(retried_job).attempts, 2)
+        exhausted_job = self.get_job(exhausted_job)
+        self.assertEqual(exhausted_job.status, "failed")
+        self.assertIsNotNone(exhausted_job.last_error)
+
+    def test_extend_and_release_claimed_jobs(self):
+        job = enqueue_job("tests.echo")
+        claim_jobs(self.claim_token, self.LEASE, limit=10)
+        Job.objects.update(claimed_until=timezone.now())
+
+        self.assertEqual(extend_claimed_jobs(self.claim_token, self.LEASE), 1)
+        self.assertGreater(self.get_job(job).claimed_until, timezone.now() + timedelta(seconds=20))
+
+        self.assertEqual(release_claimed_jobs(self.claim_token), 1)
+        job = self.get_job(job)
+        self.assertEqual((job.status, job.attempts, job.claim_token), ("queued", 0, None))
+
+
+class RunJobTestCase(BaseJobTestCase):
+    def claim_and_run(self, job: Job) -> Job:
+        claim_jobs(self.claim_token, self.LEASE, limit=10)
+        run_job(self.get_job(job))
+        return self.get_job(job)
+
+    def test_successful_jobs_keep_their_result(self):
+        job = self.claim_and_run(enqueue_job("tests.echo", owner_id=self.user.id, payload={"value": 1}))
+
+        self.assertEqual(job.status, "succeeded")
+        self.assertDictEqual(job.result, {"owner_id": self.user.id, "value": 1})
+        self.assertIsNotNone(job.finished_at)
+        self.assertIsNone(job.claim_token)
+
+    @override_settings(JOBS_RETRY_BACKOFF_SECONDS=10, JOBS_RETRY_MAX_BACKOFF_SECONDS=30)
+    def test_failed_jobs_are_retried_with_backoff_until_their_last_attempt(self):
+        self.assertListEqual([get_retry_delay(attempts).seconds for attempts in range(1, 5)], [10, 20, 30, 30])
+
+        job = self.claim_and_run(enqueue_job("tests.flaky", max_attempts=2))
+        self.assertEqual((job.status, job.last_error), ("queued", "ConnectionError: Connection reset."))
+        self.assertGreater(job.run_after, timezone.now() + timedelta(seconds=5))
+
+        Job.objects.filter(id=job.id).update(run_after=timezone.now())
+        job = self.claim_and_run(job)
+        self.assertEqual((job.status, job.attempts), ("failed", 2))
+
+    def test_permanent_errors_are_not_retried(self):
+        job = self.claim_and_run(enqueue_job("tests.rejected"))
+
+        self.assertEqual((job.status, job.attempts, job.last_error), ("failed", 1, "Rejected."))
+        self.assertDictEqual(job.result, {"reason": "invalid"})
+
+    def test_unregistered_jobs_fail(self):
+        job = Job.objects.create(name="tests.unknown", max_attempts=3)
+        self.assertEqual(self.claim_and_run(job).status, "failed")
+
+    def test_workers_that_lost_their_claim_do_not_record_the_outcome(self):
+        job = enqueue_job("tests.echo")
+        claimed_job = claim_jobs(self.claim_token, self.LEASE, limit=10)[0]
+        Job.objects.filter(id=job.id).update(claim_token=uuid4())
+
+        run_job(claimed_job)
+
+        self.assertEqual(self.get_job(job).status, "running")
+
+    def test_purges_old_finished_jobs(self):
+        job = self.claim_and_run(enqueue_job("tests.echo"))
+        enqueue_job("tests.echo")
+
+        self.assertEqual(purge_finished_jobs(before=job.finished_at), 0)
+        self.assertEqual(purge_finished_jobs(before=timezone.now()), 1)
+        self.assertEqual(Job.objects.count(), 1)
+
+
+class JobWorkerTestCase(BaseJobTestCase):
+    def test_run_once_runs_a_batch_of_jobs(self):
+        for _ in range(3):
+            enqueue_job("tests.echo")
+        enqueue_job("tests.rejected")
+        worker = JobWorker(batch_size=3, lease=30)
+
+        self.assertEqual(worker.run_once(), 3)
+        self.assertEqual(worker.run_once(), 1)
+        self.assertEqual(worker.run_once(), 0)
+
+        self.assertDictEqual(dict(worker.status_counts), {"succeeded": 3, "failed": 1})
+
+    def test_stopped_worker_gives_back_the_jobs_it_did_not_run(self):
+        jobs = [enqueue_job("tests.echo") for _ in range(2)]
+        worker = JobWorker(batch_size=2, lease=30)
+
+        def stop_and_run_job(job: Job) -> Job:
+            worker.stop()
+            return run_job(job)
+
+        with patch("backend.jobs.services.worker_services.run_job", side_effect=stop_and_run_job):
+            worker.run_once()
+
+        self.assertListEqual([self.get_job(job).status for job in jobs], ["succeeded", "queued"])
+
+    @patch("backend.jobs.services.worker_services.close_old_connections")
+    def test_run_runs_jobs_until_stopped(self, mock_close_old_connections):
+        job = enqueue_job("tests.echo")
+        worker = JobWorker(batch_size=10, lease=30, poll_interval=0)
+        run_once = worker.run_once
+
+        def run_once_and_stop():
+            run_once()
+            worker.stop()
+            return 0
+
+        with patch.object(worker, "run_once", side_effect=run_once_and_stop):
+            worker.run()
+
+        self.assertEqual(self.get_job(job).status, "succeeded")
+        mock_close_old_connections.assert_called()
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "backend.tasks"
+
+    def ready(self):
+        from .services import background_task_services  # noqa: F401
@@ -0,0 +1,49 @@
+from statistics import median
+from time import perf_counter
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+
+from backend.tasks.services import list_tasks_for_user
+from backend.tasks.services.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Compares the tasks search backend against the plain icontains title filter."
+
+    def add_arguments(self, parser):
+        parser.add_argument("queries", nargs="+", help="Search terms to benchmark.")
+        parser.add_argument(
+            "--owner-id", type=int, help="Owner whose tasks are searched. Defaults to the largest owner."
+        )
+        parser.add_argument("--repeat", type=int, default=20, help="Executions per query and path.")
+
+    def handle(self, *args, **options):
+        owner_id = options["owner_id"] or self.get_largest_owner_id()
+        if not owner_id:
+            raise CommandError("There are no users to search tasks for.")
+
+        search_backend = get_search_backend()
+        self.stdout.write(f"Owner {owner_id}, backend {type(search_backend).__name__}, {options['repeat']} runs")
+        for query in options["queries"]:
+            icontains_time = self.time_page(owner_id, {"title": query}, options["repeat"])
+            search_time = self.time_page(owner_id, {"search": query}, options["repeat"])
+            self.stdout.write(
+                f"{query!r}: icontains {icontains_time * 1000:.2f} ms, search {search_time * 1000:.2f} ms (median)"
+            )
+
+    def get_largest_owner_id(self):
+        largest_owner = User.objects.annotate(tasks_count=Count("tasks")).order_by("-tasks_count").first()
+        return largest_owner.id if largest_owner else None
+
+    def time_page(self, owner_id: int, query_params: dict, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = perf_counter()
+            tasks = list_tasks_for_user(user_id=owner_id, query_params=query_params)
+            list(tasks[: settings.PAGINATION_PAGE_SIZE])
+            tasks.count()
+            timings.append(perf_counter() - start)
+        return median(timings)
@@ -0,0 +1,79 @@
+import re
+from itertools import combinations
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from backend.tasks.services import list_tasks_for_user
+
+FILTER_SAMPLES = {
+    "title": "report",
+    "description": "report",
+    "search": "report",
+    "status": "to_do",
+    "created_from": "2023-01-01",
+    "created_to": "2023-12-31",
+    "created_after": "2023-01-01T00:00:00Z",
+    "created_before": "2024-01-01T00:00:00Z",
+    "updated_since": "2023-01-01T00:00:00Z",
+    "due_after": "2023-01-01T00:00:00Z",
+    "due_before": "2023-02-01T00:00:00Z",
+}
+# Every filter alone and in pairs, and all of them together, instead of all 2 ** len(FILTER_SAMPLES) combinations.
+MAX_COMBINED_FILTERS = 2
+
+SEQUENTIAL_SCAN_PATTERNS = {
+    "postgresql": re.compile(r"Seq Scan on tasks_task\b"),
+    "sqlite": re.compile(r"\bSCAN tasks_task\b(?! USING)"),
+}
+
+
+class Command(BaseCommand):
+    help = "Prints the EXPLAIN plan of the tasks list query for every filter, every pair of filters and all of them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owner-id", type=int, help="Owner whose tasks are listed. Defaults to the first user.")
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail if any plan falls back to a sequential scan of the tasks table.",
+        )
+
+    def handle(self, *args, **options):
+        owner_id = options["owner_id"] or User.objects.order_by("id").values_list("id", flat=True).first()
+        if not owner_id:
+            raise CommandError("There are no users to explain the tasks list for.")
+
+        sequential_scans = []
+        with transaction.atomic():
+            if options["check"] and connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for query_params in self.get_filter_combinations():
+                tasks = list_tasks_for_user(user_id=owner_id, query_params=query_params)
+                plan = tasks[: settings.PAGINATION_PAGE_SIZE].explain()
+                self.stdout.write(f"-- filters: {', '.join(query_params) or 'none'}")
+                self.stdout.write(plan)
+                self.stdout.write("")
+                if self.is_sequential_scan(plan):
+                    sequential_scans.append(query_params)
+
+        if options["check"] and sequential_scans:
+            failed_combinations = "; ".join(", ".join(query_params) or "none" for query_params in sequential_scans)
+            raise CommandError(f"Sequential scan on tasks table for filters: {failed_combinations}")
+
+    def get_filter_combinations(self) -> list[dict]:
+        filter_names = list(FILTER_SAMPLES)
+        filter_combinations = []
+        for size in range(MAX_COMBINED_FILTERS + 1):
+            for names in combinations(filter_names, size):
+                filter_combinations.append({name: FILTER_SAMPLES[name] for name in names})
+        filter_combinations.append(dict(FILTER_SAMPLES))
+        return filter_combinations
+
+    def is_sequential_scan(self, plan: str) -> bool:
+        pattern = SEQUENTIAL_SCAN_PATTERNS.get(connection.vendor)
+        return bool(pattern and pattern.search(plan))
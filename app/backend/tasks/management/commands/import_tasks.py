@@ -0,0 +1,42 @@
+from time import perf_counter
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.tasks.services import IMPORT_FORMATS, get_import_format, import_tasks, iter_import_rows
+
+
+class Command(BaseCommand):
+    help = "Imports tasks for a user from a NDJSON or CSV file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="NDJSON or CSV file with title, description and status columns.")
+        parser.add_argument("--owner", required=True, help="Username of the owner of the imported tasks.")
+        parser.add_argument("--format", choices=IMPORT_FORMATS, help="File format. Defaults to the file extension.")
+        parser.add_argument("--batch-size", type=int, help="Rows validated and inserted per transaction.")
+        parser.add_argument("--no-copy", action="store_true", help="Use bulk_create instead of COPY on PostgreSQL.")
+
+    def handle(self, *args, **options):
+        owner_id = User.objects.filter(username=options["owner"]).values_list("id", flat=True).first()
+        if not owner_id:
+            raise CommandError(f"User {options['owner']!r} does not exist.")
+        import_format = options["format"] or get_import_format(options["path"])
+        if not import_format:
+            raise CommandError("Format is required for files without extension.")
+
+        start = perf_counter()
+        with open(options["path"], "rb") as import_file:
+            import_result = import_tasks(
+                owner_id=owner_id,
+                rows=iter_import_rows(import_file, import_format),
+                batch_size=options["batch_size"],
+                use_copy=False if options["no_copy"] else None,
+            )
+        elapsed = perf_counter() - start
+
+        for row_error in import_result["errors"]:
+            self.stderr.write(f"Line {row_error['line']}: {row_error['error']}")
+        self.stdout.write(
+            f"Imported {import_result['imported']} tasks, {import_result['failed']} failed, in {elapsed:.2f} s "
+            f"({import_result['imported'] / elapsed:.0f} tasks/s)."
+        )
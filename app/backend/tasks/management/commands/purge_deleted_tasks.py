@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from backend.tasks.services import purge_deleted_tasks
+
+
+class Command(BaseCommand):
+    help = "Removes deleted task tombstones older than the retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TASKS_TOMBSTONES_RETENTION_DAYS,
+            help="Tombstones older than this number of days are removed.",
+        )
+
+    def handle(self, *args, **options):
+        purged_tasks = purge_deleted_tasks(before=timezone.now() - timedelta(days=options["days"]))
+        self.stdout.write(f"Purged {purged_tasks} deleted tasks.")
@@ -0,0 +1,21 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.tasks.services import reconcile_task_counters
+
+
+class Command(BaseCommand):
+    help = "Recounts the tasks of each owner and repairs the task counters that drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owner", action="append", help="Username to reconcile. Defaults to every owner.")
+
+    def handle(self, *args, **options):
+        owner_ids = None
+        if options["owner"]:
+            owner_ids = list(User.objects.filter(username__in=options["owner"]).values_list("id", flat=True))
+            if len(owner_ids) != len(set(options["owner"])):
+                raise CommandError("Some owners do not exist.")
+
+        repaired_counters, repaired_owners = reconcile_task_counters(owner_ids)
+        self.stdout.write(f"Repaired {repaired_counters} task counters of {repaired_owners} owners.")
@@ -0,0 +1,46 @@
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.tasks.services import TaskScheduler
+
+
+class Command(BaseCommand):
+    help = "Fires the scheduled tasks when their run_at time comes. Several schedulers can run side by side."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, help="Tasks claimed and fired per transaction.")
+        parser.add_argument("--horizon", type=float, help="Seconds ahead of now claimed into the in-memory heap.")
+        parser.add_argument("--lease", type=float, help="Seconds a claim is held before other schedulers take it.")
+        parser.add_argument("--workers", type=int, help="Threads firing batches. 1 fires them inline.")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between claims.")
+        parser.add_argument("--once", action="store_true", help="Fire the tasks due now and exit.")
+
+    def handle(self, *args, **options):
+        horizon = settings.TASKS_SCHEDULER_HORIZON_SECONDS if options["horizon"] is None else options["horizon"]
+        lease = options["lease"] or settings.TASKS_SCHEDULER_LEASE_SECONDS
+        if lease <= horizon:
+            raise CommandError("Lease must be longer than the horizon.")
+
+        scheduler = TaskScheduler(
+            batch_size=options["batch_size"],
+            horizon=horizon,
+            lease=lease,
+            workers=options["workers"],
+            poll_interval=options["poll_interval"],
+        )
+        if options["once"]:
+            scheduler.run_once()
+        else:
+            signal.signal(signal.SIGTERM, lambda signum, frame: scheduler.stop())
+            signal.signal(signal.SIGINT, lambda signum, frame: scheduler.stop())
+            scheduler.run()
+
+        lateness = sorted(scheduler.lateness)
+        self.stdout.write(f"Fired {scheduler.fired_count} tasks.")
+        if lateness:
+            self.stdout.write(
+                f"Lateness p50 {lateness[len(lateness) // 2] * 1000:.0f} ms, "
+                f"p99 {lateness[int(len(lateness) * 0.99)] * 1000:.0f} ms, max {lateness[-1] * 1000:.0f} ms."
+            )
@@ -0,0 +1,161 @@
+import random
+from contextlib import contextmanager
+from datetime import timedelta
+from time import perf_counter
+from uuid import uuid4
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from backend.tasks.models import DeletedTask, Task
+from backend.tasks.services import reconcile_task_counters
+from backend.tasks.services.import_task_services import copy_tasks
+
+STATUS_WEIGHTS = {
+    Task.StatusChoices.TO_DO: 35,
+    Task.StatusChoices.IN_PROGRESS: 15,
+    Task.StatusChoices.COMPLETED: 40,
+    Task.StatusChoices.STAND_BY: 10,
+}
+TITLE_ACTIONS = ["Preparar", "Revisar", "Enviar", "Llamar a", "Actualizar", "Planificar", "Documentar", "Corregir"]
+TITLE_SUBJECTS = [
+    "informe",
+    "presentación",
+    "cliente",
+    "facturas",
+    "presupuesto",
+    "reunión",
+    "contrato",
+    "inventario",
+    "proveedor",
+    "campaña",
+]
+TITLE_DETAILS = ["mensual", "trimestral", "urgente", "del equipo", "de ventas", "pendiente", "anual", ""]
+DESCRIPTION_WORDS = TITLE_SUBJECTS + ["detalles", "confirmar", "revisión", "estado", "entrega", "plazo", "equipo"]
+
+
+@contextmanager
+def keep_task_dates():
+    date_fields = [Task._meta.get_field("created"), Task._meta.get_field("last_updated")]
+    auto_now_flags = [(field.auto_now, field.auto_now_add) for field in date_fields]
+    for field in date_fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, (auto_now, auto_now_add) in zip(date_fields, auto_now_flags):
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = "Seeds users with synthetic tasks for benchmarks and load tests."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100, help="Number of users to create.")
+        parser.add_argument("--tasks", type=int, default=1000, help="Number of tasks per user.")
+        parser.add_argument("--days", type=int, default=365, help="Tasks are created over this number of days.")
+        parser.add_argument("--prefix", default="bench_user_", help="Username prefix of the seeded users.")
+        parser.add_argument("--password", default="bench", help="Password of every seeded user.")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Tasks inserted per statement.")
+        parser.add_argument("--seed", type=int, default=None, help="Random seed, for reproducible datasets.")
+        parser.add_argument(
+            "--method",
+            choices=["auto", "copy", "bulk_create"],
+            default="auto",
+            help="Insert method. Defaults to COPY on PostgreSQL and bulk_create elsewhere.",
+        )
+        parser.add_argument("--reset", action="store_true", help="Delete users with the prefix and their tasks first.")
+
+    def handle(self, *args, **options):
+        method = options["method"]
+        if method == "auto":
+            method = "copy" if connection.vendor == "postgresql" else "bulk_create"
+        if method == "copy" and connection.vendor != "postgresql":
+            raise CommandError("COPY is only available on PostgreSQL.")
+
+        seeded_users = User.objects.filter(username__startswith=options["prefix"])
+        if options["reset"]:
+            self.delete_users(seeded_users)
+        elif seeded_users.exists():
+            raise CommandError(f"There are already users starting with {options['prefix']!r}, use --reset.")
+
+        self.random = random.Random(options["seed"])
+        self.now = timezone.now()
+        start = perf_counter()
+
+        users = self.create_users(options["users"], options["prefix"], options["password"])
+        insert_tasks = self.copy_tasks if method == "copy" else self.bulk_create_tasks
+        tasks_count = 0
+        batch = []
+        for user in users:
+            for _ in range(options["tasks"]):
+                batch.append(self.build_task(user.id, options["days"]))
+                if len(batch) >= options["batch_size"]:
+                    tasks_count += insert_tasks(batch)
+                    batch = []
+        if batch:
+            tasks_count += insert_tasks(batch)
+        reconcile_task_counters(user.id for user in users)
+
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {Task._meta.db_table}")
+
+        elapsed = perf_counter() - start
+        self.stdout.write(
+            f"Seeded {len(users)} users and {tasks_count} tasks with {method} in {elapsed:.2f} s "
+            f"({tasks_count / elapsed:.0f} tasks/s)."
+        )
+
+    def delete_users(self, users) -> None:
+        with transaction.atomic():
+            Task.objects.filter(owner__in=users).delete()
+            DeletedTask.objects.filter(owner__in=users).delete()
+            users.delete()
+
+    def create_users(self, users_count: int, prefix: str, password: str) -> list[User]:
+        password_hash = make_password(password)
+        User.objects.bulk_create(
+            User(username=f"{prefix}{index:06d}", email=f"{prefix}{index:06d}@example.com", password=password_hash)
+            for index in range(users_count)
+        )
+        return list(User.objects.filter(username__startswith=prefix).order_by("id"))
+
+    def build_task(self, owner_id: int, days: int) -> Task:
+        age = timedelta(days=min(self.random.expovariate(3 / days), days), seconds=self.random.randrange(86400))
+        created = self.now - age
+        status = self.random.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()))[0]
+        last_updated = created if status == Task.StatusChoices.TO_DO else created + age * self.random.random()
+        title = " ".join(
+            part
+            for part in (
+                self.random.choice(TITLE_ACTIONS),
+                self.random.choice(TITLE_SUBJECTS),
+                self.random.choice(TITLE_DETAILS),
+            )
+            if part
+        )
+        description = None
+        if self.random.random() < 0.7:
+            description = " ".join(self.random.choices(DESCRIPTION_WORDS, k=self.random.randint(3, 20))).capitalize()
+        return Task(
+            uuid=uuid4(),
+            owner_id=owner_id,
+            created=created,
+            last_updated=last_updated,
+            title=title,
+            description=description,
+            status=status,
+        )
+
+    def bulk_create_tasks(self, tasks: list[Task]) -> int:
+        with keep_task_dates():
+            Task.objects.bulk_create(tasks)
+        return len(tasks)
+
+    def copy_tasks(self, tasks: list[Task]) -> int:
+        copy_tasks(tasks)
+        return len(tasks)
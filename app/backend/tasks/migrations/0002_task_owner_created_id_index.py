@@ -0,0 +1,17 @@
+# Generated by Django 4.2.5 on 2026-10-18 16:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['owner', '-created', 'id'], name='tasks_owner_created_id_idx'),
+        ),
+    ]
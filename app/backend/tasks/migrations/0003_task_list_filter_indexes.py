@@ -0,0 +1,29 @@
+# Generated by Django 4.2.5 on 2026-10-18 16:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_task_owner_created_id_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['owner', 'status', '-created', 'id'], name='tasks_owner_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status', 'to_do')), fields=['owner', '-created', 'id'], name='tasks_open_to_do_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status', 'in_progress')), fields=['owner', '-created', 'id'], name='tasks_open_in_progress_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status', 'stand_by')), fields=['owner', '-created', 'id'], name='tasks_open_stand_by_idx'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.5 on 2026-10-18 16:48
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+CREATE_SEARCH_SQL = """
+CREATE INDEX IF NOT EXISTS tasks_title_trgm_idx ON tasks_task USING gin (UPPER(title::text) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS tasks_description_trgm_idx ON tasks_task USING gin (UPPER(description::text) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS tasks_search_vector_idx ON tasks_task USING gin (search_vector);
+
+CREATE OR REPLACE FUNCTION tasks_task_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('spanish', COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('spanish', COALESCE(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tasks_task_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON tasks_task
+    FOR EACH ROW EXECUTE FUNCTION tasks_task_search_vector_update();
+
+UPDATE tasks_task SET search_vector =
+    setweight(to_tsvector('spanish', COALESCE(title, '')), 'A') ||
+    setweight(to_tsvector('spanish', COALESCE(description, '')), 'B');
+"""
+
+DROP_SEARCH_SQL = """
+DROP TRIGGER IF EXISTS tasks_task_search_vector_trigger ON tasks_task;
+DROP FUNCTION IF EXISTS tasks_task_search_vector_update();
+DROP INDEX IF EXISTS tasks_search_vector_idx;
+DROP INDEX IF EXISTS tasks_description_trgm_idx;
+DROP INDEX IF EXISTS tasks_title_trgm_idx;
+"""
+
+
+def create_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_SEARCH_SQL)
+
+
+def drop_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_SEARCH_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_task_list_filter_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_objects, drop_search_objects),
+    ]
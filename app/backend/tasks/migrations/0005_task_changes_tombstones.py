@@ -0,0 +1,41 @@
+# Generated by Django 4.2.5 on 2026-10-18 16:55
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('tasks', '0004_task_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletedTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uuid', models.UUIDField(editable=False)),
+                ('deleted', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Deleted task',
+                'verbose_name_plural': 'Deleted tasks',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['owner', 'last_updated', 'id'], name='tasks_owner_updated_idx'),
+        ),
+        migrations.AddField(
+            model_name='deletedtask',
+            name='owner',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deleted_tasks', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='deletedtask',
+            index=models.Index(fields=['owner', 'deleted'], name='tasks_deleted_owner_idx'),
+        ),
+    ]
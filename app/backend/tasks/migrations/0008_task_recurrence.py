@@ -0,0 +1,41 @@
+# Generated by Django 4.2.5 on 2026-10-18 17:56
+
+import backend.tasks.recurrence
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_task_scheduling'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='occurrence_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='recurrence',
+            field=models.CharField(blank=True, max_length=200, null=True, validators=[backend.tasks.recurrence.validate_recurrence_rule]),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='template_uuid',
+            field=models.UUIDField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['owner', 'due_at', 'id'], name='tasks_owner_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('recurrence__gt', '')), fields=['owner'], name='tasks_recurring_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='task',
+            constraint=models.UniqueConstraint(fields=('template_uuid', 'occurrence_at'), name='tasks_template_occurrence_uniq'),
+        ),
+    ]
@@ -1,9 +1,13 @@
 from uuid import uuid4
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Q
 from django.core.exceptions import FieldError
 from django.contrib.auth.models import User
 
+from .recurrence import validate_recurrence_rule
+
 
 class Task(models.Model):
     uuid = models.UUIDField(unique=True, default=uuid4, editable=False)
@@ -12,6 +16,7 @@ class Task(models.Model):
     last_updated = models.DateTimeField(auto_now=True)
     title = models.CharField(max_length=100)
     description = models.TextField(null=True, blank=True)
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
 
     class StatusChoices(models.TextChoices):
         TO_DO = "to_do", "To Do"
@@ -20,6 +25,15 @@ class Task(models.Model):
         STAND_BY = "stand_by", "Stand By"
 
     status = models.CharField(choices=StatusChoices.choices, max_length=20, default=StatusChoices.TO_DO)
+    due_at = models.DateTimeField(null=True, blank=True)
+    run_at = models.DateTimeField(null=True, blank=True)
+    scheduled_status = models.CharField(choices=StatusChoices.choices, max_length=20, null=True, blank=True)
+    fired_at = models.DateTimeField(null=True, blank=True, editable=False)
+    claim_token = models.UUIDField(null=True, blank=True, editable=False)
+    claimed_until = models.DateTimeField(null=True, blank=True, editable=False)
+    recurrence = models.CharField(max_length=200, null=True, blank=True, validators=[validate_recurrence_rule])
+    template_uuid = models.UUIDField(null=True, blank=True, editable=False)
+    occurrence_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     @classmethod
     def get_editable_fields(cls) -> list[str]:
@@ -45,3 +59,59 @@ class Task(models.Model):
     class Meta:
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
+        indexes = [
+            models.Index(fields=["owner", "-created", "id"], name="tasks_owner_created_id_idx"),
+            models.Index(fields=["owner", "status", "-created", "id"], name="tasks_owner_status_created_idx"),
+            models.Index(
+                fields=["owner", "-created", "id"],
+                condition=Q(status="to_do"),
+                name="tasks_open_to_do_idx",
+            ),
+            models.Index(
+                fields=["owner", "-created", "id"],
+                condition=Q(status="in_progress"),
+                name="tasks_open_in_progress_idx",
+            ),
+            models.Index(
+                fields=["owner", "-created", "id"],
+                condition=Q(status="stand_by"),
+                name="tasks_open_stand_by_idx",
+            ),
+            models.Index(fields=["owner", "last_updated", "id"], name="tasks_owner_updated_idx"),
+            models.Index(
+                fields=["run_at", "id"],
+                condition=Q(run_at__isnull=False, fired_at__isnull=True),
+                name="tasks_pending_run_idx",
+            ),
+            models.Index(fields=["owner", "due_at", "id"], name="tasks_owner_due_idx"),
+            models.Index(fields=["owner"], condition=Q(recurrence__gt=""), name="tasks_recurring_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["template_uuid", "occurrence_at"], name="tasks_template_occurrence_uniq"),
+        ]
+
+
+class DeletedTask(models.Model):
+    uuid = models.UUIDField(editable=False)
+    owner = models.ForeignKey(User, related_name="deleted_tasks", on_delete=models.CASCADE)
+    deleted = models.DateTimeField(auto_now_add=True, editable=False)
+
+    class Meta:
+        verbose_name = "Deleted task"
+        verbose_name_plural = "Deleted tasks"
+        indexes = [
+            models.Index(fields=["owner", "deleted"], name="tasks_deleted_owner_idx"),
+        ]
+
+
+class TaskCounter(models.Model):
+    owner = models.ForeignKey(User, related_name="task_counters", on_delete=models.CASCADE)
+    status = models.CharField(choices=Task.StatusChoices.choices, max_length=20)
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Task counter"
+        verbose_name_plural = "Task counters"
+        constraints = [
+            models.UniqueConstraint(fields=["owner", "status"], name="tasks_counter_owner_status_uniq"),
+        ]
@@ -0,0 +1,148 @@
+from calendar import monthrange
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from itertools import count as count_from
+from typing import Iterator, Optional
+
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+FREQUENCIES = ["DAILY", "WEEKLY", "MONTHLY"]
+WEEKDAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+
+
+class RecurrenceRule:
+    # Subset of RFC 5545 RRULE: FREQ, INTERVAL, COUNT, UNTIL and BYDAY (weekly only).
+    def __init__(
+        self,
+        frequency: str,
+        interval: int = 1,
+        count: Optional[int] = None,
+        until: Optional[date | datetime] = None,
+        weekdays: Optional[list[int]] = None,
+    ):
+        self.frequency = frequency
+        self.interval = interval
+        self.count = count
+        self.until = until
+        self.weekdays = weekdays
+
+    @classmethod
+    def parse(cls, rule: str) -> "RecurrenceRule":
+        parts = {}
+        for part in rule.upper().removeprefix("RRULE:").split(";"):
+            name, separator, value = part.partition("=")
+            if not separator or not value or name in parts:
+                raise ValueError(f"Invalid rule part {part!r}.")
+            parts[name] = value
+
+        unknown_parts = parts.keys() - {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY"}
+        if unknown_parts:
+            raise ValueError(f"Unsupported rule parts: {', '.join(sorted(unknown_parts))}.")
+        if parts.get("FREQ") not in FREQUENCIES:
+            raise ValueError(f"FREQ must be one of {', '.join(FREQUENCIES)}.")
+        if "COUNT" in parts and "UNTIL" in parts:
+            raise ValueError("COUNT and UNTIL cannot be combined.")
+        if "BYDAY" in parts and parts["FREQ"] != "WEEKLY":
+            raise ValueError("BYDAY is only supported with FREQ=WEEKLY.")
+
+        weekdays = None
+        if "BYDAY" in parts:
+            weekdays = parts["BYDAY"].split(",")
+            if not set(weekdays) <= set(WEEKDAYS):
+                raise ValueError(f"BYDAY must be a list of {', '.join(WEEKDAYS)}.")
+            weekdays = sorted({WEEKDAYS.index(weekday) for weekday in weekdays})
+
+        return cls(
+            frequency=parts["FREQ"],
+            interval=cls._parse_positive_int(parts, "INTERVAL", default=1),
+            count=cls._parse_positive_int(parts, "COUNT"),
+            until=cls._parse_until(parts["UNTIL"]) if "UNTIL" in parts else None,
+            weekdays=weekdays,
+        )
+
+    @staticmethod
+    def _parse_positive_int(parts: dict, name: str, default: Optional[int] = None) -> Optional[int]:
+        if name not in parts:
+            return default
+        if not parts[name].isdigit() or int(parts[name]) < 1:
+            raise ValueError(f"{name} must be a positive integer.")
+        return int(parts[name])
+
+    @staticmethod
+    def _parse_until(value: str) -> date | datetime:
+        try:
+            if len(value) == 8:
+                return datetime.strptime(value, "%Y%m%d").date()
+            return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=dt_timezone.utc)
+        except ValueError:
+            raise ValueError("UNTIL must be a date (YYYYMMDD) or a UTC datetime (YYYYMMDDTHHMMSSZ).")
+
+    def _get_first_period(self, start: datetime, window_from: datetime) -> int:
+        # Periods before the window are skipped unless COUNT needs them to be numbered.
+        if self.count is not None or window_from <= start:
+            return 0
+        if self.frequency == "DAILY":
+            periods = (window_from - start).days // self.interval
+        elif self.frequency == "WEEKLY":
+            periods = (window_from.date() - self._get_week_start(start).date()).days // 7 // self.interval
+        else:
+            periods = (window_from.year - start.year) * 12 + window_from.month - start.month
+            periods //= self.interval
+        return max(periods - 1, 0)
+
+    @staticmethod
+    def _get_week_start(start: datetime) -> datetime:
+        return start - timedelta(days=start.weekday())
+
+    def _get_period(self, start: datetime, period: int) -> tuple[datetime, list[datetime]]:
+        if self.frequency == "DAILY":
+            period_start = start + timedelta(days=period * self.interval)
+            return period_start, [period_start]
+        if self.frequency == "WEEKLY":
+            period_start = self._get_week_start(start) + timedelta(weeks=period * self.interval)
+            weekdays = self.weekdays or [start.weekday()]
+            return period_start, [period_start + timedelta(days=weekday) for weekday in weekdays]
+
+        month = start.month - 1 + period * self.interval
+        year, month = start.year + month // 12, month % 12 + 1
+        period_start = start.replace(year=year, month=month, day=1)
+        if start.day > monthrange(year, month)[1]:
+            return period_start, []
+        return period_start, [period_start.replace(day=start.day)]
+
+    def iter_occurrences(self, start: datetime, window_from: datetime, window_to: datetime) -> Iterator[datetime]:
+        # Occurrences are computed on the wall clock of the current time zone, so they keep their hour across DST.
+        current_timezone = timezone.get_current_timezone()
+        local_start = timezone.localtime(start, current_timezone).replace(tzinfo=None)
+        local_from = timezone.localtime(window_from, current_timezone).replace(tzinfo=None)
+        until = self.until
+        if isinstance(until, datetime):
+            until = timezone.localtime(until, current_timezone).replace(tzinfo=None)
+        elif until is not None:
+            until = datetime.combine(until, time.max)
+
+        index = 0
+        for period in count_from(self._get_first_period(local_start, local_from)):
+            period_start, occurrences = self._get_period(local_start, period)
+            if timezone.make_aware(period_start, current_timezone) >= window_to:
+                return
+            for occurrence in occurrences:
+                if occurrence < local_start:
+                    continue
+                index += 1
+                if self.count is not None and index > self.count:
+                    return
+                if until is not None and occurrence > until:
+                    return
+                occurrence = timezone.make_aware(occurrence, current_timezone)
+                if occurrence >= window_to:
+                    return
+                if occurrence >= window_from:
+                    yield occurrence
+
+
+def validate_recurrence_rule(value: str) -> None:
+    try:
+        RecurrenceRule.parse(value)
+    except ValueError as e:
+        raise ValidationError(str(e))
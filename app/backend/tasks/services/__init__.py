@@ -1,3 +1,58 @@
-from .task_services import create_task, list_tasks_for_user, delete_task, update_task
+from .task_services import (
+    create_task,
+    list_tasks_for_user,
+    list_task_changes_for_user,
+    purge_deleted_tasks,
+    delete_task,
+    update_task,
+    update_task_occurrence,
+)
+from .async_task_services import acreate_task, adelete_task, aupdate_task
+from .bulk_task_services import (
+    BulkTasksError,
+    bulk_create_tasks,
+    bulk_update_tasks,
+    bulk_delete_tasks,
+    merge_bulk_results,
+)
+from .background_task_services import enqueue_bulk_tasks_job, enqueue_import_tasks_job
+from .import_task_services import IMPORT_FORMATS, get_import_format, import_tasks, iter_import_rows
+from .scheduler_services import TaskScheduler, claim_due_tasks, fire_scheduled_tasks, release_claimed_tasks
+from .task_counters import (
+    aget_tasks_count_for_user,
+    get_task_summary_for_user,
+    get_tasks_count_for_user,
+    reconcile_task_counters,
+)
 
-__all__ = ["create_task", "list_tasks_for_user", "delete_task", "update_task"]
+__all__ = [
+    "create_task",
+    "list_tasks_for_user",
+    "list_task_changes_for_user",
+    "purge_deleted_tasks",
+    "delete_task",
+    "update_task",
+    "update_task_occurrence",
+    "acreate_task",
+    "adelete_task",
+    "aupdate_task",
+    "BulkTasksError",
+    "bulk_create_tasks",
+    "bulk_update_tasks",
+    "bulk_delete_tasks",
+    "merge_bulk_results",
+    "enqueue_bulk_tasks_job",
+    "enqueue_import_tasks_job",
+    "IMPORT_FORMATS",
+    "get_import_format",
+    "import_tasks",
+    "iter_import_rows",
+    "TaskScheduler",
+    "claim_due_tasks",
+    "fire_scheduled_tasks",
+    "release_claimed_tasks",
+    "aget_tasks_count_for_user",
+    "get_task_summary_for_user",
+    "get_tasks_count_for_user",
+    "reconcile_task_counters",
+]
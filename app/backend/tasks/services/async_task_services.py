@@ -0,0 +1,42 @@
+from asgiref.sync import sync_to_async
+
+from backend.db.routers import amark_recent_write
+from backend.tasks.models import Task
+from .list_cache import abump_tasks_list_generation
+from .task_services import _save_task_and_counters, _update_task_and_counters, delete_task
+
+
+async def araise_task_not_found_or_not_owner(task_uuid: str) -> None:
+    if await Task.objects.filter(uuid=task_uuid).aexists():
+        raise PermissionError("User is not task owner.")
+    raise Task.DoesNotExist("Task matching query does not exist.")
+
+
+async def acreate_task(owner_id: int, **kwargs) -> Task:
+    assert owner_id, "Owner id is required."
+    task = Task(owner_id=owner_id, **kwargs)
+    await sync_to_async(task.full_clean)()
+    # The task and its status counter share a transaction, which the async ORM cannot open.
+    await sync_to_async(_save_task_and_counters)(task)
+    await abump_tasks_list_generation(owner_id)
+    await amark_recent_write(owner_id)
+    return task
+
+
+async def aupdate_task(task_uuid: str, owner_id: int, **kwargs) -> None:
+    assert task_uuid, "Task uuid is required."
+    assert owner_id, "Owner id is required."
+
+    Task.validate_fields_are_editable(list(kwargs.keys()))
+    Task(**kwargs).clean_fields(exclude=[field.name for field in Task._meta.fields if field.name not in kwargs])
+    # The update, its status counters and its outbox event share a transaction, which the async ORM cannot open.
+    updated_tasks = await sync_to_async(_update_task_and_counters)(task_uuid, owner_id, **kwargs)
+    if not updated_tasks:
+        await araise_task_not_found_or_not_owner(task_uuid=task_uuid)
+    await abump_tasks_list_generation(owner_id)
+    await amark_recent_write(owner_id)
+
+
+async def adelete_task(task_uuid: str, owner_id: int) -> None:
+    # The delete and its tombstone share a transaction, which the async ORM cannot open.
+    await sync_to_async(delete_task)(task_uuid=task_uuid, owner_id=owner_id)
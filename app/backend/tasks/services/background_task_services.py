@@ -0,0 +1,77 @@
+from typing import IO, Callable
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+
+from backend.jobs.models import Job
+from backend.jobs.registry import PermanentJobError, register_job
+from backend.jobs.services import enqueue_job
+from .bulk_task_services import (
+    BulkTasksError,
+    bulk_create_tasks,
+    bulk_delete_tasks,
+    bulk_update_tasks,
+    merge_bulk_results,
+)
+from .import_task_services import import_tasks, iter_import_rows
+
+IMPORT_TASKS_JOB = "tasks.import"
+
+
+def get_job_files_storage() -> FileSystemStorage:
+    return FileSystemStorage(location=settings.JOBS_FILES_DIR)
+
+
+def _run_bulk_tasks_job(
+    bulk_service: Callable[..., list[dict]], owner_id: int, items: list, atomic: bool, indexes: list, errors: list
+) -> dict:
+    try:
+        results = bulk_service(owner_id, items, atomic=atomic)
+    except BulkTasksError as e:
+        raise PermanentJobError(str(e), result={"error": e.errors})
+    return {"results": merge_bulk_results(results, indexes, errors)}
+
+
+# Each bulk service commits in one transaction, but a job can run again after that commit when the worker stops
+# before marking it as done. Running creations again duplicates tasks and running deletions again fails them, so they
+# get a single attempt. Updates write the same values again and only re-arm tasks whose schedule differs.
+@register_job("tasks.bulk_create", max_attempts=1)
+def run_bulk_create_tasks_job(owner_id: int, **payload) -> dict:
+    return _run_bulk_tasks_job(bulk_create_tasks, owner_id, **payload)
+
+
+@register_job("tasks.bulk_update")
+def run_bulk_update_tasks_job(owner_id: int, **payload) -> dict:
+    return _run_bulk_tasks_job(bulk_update_tasks, owner_id, **payload)
+
+
+@register_job("tasks.bulk_delete", max_attempts=1)
+def run_bulk_delete_tasks_job(owner_id: int, **payload) -> dict:
+    return _run_bulk_tasks_job(bulk_delete_tasks, owner_id, **payload)
+
+
+def enqueue_bulk_tasks_job(
+    job_name: str, owner_id: int, items: list, atomic: bool, indexes: list[int], errors: list[dict]
+) -> Job:
+    return enqueue_job(
+        job_name,
+        owner_id=owner_id,
+        payload={"items": items, "atomic": atomic, "indexes": indexes, "errors": errors},
+    )
+
+
+# Imports commit batch by batch, so a failed import is not run again over the rows already saved.
+@register_job(IMPORT_TASKS_JOB, max_attempts=1)
+def run_import_tasks_job(owner_id: int, path: str, import_format: str) -> dict:
+    storage = get_job_files_storage()
+    try:
+        with storage.open(path, "rb") as file:
+            return import_tasks(owner_id=owner_id, rows=iter_import_rows(file, import_format))
+    finally:
+        storage.delete(path)
+
+
+def enqueue_import_tasks_job(owner_id: int, file: IO[bytes], import_format: str) -> Job:
+    path = get_job_files_storage().save(f"imports/{uuid4()}", file)
+    return enqueue_job(IMPORT_TASKS_JOB, owner_id=owner_id, payload={"path": path, "import_format": import_format})
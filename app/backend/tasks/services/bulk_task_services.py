@@ -0,0 +1,165 @@
+from collections import Counter
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from backend.db.routers import mark_recent_write
+from backend.tasks.models import DeletedTask, Task
+from .list_cache import bump_tasks_list_generation
+from .scheduler_services import SCHEDULE_RESET, updates_schedule, with_schedule_reset
+from .task_counters import add_to_task_counters, count_task_statuses
+from .task_events import record_tasks_created, record_tasks_deleted, record_tasks_updated
+
+BULK_BATCH_SIZE = 500
+TASK_NOT_FOUND_ERROR = "Task matching query does not exist."
+NOT_TASK_OWNER_ERROR = "User is not task owner."
+DUPLICATED_TASK_ERROR = "Task uuid is duplicated."
+
+
+class BulkTasksError(Exception):
+    def __init__(self, errors: list[dict]):
+        super().__init__("Some tasks could not be processed.")
+        self.errors = errors
+
+
+def _raise_if_atomic_and_failed(results: list[dict], atomic: bool) -> None:
+    errors = [result for result in results if "error" in result]
+    if atomic and errors:
+        raise BulkTasksError(errors)
+
+
+def merge_bulk_results(results: list[dict], indexes: list[int], errors: list[dict]) -> list[dict]:
+    # results are indexed over the valid items only, indexes maps them back to the request positions.
+    for result in results:
+        result["index"] = indexes[result["index"]]
+    return sorted(errors + results, key=lambda result: result["index"])
+
+
+def _get_tasks_by_uuid(task_uuids: list[str], fields: list[str], for_update: bool = False) -> dict[str, Task]:
+    tasks = Task.objects.filter(uuid__in=task_uuids).only("uuid", "owner_id", *fields)
+    if for_update:
+        tasks = tasks.select_for_update()
+    return {str(task.uuid): task for task in tasks}
+
+
+def _check_task_access(task_uuid: str, owner_id: int, tasks_by_uuid: dict, seen_uuids: set):
+    if task_uuid in seen_uuids:
+        return DUPLICATED_TASK_ERROR
+    seen_uuids.add(task_uuid)
+    task = tasks_by_uuid.get(task_uuid)
+    if task is None:
+        return TASK_NOT_FOUND_ERROR
+    if task.owner_id != owner_id:
+        return NOT_TASK_OWNER_ERROR
+    return None
+
+
+def bulk_create_tasks(owner_id: int, tasks_data: list[dict], atomic: bool = True) -> list[dict]:
+    assert owner_id, "Owner id is required."
+
+    tasks, results = [], []
+    for index, task_data in enumerate(tasks_data):
+        task = Task(owner_id=owner_id, **task_data)
+        try:
+            task.full_clean(exclude=["owner"], validate_unique=False)
+        except ValidationError as e:
+            results.append({"index": index, "error": e.message_dict})
+            continue
+        tasks.append(task)
+        results.append({"index": index, "task_uuid": str(task.uuid)})
+
+    _raise_if_atomic_and_failed(results, atomic)
+    if tasks:
+        with transaction.atomic(savepoint=False):
+            Task.objects.bulk_create(tasks, batch_size=BULK_BATCH_SIZE)
+            add_to_task_counters(owner_id, count_task_statuses(tasks))
+            record_tasks_created(owner_id, tasks)
+        bump_tasks_list_generation(owner_id)
+        mark_recent_write(owner_id)
+    return results
+
+
+def bulk_update_tasks(owner_id: int, tasks_data: list[dict], atomic: bool = True) -> list[dict]:
+    assert owner_id, "Owner id is required."
+
+    fields_to_update = sorted({field for task_data in tasks_data for field in task_data if field != "uuid"})
+    Task.validate_fields_are_editable(fields_to_update)
+
+    saved_fields = [*fields_to_update, *SCHEDULE_RESET] if updates_schedule(fields_to_update) else fields_to_update
+    updates_status = "status" in fields_to_update
+    with transaction.atomic():
+        tasks_by_uuid = _get_tasks_by_uuid(
+            [str(task_data["uuid"]) for task_data in tasks_data],
+            saved_fields,
+            for_update=updates_status or updates_schedule(fields_to_update),
+        )
+        now = timezone.now()
+        tasks, results, seen_uuids, status_deltas = [], [], set(), Counter()
+        for index, task_data in enumerate(tasks_data):
+            task_uuid = str(task_data["uuid"])
+            error = _check_task_access(task_uuid, owner_id, tasks_by_uuid, seen_uuids)
+            if error:
+                results.append({"index": index, "error": error})
+                continue
+
+            task = tasks_by_uuid[task_uuid]
+            previous_status = task.status if updates_status else None
+            updated_fields = {field: value for field, value in task_data.items() if field != "uuid"}
+            task.update_task_fields(**with_schedule_reset(updated_fields, task))
+            task.last_updated = now
+            excluded_fields = [field.name for field in Task._meta.fields if field.name not in updated_fields]
+            try:
+                task.full_clean(exclude=excluded_fields, validate_unique=False)
+            except ValidationError as e:
+                results.append({"index": index, "error": e.message_dict})
+                continue
+            tasks.append(task)
+            results.append({"index": index, "task_uuid": task_uuid})
+            if updates_status:
+                status_deltas[previous_status] -= 1
+                status_deltas[task.status] += 1
+
+        _raise_if_atomic_and_failed(results, atomic)
+        if tasks:
+            updated_fields = [*saved_fields, "last_updated"]
+            Task.objects.bulk_update(tasks, fields=updated_fields, batch_size=BULK_BATCH_SIZE)
+            add_to_task_counters(owner_id, status_deltas)
+            record_tasks_updated(
+                owner_id, ((task.uuid, {field: getattr(task, field) for field in updated_fields}) for task in tasks)
+            )
+    if tasks:
+        bump_tasks_list_generation(owner_id)
+        mark_recent_write(owner_id)
+    return results
+
+
+def bulk_delete_tasks(owner_id: int, task_uuids: list[str], atomic: bool = True) -> list[dict]:
+    assert owner_id, "Owner id is required."
+
+    with transaction.atomic():
+        tasks_by_uuid = _get_tasks_by_uuid([str(task_uuid) for task_uuid in task_uuids], ["status"], for_update=True)
+        uuids_to_delete, results, seen_uuids = [], [], set()
+        for index, task_uuid in enumerate(task_uuids):
+            task_uuid = str(task_uuid)
+            error = _check_task_access(task_uuid, owner_id, tasks_by_uuid, seen_uuids)
+            if error:
+                results.append({"index": index, "error": error})
+                continue
+            uuids_to_delete.append(task_uuid)
+            results.append({"index": index, "task_uuid": task_uuid})
+
+        _raise_if_atomic_and_failed(results, atomic)
+        if uuids_to_delete:
+            Task.objects.filter(uuid__in=uuids_to_delete, owner_id=owner_id).delete()
+            DeletedTask.objects.bulk_create(
+                [DeletedTask(uuid=task_uuid, owner_id=owner_id) for task_uuid in uuids_to_delete],
+                batch_size=BULK_BATCH_SIZE,
+            )
+            status_counts = count_task_statuses(tasks_by_uuid[task_uuid] for task_uuid in uuids_to_delete)
+            add_to_task_counters(owner_id, {status: -count for status, count in status_counts.items()})
+            record_tasks_deleted(owner_id, uuids_to_delete)
+    if uuids_to_delete:
+        bump_tasks_list_generation(owner_id)
+        mark_recent_write(owner_id)
+    return results
@@ -1,9 +1,34 @@
+from datetime import date, datetime, time, timedelta
+
 import django_filters as df
+from django.utils import timezone
+
 from backend.tasks.models import Task
+from .search import get_search_backend
+
+
+def start_of_day(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
 
 
 class TasksListFilter(df.FilterSet):
     title = df.CharFilter(lookup_expr="icontains")
+    description = df.CharFilter(lookup_expr="icontains")
+    search = df.CharFilter(method="filter_search")
     status = df.ChoiceFilter(choices=Task.StatusChoices.choices)
-    created_from = df.DateFilter(field_name="created", lookup_expr="date__gte")
-    created_to = df.DateFilter(field_name="created", lookup_expr="date__lte")
+    created_from = df.DateFilter(field_name="created", method="filter_from_day")
+    created_to = df.DateFilter(field_name="created", method="filter_to_day")
+    created_after = df.IsoDateTimeFilter(field_name="created", lookup_expr="gte")
+    created_before = df.IsoDateTimeFilter(field_name="created", lookup_expr="lt")
+    updated_since = df.IsoDateTimeFilter(field_name="last_updated", lookup_expr="gte")
+    due_after = df.IsoDateTimeFilter(field_name="due_at", lookup_expr="gte")
+    due_before = df.IsoDateTimeFilter(field_name="due_at", lookup_expr="lt")
+
+    def filter_from_day(self, queryset, name, value):
+        return queryset.filter(**{f"{name}__gte": start_of_day(value)})
+
+    def filter_to_day(self, queryset, name, value):
+        return queryset.filter(**{f"{name}__lt": start_of_day(value + timedelta(days=1))})
+
+    def filter_search(self, queryset, name, value):
+        return get_search_backend().search(queryset, value)
@@ -0,0 +1,144 @@
+import csv
+import io
+import json
+from collections import Counter
+from itertools import islice
+from typing import IO, Iterable, Iterator, Optional
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from backend.db.routers import mark_recent_write
+from backend.tasks.models import Task
+from .list_cache import bump_tasks_list_generation
+from .task_counters import add_to_task_counters
+from .task_events import record_task_rows_created
+
+IMPORT_FORMATS = ["ndjson", "csv"]
+IMPORTED_FIELDS = [Task._meta.get_field(field_name) for field_name in ["title", "description", "status"]]
+COPY_COLUMNS = ["uuid", "owner_id", "created", "last_updated", "title", "description", "status"]
+
+
+def get_import_format(file_name: str) -> Optional[str]:
+    extension = file_name.rsplit(".", 1)[-1].lower() if "." in file_name else ""
+    return {"jsonl": "ndjson", "ndjson": "ndjson", "csv": "csv"}.get(extension)
+
+
+def iter_ndjson_rows(lines: Iterable[str]) -> Iterator[tuple[int, Optional[dict], Optional[dict]]]:
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield line_number, None, {NON_FIELD_ERRORS: ["Invalid JSON."]}
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, {NON_FIELD_ERRORS: ["Each line must be a JSON object."]}
+            continue
+        yield line_number, row, None
+
+
+def iter_csv_rows(lines: Iterable[str]) -> Iterator[tuple[int, Optional[dict], Optional[dict]]]:
+    reader = csv.DictReader(lines)
+    try:
+        for row in reader:
+            if None in row:
+                yield reader.line_num, None, {NON_FIELD_ERRORS: ["Row has more values than columns."]}
+                continue
+            yield reader.line_num, {field: value for field, value in row.items() if value != ""}, None
+    except csv.Error as e:
+        yield reader.line_num, None, {NON_FIELD_ERRORS: [str(e)]}
+
+
+def iter_import_rows(file: IO[bytes], import_format: str) -> Iterator[tuple[int, Optional[dict], Optional[dict]]]:
+    lines = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        rows = iter_csv_rows(lines) if import_format == "csv" else iter_ndjson_rows(lines)
+        yield from rows
+    except UnicodeDecodeError:
+        yield 0, None, {NON_FIELD_ERRORS: ["File is not UTF-8 encoded."]}
+    finally:
+        lines.detach()
+
+
+def clean_task_row(row: dict) -> dict:
+    cleaned_data, errors = {}, {}
+    for field in IMPORTED_FIELDS:
+        try:
+            cleaned_data[field.name] = field.clean(row.get(field.name, field.get_default()), None)
+        except ValidationError as e:
+            errors[field.name] = e.messages
+    if errors:
+        raise ValidationError(errors)
+    return cleaned_data
+
+
+def copy_task_rows(task_rows: Iterable[Iterable]) -> None:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(task_rows)
+    buffer.seek(0)
+
+    columns = ", ".join(connection.ops.quote_name(Task._meta.get_field(column).column) for column in COPY_COLUMNS)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {connection.ops.quote_name(Task._meta.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+
+
+def copy_tasks(tasks: Iterable[Task]) -> None:
+    copy_task_rows([getattr(task, column) for column in COPY_COLUMNS] for task in tasks)
+
+
+def insert_task_rows(task_rows: list[tuple], use_copy: bool, owner_id: int) -> None:
+    status_index = COPY_COLUMNS.index("status")
+    with transaction.atomic():
+        if use_copy:
+            copy_task_rows(task_rows)
+        else:
+            Task.objects.bulk_create(Task(**dict(zip(COPY_COLUMNS, task_row))) for task_row in task_rows)
+        add_to_task_counters(owner_id, Counter(task_row[status_index] for task_row in task_rows))
+        record_task_rows_created(owner_id, COPY_COLUMNS, task_rows)
+
+
+def import_tasks(
+    owner_id: int,
+    rows: Iterable[tuple[int, Optional[dict], Optional[dict]]],
+    batch_size: Optional[int] = None,
+    use_copy: Optional[bool] = None,
+) -> dict:
+    assert owner_id, "Owner id is required."
+    batch_size = batch_size or settings.TASKS_IMPORT_BATCH_SIZE
+    use_copy = connection.vendor == "postgresql" if use_copy is None else use_copy
+
+    imported_count, failed_count, errors = 0, 0, []
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        now = timezone.now().isoformat() if use_copy else timezone.now()
+        task_rows = []
+        for line_number, row, error in batch:
+            if error is None:
+                try:
+                    task_data = clean_task_row(row)
+                except ValidationError as e:
+                    error = e.message_dict
+                else:
+                    task_rows.append(
+                        (uuid4(), owner_id, now, now, task_data["title"], task_data["description"], task_data["status"])
+                    )
+                    continue
+            failed_count += 1
+            if len(errors) < settings.TASKS_IMPORT_MAX_ERRORS:
+                errors.append({"line": line_number, "error": error})
+
+        if task_rows:
+            insert_task_rows(task_rows, use_copy, owner_id)
+            imported_count += len(task_rows)
+
+    if imported_count:
+        bump_tasks_list_generation(owner_id)
+        mark_recent_write(owner_id)
+    return {"imported": imported_count, "failed": failed_count, "errors": errors}
@@ -0,0 +1,51 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+def _generation_key(owner_id: int) -> str:
+    return f"tasks:list:generation:{owner_id}"
+
+
+def get_tasks_list_generation(owner_id: int) -> int:
+    generation_key = _generation_key(owner_id)
+    generation = cache.get(generation_key)
+    if generation is None:
+        cache.add(generation_key, time.time_ns(), timeout=None)
+        generation = cache.get(generation_key)
+    return generation
+
+
+async def aget_tasks_list_generation(owner_id: int) -> int:
+    generation_key = _generation_key(owner_id)
+    generation = await cache.aget(generation_key)
+    if generation is None:
+        await cache.aadd(generation_key, time.time_ns(), timeout=None)
+        generation = await cache.aget(generation_key)
+    return generation
+
+
+def _bump_generation(owner_id: int) -> None:
+    generation_key = _generation_key(owner_id)
+    try:
+        cache.incr(generation_key)
+    except ValueError:
+        cache.add(generation_key, time.time_ns(), timeout=None)
+
+
+def bump_tasks_list_generation(owner_id: int) -> None:
+    if not settings.TASKS_LIST_CACHE_TIMEOUT:
+        return
+    transaction.on_commit(lambda: _bump_generation(owner_id))
+
+
+async def abump_tasks_list_generation(owner_id: int) -> None:
+    if not settings.TASKS_LIST_CACHE_TIMEOUT:
+        return
+    generation_key = _generation_key(owner_id)
+    try:
+        await cache.aincr(generation_key)
+    except ValueError:
+        await cache.aadd(generation_key, time.time_ns(), timeout=None)
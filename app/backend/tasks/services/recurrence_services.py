@@ -0,0 +1,134 @@
+import heapq
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import cached_property
+from itertools import islice
+from typing import Iterator, Mapping, Optional
+from uuid import UUID, uuid5
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+
+from backend.tasks.models import Task
+from backend.tasks.recurrence import RecurrenceRule
+from .filters import TasksListFilter
+
+RECURRING_TASKS = Q(recurrence__gt="")
+OCCURRENCE_WINDOW_FILTERS = ["due_after", "due_before"]
+
+
+def get_occurrence_uuid(template_uuid: UUID, occurrence_at: datetime) -> UUID:
+    # Occurrences get the same uuid when they are listed and when they are saved.
+    return uuid5(template_uuid, occurrence_at.astimezone(dt_timezone.utc).isoformat())
+
+
+def iter_task_occurrences(template: Task, window_from: datetime, window_to: datetime) -> Iterator[datetime]:
+    rule = RecurrenceRule.parse(template.recurrence)
+    return rule.iter_occurrences(template.due_at or template.created, window_from, window_to)
+
+
+def is_task_occurrence(template: Task, occurrence_at: datetime) -> bool:
+    if not template.recurrence:
+        return False
+    occurrences = iter_task_occurrences(template, occurrence_at, occurrence_at + timedelta(microseconds=1))
+    return next(occurrences, None) == occurrence_at
+
+
+def build_task_occurrence(template: Task, occurrence_at: datetime) -> Task:
+    return Task(
+        uuid=get_occurrence_uuid(template.uuid, occurrence_at),
+        owner_id=template.owner_id,
+        created=template.created,
+        last_updated=template.last_updated,
+        title=template.title,
+        description=template.description,
+        status=template.status,
+        due_at=occurrence_at,
+        template_uuid=template.uuid,
+        occurrence_at=occurrence_at,
+    )
+
+
+def get_occurrence_window(query_params: Optional[Mapping]) -> Optional[tuple[datetime, datetime]]:
+    if not query_params:
+        return None
+    window_filters = {name: query_params.get(name) for name in OCCURRENCE_WINDOW_FILTERS}
+    form = TasksListFilter(window_filters, Task.objects.none()).form
+    form.is_valid()
+    window_from, window_to = [form.cleaned_data.get(name) for name in OCCURRENCE_WINDOW_FILTERS]
+    if window_from is None or window_to is None or window_from >= window_to:
+        return None
+    if window_to - window_from > timedelta(days=settings.TASKS_RECURRENCE_MAX_WINDOW_DAYS):
+        raise ValidationError(
+            {"due_before": [f"Ensure the window is no longer than {settings.TASKS_RECURRENCE_MAX_WINDOW_DAYS} days."]}
+        )
+    return window_from, window_to
+
+
+class TaskOccurrencesList:
+    # Merges the tasks due in the window with the occurrences of the recurring tasks. A page only merges and builds
+    # the tasks up to its end, and the count does not build any.
+    def __init__(self, tasks: QuerySet[Task], templates: QuerySet[Task], window_from: datetime, window_to: datetime):
+        self.tasks = tasks
+        self.templates = templates
+        self.window_from = window_from
+        self.window_to = window_to
+
+    @cached_property
+    def _templates(self) -> list[Task]:
+        return list(self.templates)
+
+    @cached_property
+    def _saved_occurrences(self) -> set[tuple[UUID, datetime]]:
+        return set(
+            Task.objects.using(self.tasks.db)
+            .filter(
+                template_uuid__in=[template.uuid for template in self._templates],
+                occurrence_at__gte=self.window_from,
+                occurrence_at__lt=self.window_to,
+            )
+            .values_list("template_uuid", "occurrence_at")
+        )
+
+    def _iter_occurrence_dates(self, template: Task) -> Iterator[datetime]:
+        template_occurrences = iter_task_occurrences(template, self.window_from, self.window_to)
+        for occurrence_at in islice(template_occurrences, settings.TASKS_RECURRENCE_MAX_OCCURRENCES):
+            if (template.uuid, occurrence_at) not in self._saved_occurrences:
+                yield occurrence_at
+
+    def _iter_occurrences(self, template: Task) -> Iterator[Task]:
+        for occurrence_at in self._iter_occurrence_dates(template):
+            yield build_task_occurrence(template, occurrence_at)
+
+    def _iter_tasks(self, stop: Optional[int] = None) -> Iterator[Task]:
+        # The tasks are ordered like the occurrences, by due date and then uuid.
+        tasks = self.tasks if stop is None else self.tasks[:stop]
+        occurrences = [self._iter_occurrences(template) for template in self._templates]
+        merged_tasks = heapq.merge(tasks, *occurrences, key=lambda task: (task.due_at, str(task.uuid)))
+        return islice(merged_tasks, stop)
+
+    @cached_property
+    def _count(self) -> int:
+        occurrences_count = sum(sum(1 for _ in self._iter_occurrence_dates(template)) for template in self._templates)
+        return self.tasks.count() + occurrences_count
+
+    def count(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(islice(self._iter_tasks(index.stop), index.start, index.stop, index.step))
+        return next(islice(self._iter_tasks(index + 1), index, None))
+
+    def __iter__(self):
+        return self._iter_tasks()
+
+
+def list_task_occurrences(
+    user_id: int, tasks: QuerySet[Task], query_params: Mapping, window: tuple[datetime, datetime]
+) -> TaskOccurrencesList:
+    # tasks already has every filter applied, the templates get the same ones except the window.
+    templates_filters = {name: value for name, value in query_params.items() if name not in OCCURRENCE_WINDOW_FILTERS}
+    templates = Task.objects.using(tasks.db).filter(RECURRING_TASKS, owner_id=user_id)
+    templates = TasksListFilter(templates_filters, templates).qs
+    return TaskOccurrencesList(tasks.exclude(RECURRING_TASKS).order_by("due_at", "uuid"), templates, *window)
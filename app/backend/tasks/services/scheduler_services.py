@@ -0,0 +1,216 @@
+import heapq
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from backend.db.routers import mark_recent_write
+from backend.tasks.models import Task
+from .list_cache import bump_tasks_list_generation
+from .task_counters import add_to_task_counters
+from .task_events import record_tasks_updated
+
+SCHEDULE_FIELDS = {"run_at", "scheduled_status"}
+SCHEDULE_RESET = {"fired_at": None, "claim_token": None, "claimed_until": None}
+LATENESS_SAMPLES = 10000
+
+
+def updates_schedule(fields) -> bool:
+    return not SCHEDULE_FIELDS.isdisjoint(fields)
+
+
+def with_schedule_reset(task_data: dict, task: Task) -> dict:
+    # Changing when or how a task runs arms it again, dropping any claim on the previous schedule. Resending the
+    # stored schedule, as full-form updates do, leaves a fired task fired. Values are compared as the model reads them,
+    # since job payloads bring datetimes back as strings.
+    if all(
+        Task._meta.get_field(field).to_python(task_data[field]) == getattr(task, field)
+        for field in SCHEDULE_FIELDS.intersection(task_data)
+    ):
+        return task_data
+    return {**task_data, **SCHEDULE_RESET}
+
+
+def claim_due_tasks(claim_token: UUID, until: datetime, lease: timedelta, limit: int) -> list[tuple[int, datetime]]:
+    now = timezone.now()
+    with transaction.atomic():
+        due_tasks = list(
+            Task.objects.select_for_update(skip_locked=True)
+            .filter(run_at__isnull=False, fired_at__isnull=True, run_at__lte=until)
+            .filter(Q(claimed_until__isnull=True) | Q(claimed_until__lt=now))
+            .order_by("run_at", "id")
+            .values_list("id", "run_at")[:limit]
+        )
+        if due_tasks:
+            Task.objects.filter(id__in=[task_id for task_id, _ in due_tasks]).update(
+                claim_token=claim_token, claimed_until=now + lease
+            )
+    return due_tasks
+
+
+def fire_scheduled_tasks(claim_token: UUID, task_ids: list[int]) -> list[Task]:
+    now = timezone.now()
+    with transaction.atomic():
+        tasks = list(
+            Task.objects.select_for_update()
+            .filter(id__in=task_ids, claim_token=claim_token, fired_at__isnull=True)
+            .only("id", "uuid", "owner_id", "status", "scheduled_status", "run_at")
+        )
+        task_ids_by_status, status_deltas = defaultdict(list), defaultdict(Counter)
+        for task in tasks:
+            new_status = task.scheduled_status or task.status
+            task_ids_by_status[new_status].append(task.id)
+            if new_status != task.status:
+                status_deltas[task.owner_id][task.status] -= 1
+                status_deltas[task.owner_id][new_status] += 1
+            task.status, task.fired_at = new_status, now
+
+        for status, status_task_ids in task_ids_by_status.items():
+            Task.objects.filter(id__in=status_task_ids).update(
+                status=status, fired_at=now, last_updated=now, claim_token=None, claimed_until=None
+            )
+        for owner_id in sorted(status_deltas):
+            add_to_task_counters(owner_id, status_deltas[owner_id])
+        for owner_id in {task.owner_id for task in tasks}:
+            record_tasks_updated(
+                owner_id,
+                (
+                    (task.uuid, {"status": task.status, "fired_at": now, "last_updated": now})
+                    for task in tasks
+                    if task.owner_id == owner_id
+                ),
+            )
+        for owner_id in {task.owner_id for task in tasks}:
+            bump_tasks_list_generation(owner_id)
+            mark_recent_write(owner_id)
+    return tasks
+
+
+def release_claimed_tasks(claim_token: UUID) -> int:
+    return Task.objects.filter(claim_token=claim_token, fired_at__isnull=True).update(
+        claim_token=None, claimed_until=None
+    )
+
+
+class TaskScheduler:
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        horizon: Optional[float] = None,
+        lease: Optional[float] = None,
+        workers: Optional[int] = None,
+        poll_interval: float = 1.0,
+    ):
+        self.batch_size = batch_size or settings.TASKS_SCHEDULER_BATCH_SIZE
+        self.horizon = timedelta(seconds=settings.TASKS_SCHEDULER_HORIZON_SECONDS if horizon is None else horizon)
+        self.lease = timedelta(seconds=lease or settings.TASKS_SCHEDULER_LEASE_SECONDS)
+        self.workers = workers or settings.TASKS_SCHEDULER_WORKERS
+        self.poll_interval = poll_interval
+        self.claim_token = uuid4()
+        self.pending = []
+        self.stopping = threading.Event()
+        self.stats_lock = threading.Lock()
+        self.fired_count = 0
+        self.lateness = deque(maxlen=LATENESS_SAMPLES)
+
+    def claim(self) -> int:
+        claimed_count = 0
+        until = timezone.now() + self.horizon
+        while True:
+            due_tasks = claim_due_tasks(self.claim_token, until, self.lease, self.batch_size)
+            for task_id, run_at in due_tasks:
+                heapq.heappush(self.pending, (run_at, task_id))
+            claimed_count += len(due_tasks)
+            if len(due_tasks) < self.batch_size:
+                return claimed_count
+
+    def pop_due_batches(self) -> list[list[int]]:
+        now = timezone.now()
+        batches, batch = [], []
+        while self.pending and self.pending[0][0] <= now:
+            batch.append(heapq.heappop(self.pending)[1])
+            if len(batch) >= self.batch_size:
+                batches.append(batch)
+                batch = []
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def fire(self, task_ids: list[int]) -> int:
+        tasks = fire_scheduled_tasks(self.claim_token, task_ids)
+        with self.stats_lock:
+            self.fired_count += len(tasks)
+            self.lateness.extend((task.fired_at - task.run_at).total_seconds() for task in tasks)
+        return len(tasks)
+
+    def fire_in_thread(self, task_ids: list[int]) -> int:
+        # Pool threads keep their own connection, so they drop it when it is broken or older than CONN_MAX_AGE.
+        close_old_connections()
+        try:
+            return self.fire(task_ids)
+        finally:
+            close_old_connections()
+
+    def seconds_to_next_run(self) -> Optional[float]:
+        if not self.pending:
+            return None
+        return max((self.pending[0][0] - timezone.now()).total_seconds(), 0)
+
+    def fire_batches(self, batches: list[list[int]], executor: Optional[ThreadPoolExecutor]) -> list[Future]:
+        if executor is None:
+            for batch in batches:
+                self.fire(batch)
+            return []
+        return [executor.submit(self.fire_in_thread, batch) for batch in batches]
+
+    def run_once(self) -> int:
+        # Fires the tasks due now and gives back the claims on the rest of the horizon.
+        fired_count = self.fired_count
+        executor = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            self.claim()
+            futures = self.fire_batches(self.pop_due_batches(), executor)
+            for future in futures:
+                future.result()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            release_claimed_tasks(self.claim_token)
+            self.pending = []
+        return self.fired_count - fired_count
+
+    def run(self) -> None:
+        executor = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        futures, next_claim = [], 0.0
+        try:
+            while not self.stopping.is_set():
+                close_old_connections()
+                if time.monotonic() >= next_claim:
+                    self.claim()
+                    next_claim = time.monotonic() + self.poll_interval
+                futures += self.fire_batches(self.pop_due_batches(), executor)
+                for future in [future for future in futures if future.done()]:
+                    futures.remove(future)
+                    future.result()
+
+                timeout = next_claim - time.monotonic()
+                seconds_to_next_run = self.seconds_to_next_run()
+                if seconds_to_next_run is not None:
+                    timeout = min(timeout, seconds_to_next_run)
+                self.stopping.wait(max(timeout, 0))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            release_claimed_tasks(self.claim_token)
+            self.pending = []
+
+    def stop(self) -> None:
+        self.stopping.set()
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F, Q, QuerySet
+from django.utils.module_loading import import_string
+
+SEARCH_CONFIG = "spanish"
+
+
+class TaskSearchBackend(ABC):
+    @abstractmethod
+    def search(self, tasks: QuerySet, query: str) -> QuerySet:
+        pass
+
+
+class ContainsSearchBackend(TaskSearchBackend):
+    def search(self, tasks: QuerySet, query: str) -> QuerySet:
+        for term in query.split():
+            tasks = tasks.filter(Q(title__icontains=term) | Q(description__icontains=term))
+        return tasks
+
+
+class PostgresFullTextSearchBackend(TaskSearchBackend):
+    def search(self, tasks: QuerySet, query: str) -> QuerySet:
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+        return (
+            tasks.filter(search_vector=search_query)
+            .annotate(search_rank=SearchRank(F("search_vector"), search_query))
+            .order_by("-search_rank", "-created", "id")
+        )
+
+
+def get_search_backend() -> TaskSearchBackend:
+    backend_path = getattr(settings, "TASKS_SEARCH_BACKEND", None)
+    if backend_path:
+        return import_string(backend_path)()
+    if connection.vendor == "postgresql":
+        return PostgresFullTextSearchBackend()
+    return ContainsSearchBackend()
@@ -0,0 +1,108 @@
+from collections import Counter
+from typing import Iterable, Mapping, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, QuerySet, Sum
+
+from backend.db.routers import get_read_database
+from backend.tasks.models import Task, TaskCounter
+from .filters import TasksListFilter
+
+
+def add_to_task_counters(owner_id: int, deltas: Mapping[str, int]) -> None:
+    # Sorted, so concurrent transactions lock the owner's counters in the same order.
+    for status, delta in sorted(deltas.items()):
+        if not delta:
+            continue
+        counters = TaskCounter.objects.filter(owner_id=owner_id, status=status)
+        if counters.update(count=F("count") + delta):
+            continue
+        try:
+            with transaction.atomic():
+                TaskCounter.objects.create(owner_id=owner_id, status=status, count=delta)
+        except IntegrityError:
+            counters.update(count=F("count") + delta)
+
+
+def count_task_statuses(tasks: Iterable[Task]) -> Counter:
+    return Counter(task.status for task in tasks)
+
+
+def get_task_summary_for_user(user_id: int) -> dict:
+    assert user_id, "User id is required."
+    counters = TaskCounter.objects.using(get_read_database(user_id)).filter(owner_id=user_id)
+    counts = dict(counters.values_list("status", "count"))
+    summary = {status: max(counts.get(status, 0), 0) for status in Task.StatusChoices.values}
+    return {"total": sum(summary.values()), **summary}
+
+
+def _get_counters_for_query(user_id: int, query_params: Optional[Mapping]) -> Optional[QuerySet[TaskCounter]]:
+    query_params = query_params or {}
+    filters = {name for name in TasksListFilter.base_filters if query_params.get(name)}
+    if filters - {"status"}:
+        return None
+
+    counters = TaskCounter.objects.using(get_read_database(user_id)).filter(owner_id=user_id)
+    if "status" in filters:
+        status = query_params.get("status")
+        if status not in Task.StatusChoices.values:
+            return None
+        counters = counters.filter(status=status)
+    return counters
+
+
+def get_tasks_count_for_user(user_id: int, query_params: Optional[Mapping] = None) -> Optional[int]:
+    counters = _get_counters_for_query(user_id, query_params)
+    if counters is None:
+        return None
+    return max(counters.aggregate(total=Sum("count"))["total"] or 0, 0)
+
+
+async def aget_tasks_count_for_user(user_id: int, query_params: Optional[Mapping] = None) -> Optional[int]:
+    counters = _get_counters_for_query(user_id, query_params)
+    if counters is None:
+        return None
+    return max((await counters.aaggregate(total=Sum("count")))["total"] or 0, 0)
+
+
+def reconcile_owner_task_counters(owner_id: int) -> int:
+    with transaction.atomic():
+        counters = {
+            counter.status: counter for counter in TaskCounter.objects.select_for_update().filter(owner_id=owner_id)
+        }
+        counts = dict(
+            Task.objects.filter(owner_id=owner_id)
+            .values("status")
+            .annotate(count=Count("id"))
+            .order_by()
+            .values_list("status", "count")
+        )
+
+        repaired_counters, missing_counters = [], []
+        for status in sorted(counters.keys() | counts.keys()):
+            count = counts.get(status, 0)
+            counter = counters.get(status)
+            if counter is None:
+                missing_counters.append(TaskCounter(owner_id=owner_id, status=status, count=count))
+            elif counter.count != count:
+                counter.count = count
+                repaired_counters.append(counter)
+
+        TaskCounter.objects.bulk_update(repaired_counters, fields=["count"])
+        TaskCounter.objects.bulk_create(
+            missing_counters, update_conflicts=True, unique_fields=["owner", "status"], update_fields=["count"]
+        )
+    return len(repaired_counters) + len(missing_counters)
+
+
+def reconcile_task_counters(owner_ids: Optional[Iterable[int]] = None) -> tuple[int, int]:
+    if owner_ids is None:
+        owner_ids = set(Task.objects.values_list("owner_id", flat=True).order_by().distinct())
+        owner_ids |= set(TaskCounter.objects.values_list("owner_id", flat=True).order_by().distinct())
+
+    repaired_counters, repaired_owners = 0, 0
+    for owner_id in sorted(owner_ids):
+        owner_repaired_counters = reconcile_owner_task_counters(owner_id)
+        repaired_counters += owner_repaired_counters
+        repaired_owners += bool(owner_repaired_counters)
+    return repaired_counters, repaired_owners
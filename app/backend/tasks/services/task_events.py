@@ -0,0 +1,57 @@
+from typing import Iterable
+from uuid import UUID
+
+from backend.tasks.models import Task
+from backend.webhooks.models import OutboxEvent
+from backend.webhooks.services import record_outbox_events
+
+TASK_EVENT_FIELDS = [
+    "title",
+    "description",
+    "status",
+    "created",
+    "last_updated",
+    "due_at",
+    "run_at",
+    "scheduled_status",
+    "fired_at",
+    "recurrence",
+    "template_uuid",
+    "occurrence_at",
+]
+
+
+def get_task_event_changes(changes: dict) -> dict:
+    return {field: value for field, value in changes.items() if field in TASK_EVENT_FIELDS}
+
+
+def record_tasks_created(owner_id: int, tasks: Iterable[Task]) -> None:
+    record_outbox_events(
+        owner_id,
+        OutboxEvent.EventTypeChoices.CREATED,
+        ((task.uuid, {field: getattr(task, field) for field in TASK_EVENT_FIELDS}) for task in tasks),
+    )
+
+
+def record_task_rows_created(owner_id: int, columns: list[str], task_rows: Iterable[tuple]) -> None:
+    uuid_index, empty_data = columns.index("uuid"), dict.fromkeys(TASK_EVENT_FIELDS)
+    record_outbox_events(
+        owner_id,
+        OutboxEvent.EventTypeChoices.CREATED,
+        (
+            (task_row[uuid_index], {**empty_data, **get_task_event_changes(dict(zip(columns, task_row)))})
+            for task_row in task_rows
+        ),
+    )
+
+
+def record_tasks_updated(owner_id: int, changes_by_uuid: Iterable[tuple[UUID | str, dict]]) -> None:
+    record_outbox_events(
+        owner_id,
+        OutboxEvent.EventTypeChoices.UPDATED,
+        ((task_uuid, get_task_event_changes(changes)) for task_uuid, changes in changes_by_uuid),
+    )
+
+
+def record_tasks_deleted(owner_id: int, task_uuids: Iterable[UUID | str]) -> None:
+    record_outbox_events(owner_id, OutboxEvent.EventTypeChoices.DELETED, ((task_uuid, {}) for task_uuid in task_uuids))
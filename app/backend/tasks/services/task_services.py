@@ -1,41 +1,136 @@
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, Optional
+from uuid import UUID
 
-from django.db.models import QuerySet
+from django.db import IntegrityError, transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
 
-from backend.tasks.models import Task
+from backend.db.routers import get_read_database, mark_recent_write
+from backend.tasks.models import DeletedTask, Task
 from .filters import TasksListFilter
+from .list_cache import bump_tasks_list_generation
+from .recurrence_services import (
+    TaskOccurrencesList,
+    build_task_occurrence,
+    get_occurrence_window,
+    is_task_occurrence,
+    list_task_occurrences,
+)
+from .scheduler_services import SCHEDULE_FIELDS, with_schedule_reset
+from .task_counters import add_to_task_counters
+from .task_events import record_tasks_created, record_tasks_deleted, record_tasks_updated
 
 
-def get_task_for_owner(task_uuid: str, owner_id: int):
-    task = Task.objects.get(uuid=task_uuid)
-    is_task_owner = task.owner_id == owner_id
-    if is_task_owner:
-        return task
-    raise PermissionError("User is not task owner.")
+def raise_task_not_found_or_not_owner(task_uuid: str) -> None:
+    if Task.objects.filter(uuid=task_uuid).exists():
+        raise PermissionError("User is not task owner.")
+    raise Task.DoesNotExist("Task matching query does not exist.")
+
+
+def get_task_for_owner(task_uuid: str, owner_id: int, fields: Optional[Iterable[str]] = None):
+    tasks = Task.objects.using(get_read_database(owner_id))
+    tasks = tasks.only(*fields) if fields else tasks
+    try:
+        return tasks.get(uuid=task_uuid, owner_id=owner_id)
+    except Task.DoesNotExist:
+        raise_task_not_found_or_not_owner(task_uuid=task_uuid)
+
+
+def _save_task_and_counters(task: Task) -> None:
+    with transaction.atomic(savepoint=False):
+        task.save()
+        add_to_task_counters(task.owner_id, {task.status: 1})
+        record_tasks_created(task.owner_id, [task])
 
 
 def create_task(owner_id: int, **kwargs) -> Task:
     assert owner_id, "Owner id is required."
     task = Task(owner_id=owner_id, **kwargs)
     task.full_clean()
-    task.save()
+    _save_task_and_counters(task)
+    bump_tasks_list_generation(owner_id)
+    mark_recent_write(owner_id)
     return task
 
 
-def list_tasks_for_user(user_id: int, query_params: Optional[dict] = None) -> QuerySet[Task]:
+def list_tasks_for_user(
+    user_id: int,
+    query_params: Optional[dict] = None,
+    fields: Optional[Iterable[str]] = None,
+    expand_occurrences: bool = False,
+) -> QuerySet[Task] | TaskOccurrencesList:
     assert user_id, "User id is required."
-    tasks = Task.objects.filter(owner_id=user_id).order_by("-created")
+    tasks = Task.objects.using(get_read_database(user_id)).filter(owner_id=user_id).order_by("-created", "id")
+    if fields:
+        tasks = tasks.only(*fields)
     if query_params:
         tasks = TasksListFilter(query_params, tasks).qs
+    window = get_occurrence_window(query_params) if expand_occurrences else None
+    if window:
+        return list_task_occurrences(user_id, tasks, query_params, window)
     return tasks
 
 
+def list_task_changes_for_user(
+    user_id: int, since: Optional[datetime] = None, after: Optional[tuple[datetime, int]] = None
+) -> tuple[QuerySet[Task], QuerySet[DeletedTask]]:
+    # Always read from the primary: a change the replica has not applied yet would be skipped by the next token.
+    assert user_id, "User id is required."
+    changed_tasks = Task.objects.filter(owner_id=user_id).order_by("last_updated", "id")
+    if after:
+        after_last_updated, after_id = after
+        changed_tasks = changed_tasks.filter(
+            Q(last_updated__gt=after_last_updated) | Q(last_updated=after_last_updated, id__gt=after_id)
+        )
+    if not since:
+        return changed_tasks, DeletedTask.objects.none()
+
+    changed_tasks = changed_tasks.filter(last_updated__gt=since)
+    deleted_tasks = DeletedTask.objects.filter(owner_id=user_id, deleted__gt=since).order_by("deleted", "id")
+    return changed_tasks, deleted_tasks
+
+
+def purge_deleted_tasks(before: datetime) -> int:
+    purged_tasks, _ = DeletedTask.objects.filter(deleted__lt=before).delete()
+    return purged_tasks
+
+
 def delete_task(task_uuid: str, owner_id: int) -> None:
     assert task_uuid, "Task uuid is required."
     assert owner_id, "Owner id is required."
 
-    task = get_task_for_owner(task_uuid=task_uuid, owner_id=owner_id)
-    task.delete()
+    tasks = Task.objects.filter(uuid=task_uuid, owner_id=owner_id)
+    with transaction.atomic(savepoint=False):
+        status = tasks.select_for_update().values_list("status", flat=True).first()
+        if status is not None:
+            tasks.delete()
+            DeletedTask.objects.create(uuid=task_uuid, owner_id=owner_id)
+            add_to_task_counters(owner_id, {status: -1})
+            record_tasks_deleted(owner_id, [task_uuid])
+    if status is None:
+        raise_task_not_found_or_not_owner(task_uuid=task_uuid)
+    bump_tasks_list_generation(owner_id)
+    mark_recent_write(owner_id)
+
+
+def _update_task_and_counters(task_uuid: str, owner_id: int, **kwargs) -> int:
+    tasks = Task.objects.filter(uuid=task_uuid, owner_id=owner_id)
+    now = timezone.now()
+    locked_fields = sorted(({"status"} | SCHEDULE_FIELDS).intersection(kwargs))
+    with transaction.atomic(savepoint=False):
+        if locked_fields:
+            task = tasks.select_for_update().only(*locked_fields).first()
+            if task is None:
+                return 0
+            kwargs = with_schedule_reset(kwargs, task)
+            tasks.update(last_updated=now, **kwargs)
+            if "status" in kwargs and task.status != kwargs["status"]:
+                add_to_task_counters(owner_id, {task.status: -1, kwargs["status"]: 1})
+        elif not tasks.update(last_updated=now, **kwargs):
+            return 0
+        record_tasks_updated(owner_id, [(task_uuid, {"last_updated": now, **kwargs})])
+    return 1
 
 
 def update_task(task_uuid: int, owner_id: int, **kwargs) -> None:
@@ -43,8 +138,32 @@ def update_task(task_uuid: int, owner_id: int, **kwargs) -> None:
     assert owner_id, "Owner id is required."
 
     fields_to_update = list(kwargs.keys())
-    task = get_task_for_owner(task_uuid=task_uuid, owner_id=owner_id)
-    task.validate_fields_are_editable(fields_to_update)
-    task.update_task_fields(**kwargs)
-    task.full_clean()
-    task.save(update_fields=fields_to_update)
+    Task.validate_fields_are_editable(fields_to_update)
+    Task(**kwargs).clean_fields(exclude=[field.name for field in Task._meta.fields if field.name not in kwargs])
+    updated_tasks = _update_task_and_counters(task_uuid, owner_id, **kwargs)
+    if not updated_tasks:
+        raise_task_not_found_or_not_owner(task_uuid=task_uuid)
+    bump_tasks_list_generation(owner_id)
+    mark_recent_write(owner_id)
+
+
+def update_task_occurrence(template_uuid: str, owner_id: int, occurrence_at: datetime, **kwargs) -> UUID:
+    assert template_uuid, "Task uuid is required."
+    assert owner_id, "Owner id is required."
+
+    template = Task.objects.filter(uuid=template_uuid, owner_id=owner_id).first()
+    if template is None:
+        raise_task_not_found_or_not_owner(task_uuid=template_uuid)
+    if not is_task_occurrence(template, occurrence_at):
+        raise Task.DoesNotExist("Task occurrence does not exist.")
+
+    task = build_task_occurrence(template, occurrence_at)
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                _save_task_and_counters(task)
+        except IntegrityError:
+            # Saved before, by an earlier edit or a concurrent one.
+            pass
+        update_task(task_uuid=task.uuid, owner_id=owner_id, **kwargs)
+    return task.uuid
@@ -0,0 +1,90 @@
+from asgiref.sync import sync_to_async
+
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist, ValidationError, FieldError
+from django.test import override_settings
+
+from backend.tasks.services import acreate_task, adelete_task, aupdate_task
+from backend.tasks.services.list_cache import aget_tasks_list_generation, get_tasks_list_generation
+from backend.users.tests.utils import UserTestUtils
+
+from .test_task_services import BaseTaskTestCase
+from .utils import TaskTestUtils
+
+
+class AsyncCreateTaskTestCase(BaseTaskTestCase):
+    async def test_owner_id_is_required(self):
+        with self.assertRaisesMessage(AssertionError, "Owner id is required."):
+            await acreate_task(owner_id="", title="Test Task")
+
+    async def test_invalid_status_raises_validation_error(self):
+        with self.assertRaises(ValidationError):
+            await acreate_task(owner_id=self.user.id, title="Test Task", status="finished")
+
+    async def test_task_creation(self):
+        task = await acreate_task(owner_id=self.user.id, title="Test Task", status="to_do")
+
+        created_task = await sync_to_async(TaskTestUtils.get_first_task_for_user)(owner_id=self.user.id)
+        self.assertEqual(created_task.uuid, task.uuid)
+
+
+class AsyncUpdateTaskTestCase(BaseTaskTestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.task = TaskTestUtils.create_task(title="Test Task", owner_id=cls.user.id)
+        cls.new_user = UserTestUtils.create_user(username="new_user", password="new")
+
+    async def test_non_editable_fields_raises_field_error(self):
+        with self.assertRaisesMessage(FieldError, "Some fields cannot be updated."):
+            await aupdate_task(task_uuid=self.task.uuid, owner_id=self.user.id, created=None)
+
+    async def test_not_owner_gets_permission_error(self):
+        with self.assertRaisesMessage(PermissionError, "User is not task owner."):
+            await aupdate_task(task_uuid=self.task.uuid, owner_id=self.new_user.id, title="Test update")
+
+    async def test_wrong_task_uuid_gets_not_exist_error(self):
+        with self.assertRaisesMessage(ObjectDoesNotExist, "Task matching query does not exist."):
+            await aupdate_task(task_uuid=self.UUID, owner_id=self.user.id, title="Test update")
+
+    async def test_task_update(self):
+        await aupdate_task(task_uuid=self.task.uuid, owner_id=self.user.id, title="Test update", status="completed")
+
+        tasks_count = await sync_to_async(TaskTestUtils.get_tasks_count_for_user)(
+            owner_id=self.user.id, title="Test update", status="completed"
+        )
+        self.assertEqual(tasks_count, 1)
+
+
+class AsyncDeleteTaskTestCase(BaseTaskTestCase):
+    async def test_not_owner_gets_permission_error(self):
+        new_user = await sync_to_async(UserTestUtils.create_user)(username="new_user", password="new")
+        task = await sync_to_async(TaskTestUtils.create_task)(title="Test Task", owner_id=new_user.id)
+
+        with self.assertRaisesMessage(PermissionError, "User is not task owner."):
+            await adelete_task(task_uuid=task.uuid, owner_id=self.user.id)
+
+    async def test_task_deletion_records_tombstone(self):
+        task = await sync_to_async(TaskTestUtils.create_task)(title="Test Task", owner_id=self.user.id)
+
+        await adelete_task(task_uuid=task.uuid, owner_id=self.user.id)
+
+        self.assertEqual(await sync_to_async(TaskTestUtils.get_tasks_count_for_user)(owner_id=self.user.id), 0)
+        self.assertTrue(
+            await sync_to_async(TaskTestUtils.deleted_task_exists)(owner_id=self.user.id, uuid=task.uuid)
+        )
+
+
+@override_settings(TASKS_LIST_CACHE_TIMEOUT=60)
+class AsyncTasksListGenerationTestCase(BaseTaskTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    async def test_async_generation_matches_sync_generation(self):
+        generation = await aget_tasks_list_generation(self.user.id)
+        self.assertEqual(generation, await sync_to_async(get_tasks_list_generation)(self.user.id))
+
+    async def test_create_task_bumps_generation(self):
+        generation = await aget_tasks_list_generation(self.user.id)
+        await acreate_task(owner_id=self.user.id, title="Test Task", status="to_do")
+        self.assertNotEqual(await aget_tasks_list_generation(self.user.id), generation)
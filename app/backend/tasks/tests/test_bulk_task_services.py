@@ -0,0 +1,156 @@
+from django.core.exceptions import FieldError
+
+from backend.tasks.services import BulkTasksError, bulk_create_tasks, bulk_delete_tasks, bulk_update_tasks
+from backend.users.tests.utils import UserTestUtils
+
+from .test_task_services import BaseTaskTestCase
+from .utils import QueryBudgetTestUtils, TaskTestUtils
+
+
+class BulkCreateTasksTestCase(BaseTaskTestCase):
+    def test_owner_id_is_required(self):
+        with self.assertRaisesMessage(AssertionError, "Owner id is required."):
+            bulk_create_tasks(owner_id="", tasks_data=[])
+
+    def test_bulk_create_uses_a_single_insert_one_counter_update_and_one_outbox_insert(self):
+        TaskTestUtils.set_task_count(owner_id=self.user.id, status="to_do", count=0)
+        tasks_data = [{"title": f"Task {i}", "status": "to_do"} for i in range(3)]
+
+        expected_queries = ["INSERT tasks_task", "UPDATE tasks_taskcounter", "INSERT webhooks_outboxevent"]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            results = bulk_create_tasks(owner_id=self.user.id, tasks_data=tasks_data)
+
+        self.assertListEqual([result["index"] for result in results], [0, 1, 2])
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id), 3)
+        for result in results:
+            self.assertIsNotNone(TaskTestUtils.get_first_task_for_user(owner_id=self.user.id, uuid=result["task_uuid"]))
+
+    def test_atomic_bulk_create_does_not_create_any_task_on_error(self):
+        tasks_data = [{"title": "Valid", "status": "to_do"}, {"title": "Invalid", "status": "finished"}]
+
+        with self.assertRaises(BulkTasksError) as context:
+            bulk_create_tasks(owner_id=self.user.id, tasks_data=tasks_data)
+
+        self.assertEqual(len(context.exception.errors), 1)
+        self.assertEqual(context.exception.errors[0]["index"], 1)
+        self.assertIn("status", context.exception.errors[0]["error"])
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id), 0)
+
+    def test_partial_bulk_create_creates_valid_tasks(self):
+        tasks_data = [{"title": "Valid", "status": "to_do"}, {"title": "Invalid", "status": "finished"}]
+
+        results = bulk_create_tasks(owner_id=self.user.id, tasks_data=tasks_data, atomic=False)
+
+        self.assertIn("task_uuid", results[0])
+        self.assertIn("error", results[1])
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id), 1)
+
+
+class BulkUpdateTasksTestCase(BaseTaskTestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.other_user = UserTestUtils.create_user(username="new_user", password="new")
+        cls.tasks = [TaskTestUtils.create_task(title=f"Task {i}", owner_id=cls.user.id) for i in range(3)]
+        cls.other_user_task = TaskTestUtils.create_task(title="Not owned", owner_id=cls.other_user.id)
+
+    def test_bulk_update_uses_one_select_one_update_one_update_per_changed_counter_and_one_outbox_insert(self):
+        TaskTestUtils.set_task_count(owner_id=self.user.id, status="completed", count=0)
+        tasks_data = [{"uuid": task.uuid, "title": "Updated", "status": "completed"} for task in self.tasks]
+        expected_queries = [
+            "SAVEPOINT",
+            "SELECT tasks_task",
+            "UPDATE tasks_task",
+            "UPDATE tasks_taskcounter",
+            "UPDATE tasks_taskcounter",
+            "INSERT webhooks_outboxevent",
+            "RELEASE SAVEPOINT",
+        ]
+
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            results = bulk_update_tasks(owner_id=self.user.id, tasks_data=tasks_data)
+
+        self.assertListEqual([result["task_uuid"] for result in results], [str(task.uuid) for task in self.tasks])
+        self.assertEqual(
+            TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id, title="Updated", status="completed"), 3
+        )
+
+    def test_non_editable_fields_raises_field_error(self):
+        with self.assertRaisesMessage(FieldError, "Some fields cannot be updated."):
+            bulk_update_tasks(owner_id=self.user.id, tasks_data=[{"uuid": self.tasks[0].uuid, "created": None}])
+
+    def test_bulk_update_reports_every_failed_item(self):
+        tasks_data = [
+            {"uuid": self.tasks[0].uuid, "title": "Updated"},
+            {"uuid": self.other_user_task.uuid, "title": "Updated"},
+            {"uuid": "ea0ec33b-30e2-9999-9011-e35e1e2b5e0d", "title": "Updated"},
+            {"uuid": self.tasks[1].uuid, "status": "finished"},
+            {"uuid": self.tasks[0].uuid, "title": "Updated twice"},
+        ]
+
+        results = bulk_update_tasks(owner_id=self.user.id, tasks_data=tasks_data, atomic=False)
+
+        self.assertEqual(results[0]["task_uuid"], str(self.tasks[0].uuid))
+        self.assertEqual(results[1]["error"], "User is not task owner.")
+        self.assertEqual(results[2]["error"], "Task matching query does not exist.")
+        self.assertIn("status", results[3]["error"])
+        self.assertEqual(results[4]["error"], "Task uuid is duplicated.")
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id, title="Updated"), 1)
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.other_user.id, title="Updated"), 0)
+
+    def test_atomic_bulk_update_does_not_update_any_task_on_error(self):
+        tasks_data = [
+            {"uuid": self.tasks[0].uuid, "title": "Updated"},
+            {"uuid": self.other_user_task.uuid, "title": "Updated"},
+        ]
+
+        with self.assertRaises(BulkTasksError):
+            bulk_update_tasks(owner_id=self.user.id, tasks_data=tasks_data)
+
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id, title="Updated"), 0)
+
+
+class BulkDeleteTasksTestCase(BaseTaskTestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.other_user = UserTestUtils.create_user(username="new_user", password="new")
+        cls.tasks = [TaskTestUtils.create_task(title=f"Task {i}", owner_id=cls.user.id) for i in range(3)]
+        cls.other_user_task = TaskTestUtils.create_task(title="Not owned", owner_id=cls.other_user.id)
+
+    def test_bulk_delete_uses_one_select_one_delete_one_tombstones_insert_one_counter_update_and_one_outbox_insert(
+        self,
+    ):
+        expected_queries = [
+            "SAVEPOINT",
+            "SELECT tasks_task",
+            "DELETE tasks_task",
+            "INSERT tasks_deletedtask",
+            "UPDATE tasks_taskcounter",
+            "INSERT webhooks_outboxevent",
+            "RELEASE SAVEPOINT",
+        ]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            bulk_delete_tasks(owner_id=self.user.id, task_uuids=[task.uuid for task in self.tasks])
+
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id), 0)
+        for task in self.tasks:
+            self.assertTrue(TaskTestUtils.deleted_task_exists(uuid=task.uuid, owner_id=self.user.id))
+
+    def test_partial_bulk_delete_keeps_not_owned_tasks(self):
+        task_uuids = [self.tasks[0].uuid, self.other_user_task.uuid]
+
+        results = bulk_delete_tasks(owner_id=self.user.id, task_uuids=task_uuids, atomic=False)
+
+        self.assertEqual(results[0]["task_uuid"], str(self.tasks[0].uuid))
+        self.assertEqual(results[1]["error"], "User is not task owner.")
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id), 2)
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.other_user.id), 1)
+
+    def test_atomic_bulk_delete_does_not_delete_any_task_on_error(self):
+        task_uuids = [self.tasks[0].uuid, self.other_user_task.uuid]
+
+        with self.assertRaises(BulkTasksError):
+            bulk_delete_tasks(owner_id=self.user.id, task_uuids=task_uuids)
+
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id), 3)
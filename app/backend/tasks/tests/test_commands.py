@@ -0,0 +1,193 @@
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from freezegun import freeze_time
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from backend.tasks.models import Task
+from backend.tasks.services import delete_task
+from backend.users.tests.utils import UserTestUtils
+
+from .utils import TaskTestUtils
+
+
+class ExplainTaskQueriesCommandTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        TaskTestUtils.create_task(title="Test Task", owner_id=cls.user.id)
+
+    def test_prints_a_plan_for_every_filter_and_pair_of_filters(self):
+        stdout = StringIO()
+        call_command("explain_task_queries", owner_id=self.user.id, stdout=stdout)
+        self.assertEqual(stdout.getvalue().count("-- filters:"), 1 + 11 + 55 + 1)
+        self.assertIn("-- filters: none", stdout.getvalue())
+        for filters in ["search", "description", "updated_since", "created_after, created_before"]:
+            self.assertIn(f"-- filters: {filters}\n", stdout.getvalue())
+        self.assertIn("-- filters: due_after, due_before\n", stdout.getvalue())
+        self.assertIn(
+            "-- filters: title, description, search, status, created_from, created_to, created_after, "
+            "created_before, updated_since, due_after, due_before\n",
+            stdout.getvalue(),
+        )
+
+    def test_check_does_not_find_sequential_scans(self):
+        call_command("explain_task_queries", owner_id=self.user.id, check=True, stdout=StringIO())
+
+
+class BenchmarkTaskSearchCommandTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        TaskTestUtils.create_task(title="Informe trimestral", owner_id=cls.user.id)
+
+    def test_prints_timings_for_every_query(self):
+        stdout = StringIO()
+        call_command("benchmark_task_search", "informe", "cliente", repeat=1, stdout=stdout)
+        self.assertIn(f"Owner {self.user.id}", stdout.getvalue())
+        self.assertIn("'informe': icontains", stdout.getvalue())
+        self.assertIn("'cliente': icontains", stdout.getvalue())
+
+
+class PurgeDeletedTasksCommandTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+
+    def test_purges_only_old_tombstones(self):
+        old_task = TaskTestUtils.create_task(title="Old", owner_id=self.user.id)
+        recent_task = TaskTestUtils.create_task(title="Recent", owner_id=self.user.id)
+        with freeze_time("2022-12-15 12:00:00"):
+            delete_task(task_uuid=old_task.uuid, owner_id=self.user.id)
+        with freeze_time("2023-01-20 12:00:00"):
+            delete_task(task_uuid=recent_task.uuid, owner_id=self.user.id)
+
+        stdout = StringIO()
+        with freeze_time("2023-01-31 12:00:00"):
+            call_command("purge_deleted_tasks", days=30, stdout=stdout)
+
+        self.assertIn("Purged 1 deleted tasks.", stdout.getvalue())
+        self.assertFalse(TaskTestUtils.deleted_task_exists(uuid=old_task.uuid, owner_id=self.user.id))
+        self.assertTrue(TaskTestUtils.deleted_task_exists(uuid=recent_task.uuid, owner_id=self.user.id))
+
+
+class ReconcileTaskCountersCommandTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        cls.other_user = UserTestUtils.create_user(username="other_user")
+        TaskTestUtils.create_task(title="Task", owner_id=cls.user.id)
+        TaskTestUtils.create_task(title="Task", owner_id=cls.other_user.id)
+
+    def test_repairs_drifted_counters(self):
+        TaskTestUtils.set_task_count(owner_id=self.user.id, status="to_do", count=5)
+        TaskTestUtils.set_task_count(owner_id=self.other_user.id, status="to_do", count=5)
+
+        stdout = StringIO()
+        call_command("reconcile_task_counters", owner=["test_user"], stdout=stdout)
+        self.assertIn("Repaired 1 task counters of 1 owners.", stdout.getvalue())
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(owner_id=self.user.id), {"to_do": 1})
+
+        call_command("reconcile_task_counters", stdout=stdout)
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(owner_id=self.other_user.id), {"to_do": 1})
+
+    def test_unknown_owner(self):
+        with self.assertRaisesMessage(CommandError, "Some owners do not exist."):
+            call_command("reconcile_task_counters", owner=["unknown"], stdout=StringIO())
+
+
+class RunSchedulerCommandTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+
+    def test_once_fires_due_tasks(self):
+        run_at = timezone.now() - timedelta(seconds=1)
+        task = TaskTestUtils.create_task(
+            title="Task", owner_id=self.user.id, run_at=run_at, scheduled_status="completed"
+        )
+
+        stdout = StringIO()
+        call_command("run_scheduler", once=True, workers=1, stdout=stdout)
+
+        self.assertIn("Fired 1 tasks.", stdout.getvalue())
+        self.assertIn("Lateness p50", stdout.getvalue())
+        self.assertEqual(Task.objects.get(id=task.id).status, "completed")
+
+    def test_lease_must_be_longer_than_the_horizon(self):
+        with self.assertRaisesMessage(CommandError, "Lease must be longer than the horizon."):
+            call_command("run_scheduler", once=True, horizon=10, lease=5, stdout=StringIO())
+
+
+class SeedBenchmarkDataCommandTestCase(TestCase):
+    def seed(self, **options):
+        call_command("seed_benchmark_data", users=3, tasks=50, batch_size=40, seed=1, stdout=StringIO(), **options)
+
+    def test_seeds_users_with_tasks(self):
+        self.seed()
+
+        users = User.objects.filter(username__startswith="bench_user_")
+        self.assertEqual(users.count(), 3)
+        self.assertTrue(users.first().check_password("bench"))
+        for user in users:
+            self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=user.id), 50)
+            self.assertEqual(sum(TaskTestUtils.get_task_counts_for_user(owner_id=user.id).values()), 50)
+
+    def test_tasks_have_spread_dates_and_statuses(self):
+        self.seed()
+
+        tasks = Task.objects.filter(owner__username__startswith="bench_user_")
+        self.assertEqual(set(tasks.values_list("status", flat=True)), set(Task.StatusChoices.values))
+        self.assertGreater(tasks.values("created__date").distinct().count(), 10)
+        for created, last_updated in tasks.values_list("created", "last_updated"):
+            self.assertLessEqual(created, last_updated)
+
+    def test_existing_users_require_reset(self):
+        self.seed()
+
+        with self.assertRaisesMessage(CommandError, "use --reset"):
+            self.seed()
+
+        self.seed(reset=True)
+        self.assertEqual(Task.objects.filter(owner__username__startswith="bench_user_").count(), 150)
+
+    def test_copy_requires_postgresql(self):
+        with self.assertRaisesMessage(CommandError, "COPY is only available on PostgreSQL."):
+            self.seed(method="copy")
+
+
+class ImportTasksCommandTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+
+    def import_file(self, content: str, suffix: str = ".ndjson", **options) -> tuple[str, str]:
+        stdout, stderr = StringIO(), StringIO()
+        with tempfile.NamedTemporaryFile("w", suffix=suffix) as import_file:
+            import_file.write(content)
+            import_file.flush()
+            call_command("import_tasks", import_file.name, stdout=stdout, stderr=stderr, **options)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_imports_tasks_and_reports_errors(self):
+        stdout, stderr = self.import_file('{"title": "Task"}\n{"status": "to_do"}\n', owner="test_user")
+
+        self.assertIn("Imported 1 tasks, 1 failed", stdout)
+        self.assertIn("Line 2: {'title':", stderr)
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id, title="Task"), 1)
+
+    def test_unknown_owner(self):
+        with self.assertRaisesMessage(CommandError, "User 'unknown' does not exist."):
+            self.import_file('{"title": "Task"}\n', owner="unknown")
+
+    def test_format_is_required_without_extension(self):
+        with self.assertRaisesMessage(CommandError, "Format is required for files without extension."):
+            self.import_file('{"title": "Task"}\n', suffix="", owner="test_user")
+
+        stdout, _ = self.import_file("title\nTask\n", suffix="", owner="test_user", format="csv")
+        self.assertIn("Imported 1 tasks", stdout)
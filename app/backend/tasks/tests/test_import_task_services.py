@@ -0,0 +1,118 @@
+import io
+
+from mock import patch
+
+from django.core.cache import cache
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.test import override_settings
+
+from backend.tasks.services import get_import_format, import_tasks, iter_import_rows
+from backend.tasks.services.list_cache import get_tasks_list_generation
+
+from .test_task_services import BaseTaskTestCase
+from .utils import QueryBudgetTestUtils, TaskTestUtils
+
+
+class ImportFormatTestCase(BaseTaskTestCase):
+    def test_format_from_extension(self):
+        self.assertEqual(get_import_format("tasks.CSV"), "csv")
+        self.assertEqual(get_import_format("tasks.ndjson"), "ndjson")
+        self.assertEqual(get_import_format("tasks.jsonl"), "ndjson")
+        self.assertIsNone(get_import_format("tasks"))
+
+
+class ImportTasksTestCase(BaseTaskTestCase):
+    def import_content(self, content: str, import_format: str, **kwargs) -> dict:
+        rows = iter_import_rows(io.BytesIO(content.encode()), import_format)
+        return import_tasks(owner_id=self.user.id, rows=rows, use_copy=False, **kwargs)
+
+    def test_owner_id_is_required(self):
+        with self.assertRaisesMessage(AssertionError, "Owner id is required."):
+            import_tasks(owner_id="", rows=[])
+
+    def test_imports_ndjson(self):
+        content = '{"title": "First", "status": "completed"}\n\n{"title": "Second", "description": "Text"}\n'
+
+        import_result = self.import_content(content, "ndjson")
+
+        self.assertDictEqual(import_result, {"imported": 2, "failed": 0, "errors": []})
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id, status="completed"), 1)
+        self.assertIsNotNone(
+            TaskTestUtils.get_first_task_for_user(owner_id=self.user.id, title="Second", description="Text")
+        )
+
+    def test_imports_csv_ignoring_unknown_columns(self):
+        content = 'uuid,title,description,status\r\nx,"Multi\nline, title",,to_do\r\ny,Second,Text,stand_by\r\n'
+
+        import_result = self.import_content(content, "csv")
+
+        self.assertEqual(import_result["imported"], 2)
+        task = TaskTestUtils.get_first_task_for_user(owner_id=self.user.id, title="Multi\nline, title")
+        self.assertIsNone(task.description)
+        self.assertNotEqual(str(task.uuid), "x")
+
+    def test_reports_row_errors_with_line_numbers(self):
+        content = "\n".join(
+            [
+                '{"title": "Valid"}',
+                "not json",
+                '["not", "an", "object"]',
+                '{"title": "' + "x" * 101 + '"}',
+                '{"title": "Invalid status", "status": "finished"}',
+                '{"description": "Missing title"}',
+            ]
+        )
+
+        import_result = self.import_content(content, "ndjson")
+
+        self.assertEqual(import_result["imported"], 1)
+        self.assertEqual(import_result["failed"], 5)
+        self.assertListEqual([row_error["line"] for row_error in import_result["errors"]], [2, 3, 4, 5, 6])
+        self.assertListEqual(import_result["errors"][0]["error"][NON_FIELD_ERRORS], ["Invalid JSON."])
+        self.assertIn("title", import_result["errors"][2]["error"])
+        self.assertIn("status", import_result["errors"][3]["error"])
+        self.assertIn("title", import_result["errors"][4]["error"])
+
+    def test_csv_row_with_extra_values_fails(self):
+        import_result = self.import_content("title,status\nTask,to_do,extra\n", "csv")
+        self.assertEqual(import_result["errors"][0]["line"], 2)
+
+    def test_invalid_encoding_is_reported(self):
+        rows = iter_import_rows(io.BytesIO('{"title": "Café"}\n'.encode("latin-1")), "ndjson")
+        import_result = import_tasks(owner_id=self.user.id, rows=rows, use_copy=False)
+        self.assertListEqual(import_result["errors"][0]["error"][NON_FIELD_ERRORS], ["File is not UTF-8 encoded."])
+
+    @override_settings(TASKS_IMPORT_MAX_ERRORS=2)
+    def test_reported_errors_are_limited(self):
+        import_result = self.import_content("bad\n" * 5, "ndjson")
+        self.assertEqual(import_result["failed"], 5)
+        self.assertEqual(len(import_result["errors"]), 2)
+
+    def test_rows_are_inserted_in_batches(self):
+        content = "".join(f'{{"title": "Task {index}"}}\n' for index in range(5))
+
+        with patch("backend.tasks.services.import_task_services.insert_task_rows") as insert_task_rows_mock:
+            self.import_content(content, "ndjson", batch_size=2)
+
+        self.assertListEqual([len(call.args[0]) for call in insert_task_rows_mock.call_args_list], [2, 2, 1])
+
+    def test_each_batch_uses_one_insert_in_its_own_transaction(self):
+        TaskTestUtils.set_task_count(owner_id=self.user.id, status="to_do", count=0)
+        content = "".join(f'{{"title": "Task {index}"}}\n' for index in range(50))
+        batch_queries = [
+            "SAVEPOINT",
+            "INSERT tasks_task",
+            "UPDATE tasks_taskcounter",
+            "INSERT webhooks_outboxevent",
+            "RELEASE SAVEPOINT",
+        ]
+        with QueryBudgetTestUtils.assert_queries(self, batch_queries * 2):
+            self.import_content(content, "ndjson", batch_size=25)
+
+    @override_settings(TASKS_LIST_CACHE_TIMEOUT=60)
+    def test_import_bumps_tasks_list_generation(self):
+        cache.clear()
+        generation = get_tasks_list_generation(self.user.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.import_content('{"title": "Task"}\n', "ndjson")
+        self.assertNotEqual(get_tasks_list_generation(self.user.id), generation)
@@ -0,0 +1,216 @@
+from datetime import datetime, timezone as dt_timezone
+
+from mock import patch
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from backend.tasks.models import Task
+from backend.tasks.recurrence import RecurrenceRule
+from backend.tasks.services import list_tasks_for_user, update_task, update_task_occurrence
+from backend.tasks.services.recurrence_services import build_task_occurrence, get_occurrence_uuid
+from backend.users.tests.utils import UserTestUtils
+
+from .test_task_services import BaseTaskTestCase
+from .utils import QueryBudgetTestUtils, TaskTestUtils
+
+
+def utc(*args) -> datetime:
+    return datetime(*args, tzinfo=dt_timezone.utc)
+
+
+class RecurrenceRuleTestCase(SimpleTestCase):
+    START = utc(2024, 1, 31, 9, 30)
+
+    def get_occurrences(self, rule: str, window_from: datetime, window_to: datetime, start=START) -> list[datetime]:
+        return list(RecurrenceRule.parse(rule).iter_occurrences(start, window_from, window_to))
+
+    def test_invalid_rules(self):
+        for rule in [
+            "",
+            "FREQ=HOURLY",
+            "FREQ=DAILY;INTERVAL=0",
+            "FREQ=DAILY;COUNT=2;UNTIL=20240201",
+            "FREQ=DAILY;BYDAY=MO",
+            "FREQ=WEEKLY;BYDAY=XX",
+            "FREQ=DAILY;UNTIL=tomorrow",
+            "FREQ=DAILY;BYMONTH=1",
+            "FREQ=DAILY;FREQ=WEEKLY",
+        ]:
+            with self.subTest(rule=rule), self.assertRaises(ValueError):
+                RecurrenceRule.parse(rule)
+
+    def test_daily_with_interval(self):
+        occurrences = self.get_occurrences("FREQ=DAILY;INTERVAL=2", utc(2024, 2, 1), utc(2024, 2, 7))
+        self.assertListEqual(occurrences, [utc(2024, 2, 2, 9, 30), utc(2024, 2, 4, 9, 30), utc(2024, 2, 6, 9, 30)])
+
+    def test_weekly_by_day(self):
+        occurrences = self.get_occurrences("RRULE:FREQ=WEEKLY;BYDAY=MO,WE", utc(2024, 1, 29), utc(2024, 2, 8))
+        # The 29th is before the start, the 31st is the start itself.
+        self.assertListEqual(occurrences, [utc(2024, 1, 31, 9, 30), utc(2024, 2, 5, 9, 30), utc(2024, 2, 7, 9, 30)])
+
+    def test_monthly_skips_months_without_the_day(self):
+        occurrences = self.get_occurrences("FREQ=MONTHLY", utc(2024, 1, 1), utc(2024, 6, 1))
+        self.assertListEqual(occurrences, [utc(2024, 1, 31, 9, 30), utc(2024, 3, 31, 9, 30), utc(2024, 5, 31, 9, 30)])
+
+    def test_count_and_until_end_the_rule(self):
+        window = (utc(2024, 1, 1), utc(2025, 1, 1))
+        self.assertEqual(len(self.get_occurrences("FREQ=DAILY;COUNT=3", *window)), 3)
+        self.assertEqual(len(self.get_occurrences("FREQ=DAILY;UNTIL=20240202", *window)), 3)
+        self.assertEqual(len(self.get_occurrences("FREQ=DAILY;UNTIL=20240202T093000Z", *window)), 3)
+        self.assertEqual(len(self.get_occurrences("FREQ=DAILY;UNTIL=20240202T093000Z", utc(2024, 2, 2), window[1])), 1)
+
+    def test_count_is_numbered_from_the_start(self):
+        occurrences = self.get_occurrences("FREQ=WEEKLY;BYDAY=MO,WE;COUNT=3", utc(2024, 2, 6), utc(2024, 3, 1))
+        self.assertListEqual(occurrences, [utc(2024, 2, 7, 9, 30)])
+
+    def test_window_far_from_the_start_gives_the_same_occurrences(self):
+        window = (utc(2031, 3, 1), utc(2031, 4, 1))
+        for rule in ["FREQ=DAILY;INTERVAL=3", "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,SU", "FREQ=MONTHLY;INTERVAL=5"]:
+            with self.subTest(rule=rule):
+                every_occurrence = self.get_occurrences(rule, self.START, window[1])
+                window_occurrences = [occurrence for occurrence in every_occurrence if occurrence >= window[0]]
+                self.assertListEqual(self.get_occurrences(rule, *window), window_occurrences)
+
+    def test_occurrences_keep_their_local_hour_across_dst(self):
+        with timezone.override("Europe/Madrid"):
+            occurrences = self.get_occurrences(
+                "FREQ=DAILY", utc(2024, 3, 30), utc(2024, 4, 1), start=utc(2024, 3, 20, 8, 0)
+            )
+        self.assertListEqual(occurrences, [utc(2024, 3, 30, 8, 0), utc(2024, 3, 31, 7, 0)])
+
+    def test_model_validates_the_rule(self):
+        with self.assertRaises(ValidationError):
+            Task(recurrence="FREQ=YEARLY").clean_fields(exclude=["owner", "title"])
+
+
+class TaskOccurrencesTestCase(BaseTaskTestCase):
+    WINDOW = {"due_after": "2024-02-01T00:00:00Z", "due_before": "2024-02-04T00:00:00Z"}
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.template = TaskTestUtils.create_task(
+            title="Chore", owner_id=cls.user.id, due_at=utc(2024, 1, 1, 8), recurrence="FREQ=DAILY"
+        )
+        cls.task = TaskTestUtils.create_task(title="Task", owner_id=cls.user.id, due_at=utc(2024, 2, 2, 12))
+        TaskTestUtils.create_task(title="Task", owner_id=cls.user.id, due_at=utc(2024, 3, 1))
+        TaskTestUtils.create_task(title="Task", owner_id=cls.user.id)
+
+    def list_tasks(self, **query_params) -> list[Task]:
+        return list(list_tasks_for_user(user_id=self.user.id, query_params=query_params, expand_occurrences=True))
+
+    def test_window_lists_due_tasks_and_occurrences_in_due_order(self):
+        tasks = self.list_tasks(**self.WINDOW)
+
+        self.assertListEqual(
+            [(task.title, task.due_at) for task in tasks],
+            [
+                ("Chore", utc(2024, 2, 1, 8)),
+                ("Chore", utc(2024, 2, 2, 8)),
+                ("Task", utc(2024, 2, 2, 12)),
+                ("Chore", utc(2024, 2, 3, 8)),
+            ],
+        )
+        self.assertEqual(tasks[0].template_uuid, self.template.uuid)
+        self.assertEqual(tasks[0].uuid, get_occurrence_uuid(self.template.uuid, utc(2024, 2, 1, 8)))
+        self.assertEqual(Task.objects.filter(owner_id=self.user.id).count(), 4)
+
+    def test_occurrences_are_not_saved_or_listed_without_a_window(self):
+        tasks = self.list_tasks(due_after=self.WINDOW["due_after"])
+        self.assertListEqual([task.due_at for task in tasks], [utc(2024, 3, 1), utc(2024, 2, 2, 12)])
+        self.assertEqual(len(self.list_tasks()), 4)
+
+    def test_other_filters_apply_to_the_occurrences(self):
+        self.assertListEqual([task.title for task in self.list_tasks(title="Chore", **self.WINDOW)], ["Chore"] * 3)
+        self.assertListEqual([task.title for task in self.list_tasks(status="completed", **self.WINDOW)], [])
+
+    def test_listing_a_window_queries_templates_saved_occurrences_and_tasks(self):
+        expected_queries = ["SELECT tasks_task", "SELECT tasks_task", "SELECT tasks_task"]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            self.list_tasks(**self.WINDOW)
+
+    def test_updating_an_occurrence_saves_it_once(self):
+        occurrence_at = utc(2024, 2, 2, 8)
+
+        task_uuid = update_task_occurrence(
+            template_uuid=self.template.uuid, owner_id=self.user.id, occurrence_at=occurrence_at, status="completed"
+        )
+        self.assertEqual(
+            update_task_occurrence(
+                template_uuid=self.template.uuid, owner_id=self.user.id, occurrence_at=occurrence_at, title="Moved"
+            ),
+            task_uuid,
+        )
+
+        task = Task.objects.get(uuid=task_uuid)
+        self.assertEqual((task.title, task.status, task.due_at), ("Moved", "completed", occurrence_at))
+        self.assertIsNone(task.recurrence)
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"to_do": 4, "completed": 1})
+        tasks = self.list_tasks(**self.WINDOW)
+        self.assertEqual(len(tasks), 4)
+        self.assertEqual(tasks[1].uuid, task_uuid)
+
+    def test_saved_occurrence_moved_out_of_the_window_is_not_listed_again(self):
+        task_uuid = update_task_occurrence(
+            template_uuid=self.template.uuid, owner_id=self.user.id, occurrence_at=utc(2024, 2, 2, 8)
+        )
+        update_task(task_uuid=task_uuid, owner_id=self.user.id, due_at=utc(2024, 5, 1))
+
+        self.assertEqual(len(self.list_tasks(**self.WINDOW)), 3)
+
+    def test_update_rejects_dates_that_are_not_occurrences(self):
+        for template, occurrence_at in [(self.template, utc(2024, 2, 2, 9)), (self.task, utc(2024, 2, 2, 12))]:
+            with self.subTest(template=template.title), self.assertRaises(Task.DoesNotExist):
+                update_task_occurrence(template_uuid=template.uuid, owner_id=self.user.id, occurrence_at=occurrence_at)
+
+        other_user = UserTestUtils.create_user(username="new_user", password="new")
+        with self.assertRaises(PermissionError):
+            update_task_occurrence(
+                template_uuid=self.template.uuid, owner_id=other_user.id, occurrence_at=utc(2024, 2, 2, 8)
+            )
+
+    def test_failed_update_does_not_save_the_occurrence(self):
+        with self.assertRaises(ValidationError):
+            update_task_occurrence(
+                template_uuid=self.template.uuid,
+                owner_id=self.user.id,
+                occurrence_at=utc(2024, 2, 2, 8),
+                status="finished",
+            )
+
+        self.assertFalse(Task.objects.filter(template_uuid=self.template.uuid).exists())
+
+    def test_occurrences_per_template_are_limited(self):
+        with self.settings(TASKS_RECURRENCE_MAX_OCCURRENCES=2):
+            tasks = self.list_tasks(**self.WINDOW)
+        self.assertListEqual([task.title for task in tasks], ["Chore", "Chore", "Task"])
+
+    def test_pages_only_build_the_occurrences_up_to_their_end(self):
+        tasks = list_tasks_for_user(
+            user_id=self.user.id,
+            query_params={"due_after": "2024-02-01T00:00:00Z", "due_before": "2025-02-01T00:00:00Z"},
+            expand_occurrences=True,
+        )
+
+        with patch(
+            "backend.tasks.services.recurrence_services.build_task_occurrence", wraps=build_task_occurrence
+        ) as mock_build_task_occurrence:
+            page = tasks[2:4]
+            self.assertEqual(tasks.count(), 368)
+
+        self.assertListEqual([task.due_at for task in page], [utc(2024, 2, 2, 12), utc(2024, 2, 3, 8)])
+        self.assertEqual(mock_build_task_occurrence.call_count, 3)
+
+    def test_windows_longer_than_the_maximum_are_rejected(self):
+        with self.settings(TASKS_RECURRENCE_MAX_WINDOW_DAYS=2), self.assertRaises(ValidationError):
+            self.list_tasks(**self.WINDOW)
+
+    def test_invalid_window_lists_without_occurrences(self):
+        tasks = list_tasks_for_user(
+            user_id=self.user.id,
+            query_params={"due_after": self.WINDOW["due_before"], "due_before": self.WINDOW["due_after"]},
+            expand_occurrences=True,
+        )
+        self.assertListEqual(list(tasks), [])
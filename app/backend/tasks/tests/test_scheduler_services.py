@@ -0,0 +1,220 @@
+from datetime import timedelta
+from uuid import uuid4
+
+from mock import patch
+
+from django.utils import timezone
+
+from backend.tasks.models import Task
+from backend.tasks.services import (
+    TaskScheduler,
+    bulk_update_tasks,
+    claim_due_tasks,
+    create_task,
+    fire_scheduled_tasks,
+    release_claimed_tasks,
+    update_task,
+)
+from backend.users.tests.utils import UserTestUtils
+
+from .test_task_services import BaseTaskTestCase
+from .utils import TaskTestUtils
+
+
+class SchedulerTestCase(BaseTaskTestCase):
+    LEASE = timedelta(seconds=30)
+
+    def setUp(self) -> None:
+        self.now = timezone.now()
+        self.claim_token = uuid4()
+
+    def create_scheduled_task(self, seconds: float, **kwargs) -> Task:
+        return TaskTestUtils.create_task(
+            title="Scheduled", owner_id=self.user.id, run_at=self.now + timedelta(seconds=seconds), **kwargs
+        )
+
+    def get_task(self, task: Task) -> Task:
+        return Task.objects.get(id=task.id)
+
+
+class ClaimDueTasksTestCase(SchedulerTestCase):
+    def test_claims_pending_tasks_up_to_the_horizon_in_run_order(self):
+        later_task = self.create_scheduled_task(-10)
+        first_task = self.create_scheduled_task(-20)
+        self.create_scheduled_task(60)
+        TaskTestUtils.create_task(title="Not scheduled", owner_id=self.user.id)
+        self.create_scheduled_task(-30, fired_at=self.now)
+
+        due_tasks = claim_due_tasks(self.claim_token, self.now, self.LEASE, limit=10)
+
+        self.assertListEqual([task_id for task_id, _ in due_tasks], [first_task.id, later_task.id])
+        self.assertEqual(self.get_task(first_task).claim_token, self.claim_token)
+
+    def test_claimed_tasks_are_not_claimed_again_until_the_lease_expires(self):
+        task = self.create_scheduled_task(-10)
+        claim_due_tasks(self.claim_token, self.now, self.LEASE, limit=10)
+
+        self.assertListEqual(claim_due_tasks(uuid4(), self.now, self.LEASE, limit=10), [])
+
+        Task.objects.filter(id=task.id).update(claimed_until=self.now - timedelta(seconds=1))
+        self.assertListEqual(claim_due_tasks(uuid4(), self.now, self.LEASE, limit=10), [(task.id, task.run_at)])
+
+    def test_claims_are_limited(self):
+        for seconds in range(-5, 0):
+            self.create_scheduled_task(seconds)
+
+        self.assertEqual(len(claim_due_tasks(self.claim_token, self.now, self.LEASE, limit=3)), 3)
+        self.assertEqual(len(claim_due_tasks(self.claim_token, self.now, self.LEASE, limit=3)), 2)
+
+    def test_release_gives_back_unfired_claims(self):
+        task = self.create_scheduled_task(-10)
+        claim_due_tasks(self.claim_token, self.now, self.LEASE, limit=10)
+
+        self.assertEqual(release_claimed_tasks(self.claim_token), 1)
+
+        self.assertIsNone(self.get_task(task).claim_token)
+        self.assertEqual(len(claim_due_tasks(uuid4(), self.now, self.LEASE, limit=10)), 1)
+
+
+class FireScheduledTasksTestCase(SchedulerTestCase):
+    def test_fires_status_transitions_and_keeps_counters(self):
+        task = self.create_scheduled_task(-10, scheduled_status="completed")
+        claim_due_tasks(self.claim_token, self.now, self.LEASE, limit=10)
+
+        fired_tasks = fire_scheduled_tasks(self.claim_token, [task.id])
+
+        self.assertListEqual([fired_task.id for fired_task in fired_tasks], [task.id])
+        task = self.get_task(task)
+        self.assertEqual(task.status, "completed")
+        self.assertIsNotNone(task.fired_at)
+        self.assertIsNone(task.claim_token)
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"completed": 1})
+
+    def test_fires_reminders_without_changing_the_status(self):
+        task = self.create_scheduled_task(-10)
+        claim_due_tasks(self.claim_token, self.now, self.LEASE, limit=10)
+
+        fire_scheduled_tasks(self.claim_token, [task.id])
+
+        task = self.get_task(task)
+        self.assertEqual(task.status, "to_do")
+        self.assertIsNotNone(task.fired_at)
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"to_do": 1})
+
+    def test_tasks_are_fired_only_once(self):
+        task = self.create_scheduled_task(-10, scheduled_status="in_progress")
+        claim_due_tasks(self.claim_token, self.now, self.LEASE, limit=10)
+
+        self.assertListEqual(fire_scheduled_tasks(uuid4(), [task.id]), [])
+        self.assertEqual(len(fire_scheduled_tasks(self.claim_token, [task.id])), 1)
+        self.assertListEqual(fire_scheduled_tasks(self.claim_token, [task.id]), [])
+
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"in_progress": 1})
+
+    def test_rescheduling_arms_the_task_again(self):
+        task = create_task(owner_id=self.user.id, title="Scheduled", run_at=self.now - timedelta(seconds=10))
+        other_task = create_task(owner_id=self.user.id, title="Scheduled", run_at=self.now - timedelta(seconds=10))
+        claim_due_tasks(self.claim_token, self.now, self.LEASE, limit=10)
+        fire_scheduled_tasks(self.claim_token, [task.id])
+
+        update_task(task_uuid=task.uuid, owner_id=self.user.id, run_at=self.now - timedelta(seconds=5))
+        bulk_update_tasks(
+            owner_id=self.user.id, tasks_data=[{"uuid": other_task.uuid, "scheduled_status": "completed"}]
+        )
+
+        for task in [self.get_task(task), self.get_task(other_task)]:
+            self.assertIsNone(task.fired_at)
+            self.assertIsNone(task.claim_token)
+        self.assertEqual(len(claim_due_tasks(uuid4(), self.now, self.LEASE, limit=10)), 2)
+
+    def test_resending_the_same_schedule_does_not_arm_the_task_again(self):
+        run_at = self.now - timedelta(seconds=10)
+        task = create_task(owner_id=self.user.id, title="Scheduled", run_at=run_at, scheduled_status="completed")
+        other_task = create_task(owner_id=self.user.id, title="Scheduled", run_at=run_at)
+        claim_due_tasks(self.claim_token, self.now, self.LEASE, limit=10)
+        fire_scheduled_tasks(self.claim_token, [task.id, other_task.id])
+
+        update_task(
+            task_uuid=task.uuid, owner_id=self.user.id, title="Renamed", run_at=run_at, scheduled_status="completed"
+        )
+        bulk_update_tasks(
+            owner_id=self.user.id,
+            tasks_data=[
+                {"uuid": task.uuid, "run_at": run_at},
+                {"uuid": other_task.uuid, "run_at": run_at, "scheduled_status": None},
+            ],
+        )
+
+        for task in [self.get_task(task), self.get_task(other_task)]:
+            self.assertIsNotNone(task.fired_at)
+        self.assertListEqual(claim_due_tasks(uuid4(), self.now, self.LEASE, limit=10), [])
+
+    def test_updates_without_schedule_keep_the_claim(self):
+        task = self.create_scheduled_task(-10)
+        claim_due_tasks(self.claim_token, self.now, self.LEASE, limit=10)
+
+        update_task(task_uuid=task.uuid, owner_id=self.user.id, title="Updated")
+
+        self.assertEqual(self.get_task(task).claim_token, self.claim_token)
+
+
+class TaskSchedulerTestCase(SchedulerTestCase):
+    def test_run_once_fires_due_tasks_and_releases_the_rest(self):
+        other_user = UserTestUtils.create_user(username="new_user", password="new")
+        due_tasks = [self.create_scheduled_task(-seconds, scheduled_status="completed") for seconds in range(1, 6)]
+        due_tasks.append(
+            TaskTestUtils.create_task(title="Scheduled", owner_id=other_user.id, run_at=self.now - timedelta(seconds=1))
+        )
+        upcoming_task = self.create_scheduled_task(2)
+
+        scheduler = TaskScheduler(batch_size=2, horizon=5, lease=30, workers=1)
+
+        self.assertEqual(scheduler.run_once(), 6)
+        self.assertEqual(Task.objects.filter(id__in=[task.id for task in due_tasks], fired_at__isnull=False).count(), 6)
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"completed": 5, "to_do": 1})
+        upcoming_task = self.get_task(upcoming_task)
+        self.assertIsNone(upcoming_task.fired_at)
+        self.assertIsNone(upcoming_task.claim_token)
+        self.assertEqual(len(scheduler.lateness), 6)
+        self.assertTrue(all(lateness >= 0 for lateness in scheduler.lateness))
+
+    def test_pending_tasks_are_popped_in_run_order_and_batches(self):
+        scheduler = TaskScheduler(batch_size=2, horizon=5, lease=30, workers=1)
+        for task_id, seconds in [(1, -1), (2, -3), (3, 10), (4, -2)]:
+            scheduler.pending.append((self.now + timedelta(seconds=seconds), task_id))
+        scheduler.pending.sort()
+
+        self.assertListEqual(scheduler.pop_due_batches(), [[2, 4], [1]])
+        self.assertListEqual([task_id for _, task_id in scheduler.pending], [3])
+        self.assertGreater(scheduler.seconds_to_next_run(), 0)
+
+    @patch("backend.tasks.services.scheduler_services.close_old_connections")
+    def test_worker_threads_close_old_connections_around_each_batch(self, mock_close_old_connections):
+        for seconds in range(1, 4):
+            self.create_scheduled_task(-seconds)
+        scheduler = TaskScheduler(batch_size=1, horizon=5, lease=30, workers=2)
+
+        with patch.object(scheduler, "fire", return_value=1) as mock_fire:
+            scheduler.run_once()
+
+        self.assertEqual(mock_fire.call_count, 3)
+        self.assertEqual(mock_close_old_connections.call_count, 6)
+
+    @patch("backend.tasks.services.scheduler_services.close_old_connections")
+    def test_run_fires_until_stopped(self, mock_close_old_connections):
+        task = self.create_scheduled_task(-1)
+        upcoming_task = self.create_scheduled_task(3)
+        scheduler = TaskScheduler(batch_size=10, horizon=5, lease=30, workers=1)
+        claim = scheduler.claim
+
+        def claim_and_stop():
+            claim()
+            scheduler.stop()
+
+        with patch.object(scheduler, "claim", side_effect=claim_and_stop):
+            scheduler.run()
+
+        self.assertEqual(scheduler.fired_count, 1)
+        self.assertIsNotNone(self.get_task(task).fired_at)
+        self.assertIsNone(self.get_task(upcoming_task).claim_token)
+        mock_close_old_connections.assert_called()
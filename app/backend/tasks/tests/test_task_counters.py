@@ -0,0 +1,168 @@
+import io
+
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
+from mock import patch
+
+from backend.tasks.models import TaskCounter
+from backend.tasks.services import (
+    acreate_task,
+    aget_tasks_count_for_user,
+    aupdate_task,
+    bulk_create_tasks,
+    bulk_delete_tasks,
+    bulk_update_tasks,
+    create_task,
+    delete_task,
+    get_task_summary_for_user,
+    get_tasks_count_for_user,
+    import_tasks,
+    iter_import_rows,
+    reconcile_task_counters,
+    update_task,
+)
+from backend.users.tests.utils import UserTestUtils
+
+from .test_task_services import BaseTaskTestCase
+from .utils import TaskTestUtils
+
+
+class TaskCountersTestCase(BaseTaskTestCase):
+    def test_create_task_increments_its_status_counter(self):
+        create_task(owner_id=self.user.id, title="Test Task")
+        create_task(owner_id=self.user.id, title="Test Task", status="completed")
+        create_task(owner_id=self.user.id, title="Test Task", status="completed")
+
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"to_do": 1, "completed": 2})
+
+    def test_update_task_moves_the_task_between_counters(self):
+        task = create_task(owner_id=self.user.id, title="Test Task")
+
+        update_task(task_uuid=task.uuid, owner_id=self.user.id, status="in_progress")
+        update_task(task_uuid=task.uuid, owner_id=self.user.id, status="in_progress", title="Test update")
+        update_task(task_uuid=task.uuid, owner_id=self.user.id, title="Test update")
+
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"in_progress": 1})
+
+    def test_failed_update_does_not_change_counters(self):
+        create_task(owner_id=self.user.id, title="Test Task")
+        other_user = UserTestUtils.create_user(username="new_user", password="new")
+        other_task = create_task(owner_id=other_user.id, title="Test Task")
+
+        with self.assertRaises(PermissionError):
+            update_task(task_uuid=other_task.uuid, owner_id=self.user.id, status="completed")
+
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"to_do": 1})
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(other_user.id), {"to_do": 1})
+
+    def test_delete_task_decrements_its_status_counter(self):
+        task = create_task(owner_id=self.user.id, title="Test Task", status="stand_by")
+        create_task(owner_id=self.user.id, title="Test Task", status="stand_by")
+
+        delete_task(task_uuid=task.uuid, owner_id=self.user.id)
+        with self.assertRaises(task.DoesNotExist):
+            delete_task(task_uuid=task.uuid, owner_id=self.user.id)
+
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"stand_by": 1})
+
+    def test_counter_changes_roll_back_with_the_task(self):
+        with patch("backend.tasks.services.task_services.add_to_task_counters", side_effect=IntegrityError):
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                create_task(owner_id=self.user.id, title="Test Task")
+
+        self.assertEqual(TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id), 0)
+
+    def test_bulk_services_keep_counters(self):
+        results = bulk_create_tasks(
+            owner_id=self.user.id, tasks_data=[{"title": "Task", "status": status} for status in ["to_do"] * 3]
+        )
+        task_uuids = [result["task_uuid"] for result in results]
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"to_do": 3})
+
+        bulk_update_tasks(owner_id=self.user.id, tasks_data=[{"uuid": task_uuids[0], "status": "completed"}])
+        bulk_update_tasks(owner_id=self.user.id, tasks_data=[{"uuid": task_uuids[1], "title": "Updated"}])
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"to_do": 2, "completed": 1})
+
+        bulk_delete_tasks(owner_id=self.user.id, task_uuids=task_uuids[:2])
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"to_do": 1})
+
+    def test_bulk_update_ignores_failed_tasks(self):
+        task = create_task(owner_id=self.user.id, title="Test Task")
+
+        bulk_update_tasks(
+            owner_id=self.user.id,
+            tasks_data=[{"uuid": task.uuid, "status": "finished"}, {"uuid": self.UUID, "status": "completed"}],
+            atomic=False,
+        )
+
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"to_do": 1})
+
+    def test_import_keeps_counters(self):
+        content = b'{"title": "Task"}\n{"title": "Task", "status": "completed"}\n{"status": "completed"}\n'
+
+        import_tasks(owner_id=self.user.id, rows=iter_import_rows(io.BytesIO(content), "ndjson"), use_copy=False)
+
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"to_do": 1, "completed": 1})
+
+    async def test_async_services_keep_counters(self):
+        task = await acreate_task(owner_id=self.user.id, title="Test Task")
+        await aupdate_task(task_uuid=task.uuid, owner_id=self.user.id, status="completed")
+
+        counts = await sync_to_async(TaskTestUtils.get_task_counts_for_user)(self.user.id)
+        self.assertDictEqual(counts, {"completed": 1})
+        self.assertEqual(await aget_tasks_count_for_user(self.user.id, {"status": "completed"}), 1)
+
+
+class TaskCountersQueriesTestCase(BaseTaskTestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        TaskTestUtils.bulk_create_tasks(owner_id=cls.user.id, count=3)
+        TaskTestUtils.bulk_create_tasks(owner_id=cls.user.id, count=2, status="completed")
+
+    def test_summary_has_every_status_and_the_total(self):
+        self.assertDictEqual(
+            get_task_summary_for_user(self.user.id),
+            {"total": 5, "to_do": 3, "in_progress": 0, "completed": 2, "stand_by": 0},
+        )
+
+    def test_tasks_count_for_unfiltered_and_status_queries(self):
+        self.assertEqual(get_tasks_count_for_user(self.user.id), 5)
+        self.assertEqual(get_tasks_count_for_user(self.user.id, {"status": "completed", "page": "2"}), 2)
+        self.assertEqual(get_tasks_count_for_user(self.user.id, {"status": "in_progress"}), 0)
+        self.assertEqual(get_tasks_count_for_user(self.user.id, {"status": "", "title": ""}), 5)
+
+    def test_tasks_count_is_not_known_for_other_filters(self):
+        self.assertIsNone(get_tasks_count_for_user(self.user.id, {"title": "Task"}))
+        self.assertIsNone(get_tasks_count_for_user(self.user.id, {"status": "completed", "search": "Task"}))
+        self.assertIsNone(get_tasks_count_for_user(self.user.id, {"status": "finished"}))
+
+
+class ReconcileTaskCountersTestCase(BaseTaskTestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.other_user = UserTestUtils.create_user(username="new_user", password="new")
+        TaskTestUtils.bulk_create_tasks(owner_id=cls.user.id, count=3)
+        TaskTestUtils.bulk_create_tasks(owner_id=cls.other_user.id, count=2, status="completed")
+
+    def test_consistent_counters_are_not_repaired(self):
+        self.assertEqual(reconcile_task_counters(), (0, 0))
+
+    def test_drifted_counters_are_repaired(self):
+        TaskTestUtils.set_task_count(owner_id=self.user.id, status="to_do", count=7)
+        TaskTestUtils.set_task_count(owner_id=self.user.id, status="stand_by", count=-1)
+        TaskCounter.objects.filter(owner_id=self.other_user.id).delete()
+
+        self.assertEqual(reconcile_task_counters(), (3, 2))
+
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.user.id), {"to_do": 3})
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.other_user.id), {"completed": 2})
+
+    def test_only_given_owners_are_reconciled(self):
+        TaskTestUtils.set_task_count(owner_id=self.user.id, status="to_do", count=7)
+        TaskTestUtils.set_task_count(owner_id=self.other_user.id, status="completed", count=7)
+
+        self.assertEqual(reconcile_task_counters([self.user.id]), (1, 1))
+
+        self.assertDictEqual(TaskTestUtils.get_task_counts_for_user(self.other_user.id), {"completed": 7})
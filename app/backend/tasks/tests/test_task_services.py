@@ -1,12 +1,28 @@
+from itertools import combinations
+
+from freezegun import freeze_time
+
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist, ValidationError, FieldError
 from django.db.models import QuerySet
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from backend.tasks.services import create_task, list_tasks_for_user, delete_task, update_task
+from backend.tasks.services import (
+    create_task,
+    list_tasks_for_user,
+    list_task_changes_for_user,
+    delete_task,
+    update_task,
+)
+from backend.tasks.services.task_services import get_task_for_owner
+from backend.tasks.services.list_cache import get_tasks_list_generation
+from backend.tasks.services.search import ContainsSearchBackend, get_search_backend
 from backend.users.tests.utils import UserTestUtils
 
-from .utils import TaskTestUtils
+from .utils import QueryBudgetTestUtils, TaskTestUtils
 
 
 class BaseTaskTestCase(TestCase):
@@ -64,6 +80,194 @@ class ListTasksForUserTestCase(BaseTaskTestCase):
         self.assertListEqual(expected_tasks_ids_for_user, first_user_tasks_ids_list)
 
 
+class TaskProjectionTestCase(BaseTaskTestCase):
+    fields = ["uuid", "title", "created", "last_updated", "status"]
+
+    def get_selected_columns(self, context) -> list[str]:
+        select_clause = context.captured_queries[0]["sql"].split(" FROM ")[0]
+        return [column.strip().split(".")[-1].strip('"') for column in select_clause[len("SELECT ") :].split(",")]
+
+    def test_list_tasks_selects_only_projected_columns(self):
+        TaskTestUtils.create_task(title="Test Task", description="Long description", owner_id=self.user.id)
+
+        with CaptureQueriesContext(connection) as context:
+            tasks = list(list_tasks_for_user(user_id=self.user.id, fields=self.fields))
+
+        self.assertCountEqual(self.get_selected_columns(context), ["id", *self.fields])
+        self.assertEqual(tasks[0].title, "Test Task")
+
+    def test_list_tasks_without_projection_selects_every_column(self):
+        with CaptureQueriesContext(connection) as context:
+            list(list_tasks_for_user(user_id=self.user.id))
+
+        self.assertIn("description", self.get_selected_columns(context))
+
+    def test_deferred_description_is_loaded_on_access(self):
+        TaskTestUtils.create_task(title="Test Task", description="Long description", owner_id=self.user.id)
+        task = list_tasks_for_user(user_id=self.user.id, fields=self.fields).first()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(task.description, "Long description")
+
+    def test_get_task_for_owner_selects_only_projected_columns(self):
+        task = TaskTestUtils.create_task(title="Test Task", owner_id=self.user.id)
+
+        with CaptureQueriesContext(connection) as context:
+            retrieved_task = get_task_for_owner(task_uuid=task.uuid, owner_id=self.user.id, fields=["uuid", "status"])
+
+        self.assertCountEqual(self.get_selected_columns(context), ["id", "uuid", "status"])
+        self.assertEqual(retrieved_task, task)
+
+    def test_get_task_for_owner_not_owner_raises_permission_error(self):
+        new_user = UserTestUtils.create_user(username="new_user", password="new")
+        task = TaskTestUtils.create_task(title="Test Task", owner_id=new_user.id)
+
+        with self.assertRaisesMessage(PermissionError, "User is not task owner."):
+            get_task_for_owner(task_uuid=task.uuid, owner_id=self.user.id, fields=["uuid"])
+
+
+class ListTasksForUserDateFiltersTestCase(BaseTaskTestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        with freeze_time("2023-01-01 23:59:59"):
+            TaskTestUtils.create_task(id=1, title="Last second of new year", owner_id=cls.user.id)
+        with freeze_time("2023-01-02 00:00:00"):
+            TaskTestUtils.create_task(id=2, title="First second of second day", owner_id=cls.user.id)
+        with freeze_time("2023-01-03 12:00:00"):
+            TaskTestUtils.create_task(id=3, title="Third day", owner_id=cls.user.id)
+
+    def get_task_ids(self, query_params: dict) -> list[int]:
+        tasks_list = list_tasks_for_user(user_id=self.user.id, query_params=query_params)
+        return sorted(tasks_list.values_list("id", flat=True))
+
+    def test_created_from_and_created_to_include_whole_days(self):
+        self.assertListEqual(self.get_task_ids({"created_from": "2023-01-02"}), [2, 3])
+        self.assertListEqual(self.get_task_ids({"created_to": "2023-01-01"}), [1])
+        self.assertListEqual(self.get_task_ids({"created_from": "2023-01-02", "created_to": "2023-01-02"}), [2])
+
+    def test_date_filters_respect_active_timezone(self):
+        with timezone.override("Europe/Madrid"):
+            self.assertListEqual(self.get_task_ids({"created_to": "2023-01-01"}), [])
+            self.assertListEqual(self.get_task_ids({"created_from": "2023-01-02", "created_to": "2023-01-02"}), [1, 2])
+
+    def test_date_filters_do_not_cast_created_column(self):
+        tasks_list = list_tasks_for_user(
+            user_id=self.user.id, query_params={"created_from": "2023-01-02", "created_to": "2023-01-02"}
+        )
+        sql = str(tasks_list.query)
+        self.assertIn('"tasks_task"."created" >= ', sql)
+        self.assertIn('"tasks_task"."created" < ', sql)
+
+    def test_created_after_and_created_before(self):
+        self.assertListEqual(self.get_task_ids({"created_after": "2023-01-01T23:59:59Z"}), [1, 2, 3])
+        self.assertListEqual(self.get_task_ids({"created_before": "2023-01-02T00:00:00Z"}), [1])
+        self.assertListEqual(
+            self.get_task_ids({"created_after": "2023-01-02T00:00:00Z", "created_before": "2023-01-03T12:00:00Z"}),
+            [2],
+        )
+
+    def test_updated_since(self):
+        with freeze_time("2023-02-01 10:00:00"):
+            TaskTestUtils.update_task(task_id=1, title="Updated")
+        self.assertListEqual(self.get_task_ids({"updated_since": "2023-02-01T10:00:00Z"}), [1])
+
+
+class ListTasksForUserSearchTestCase(BaseTaskTestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        TaskTestUtils.create_task(id=1, title="Informe trimestral", description="Revisar cuentas", owner_id=cls.user.id)
+        TaskTestUtils.create_task(id=2, title="Llamar al cliente", description="Enviar informe", owner_id=cls.user.id)
+        TaskTestUtils.create_task(id=3, title="Comprar material", owner_id=cls.user.id)
+
+    def get_task_ids(self, query_params: dict) -> list[int]:
+        tasks_list = list_tasks_for_user(user_id=self.user.id, query_params=query_params)
+        return sorted(tasks_list.values_list("id", flat=True))
+
+    def test_search_matches_title_and_description(self):
+        self.assertListEqual(self.get_task_ids({"search": "informe"}), [1, 2])
+
+    def test_search_requires_every_term(self):
+        self.assertListEqual(self.get_task_ids({"search": "informe cliente"}), [2])
+
+    def test_description_filter(self):
+        self.assertListEqual(self.get_task_ids({"description": "cuentas"}), [1])
+
+    @override_settings(TASKS_SEARCH_BACKEND="backend.tasks.services.search.ContainsSearchBackend")
+    def test_search_backend_is_configurable(self):
+        self.assertIsInstance(get_search_backend(), ContainsSearchBackend)
+        self.assertListEqual(self.get_task_ids({"search": "MATERIAL"}), [3])
+
+
+@override_settings(TASKS_LIST_CACHE_TIMEOUT=60)
+class TasksListGenerationTestCase(BaseTaskTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def assertGenerationChanges(self, service, **kwargs):
+        generation = get_tasks_list_generation(self.user.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            service(owner_id=self.user.id, **kwargs)
+        self.assertNotEqual(get_tasks_list_generation(self.user.id), generation)
+
+    def test_create_task_bumps_generation(self):
+        self.assertGenerationChanges(create_task, title="Test Task", status="to_do")
+
+    def test_update_task_bumps_generation(self):
+        task = TaskTestUtils.create_task(title="Test Task", owner_id=self.user.id)
+        self.assertGenerationChanges(update_task, task_uuid=task.uuid, title="Test update")
+
+    def test_delete_task_bumps_generation(self):
+        task = TaskTestUtils.create_task(title="Test Task", owner_id=self.user.id)
+        self.assertGenerationChanges(delete_task, task_uuid=task.uuid)
+
+    def test_failed_update_does_not_bump_generation(self):
+        generation = get_tasks_list_generation(self.user.id)
+        with self.captureOnCommitCallbacks(execute=True), self.assertRaises(ObjectDoesNotExist):
+            update_task(task_uuid=self.UUID, owner_id=self.user.id, title="Test update")
+        self.assertEqual(get_tasks_list_generation(self.user.id), generation)
+
+
+class ListTaskChangesForUserTestCase(BaseTaskTestCase):
+    def test_user_id_is_required(self):
+        with self.assertRaisesMessage(AssertionError, "User id is required."):
+            list_task_changes_for_user(user_id="")
+
+    def test_without_since_returns_every_task_and_no_deleted_tasks(self):
+        task = TaskTestUtils.create_task(title="Test Task", owner_id=self.user.id)
+
+        changed_tasks, deleted_tasks = list_task_changes_for_user(user_id=self.user.id)
+        self.assertListEqual(list(changed_tasks), [task])
+        self.assertEqual(deleted_tasks.count(), 0)
+
+    def test_since_returns_changes_and_deleted_tasks_after_it(self):
+        with freeze_time("2023-01-01 12:00:00"):
+            TaskTestUtils.create_task(title="Unchanged", owner_id=self.user.id)
+            old_deleted_task = TaskTestUtils.create_task(title="Old deleted", owner_id=self.user.id)
+            delete_task(task_uuid=old_deleted_task.uuid, owner_id=self.user.id)
+            updated_task = TaskTestUtils.create_task(title="Updated", owner_id=self.user.id)
+            deleted_task = TaskTestUtils.create_task(title="Deleted", owner_id=self.user.id)
+        with freeze_time("2023-01-02 12:00:00"):
+            update_task(task_uuid=updated_task.uuid, owner_id=self.user.id, title="Test update")
+            delete_task(task_uuid=deleted_task.uuid, owner_id=self.user.id)
+
+        changed_tasks, deleted_tasks = list_task_changes_for_user(
+            user_id=self.user.id, since=timezone.make_aware(timezone.datetime(2023, 1, 2))
+        )
+        self.assertListEqual(list(changed_tasks), [updated_task])
+        self.assertListEqual([deleted.uuid for deleted in deleted_tasks], [deleted_task.uuid])
+
+    def test_after_continues_past_the_given_task(self):
+        with freeze_time("2023-01-01 12:00:00"):
+            tasks = [TaskTestUtils.create_task(title=f"Task {index}", owner_id=self.user.id) for index in range(3)]
+
+        changed_tasks, _ = list_task_changes_for_user(
+            user_id=self.user.id, after=(tasks[0].last_updated, tasks[0].id)
+        )
+        self.assertListEqual(list(changed_tasks), tasks[1:])
+
+
 class DeleteTaskTestCase(BaseTaskTestCase):
     def test_task_uuid_is_required(self):
         with self.assertRaisesMessage(AssertionError, "Task uuid is required."):
@@ -96,6 +300,16 @@ class DeleteTaskTestCase(BaseTaskTestCase):
         new_tasks_for_owner = TaskTestUtils.get_tasks_count_for_user(owner_id=self.user.id)
         self.assertEqual(new_tasks_for_owner, 1)
 
+    def test_task_deletion_records_a_tombstone_and_decrements_the_counter(self):
+        task_to_delete = TaskTestUtils.create_task(title="Test task deletion", owner_id=self.user.id)
+        with self.assertNumQueries(5):
+            delete_task(task_uuid=task_to_delete.uuid, owner_id=self.user.id)
+        self.assertTrue(TaskTestUtils.deleted_task_exists(uuid=task_to_delete.uuid, owner_id=self.user.id))
+
+    def test_wrong_task_uuid_needs_a_single_extra_query(self):
+        with self.assertNumQueries(2), self.assertRaises(ObjectDoesNotExist):
+            delete_task(task_uuid=self.UUID, owner_id=self.user.id)
+
 
 class UpdateTaskTestCase(BaseTaskTestCase):
     @classmethod
@@ -154,3 +368,134 @@ class UpdateTaskTestCase(BaseTaskTestCase):
         self.assertIsNotNone(
             TaskTestUtils.get_first_task_for_user(uuid=self.task.uuid, owner_id=self.user.id, **updated_data)
         )
+
+    def test_update_task_uses_an_update_and_an_outbox_insert(self):
+        with self.assertNumQueries(2):
+            update_task(task_uuid=self.task.uuid, owner_id=self.user.id, title="Test update")
+
+    def test_update_task_refreshes_last_updated(self):
+        with freeze_time("2030-01-01 12:00:00"):
+            update_task(task_uuid=self.task.uuid, owner_id=self.user.id, title="Test update")
+        updated_task = TaskTestUtils.get_first_task_for_user(uuid=self.task.uuid, owner_id=self.user.id)
+        self.assertEqual(updated_task.last_updated.isoformat(), "2030-01-01T12:00:00+00:00")
+
+    def test_wrong_task_uuid_gets_not_exist_error(self):
+        wrong_uuid = "ea0ec33b-30e2-9999-9011-e35e1e2b5e0d"
+
+        with self.assertRaisesMessage(ObjectDoesNotExist, "Task matching query does not exist."):
+            update_task(task_uuid=wrong_uuid, owner_id=self.user.id, title="Test update")
+
+
+class TaskServicesQueryBudgetTestCase(BaseTaskTestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.task = TaskTestUtils.create_task(title="Test Task", owner_id=cls.user.id)
+
+    def test_create_task(self):
+        expected_queries = [
+            "EXISTS auth_user",
+            "EXISTS tasks_task",
+            "INSERT tasks_task",
+            "UPDATE tasks_taskcounter",
+            "INSERT webhooks_outboxevent",
+        ]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            create_task(owner_id=self.user.id, title="Test Task")
+
+    def test_create_task_with_first_task_of_its_status(self):
+        expected_queries = [
+            "EXISTS auth_user",
+            "EXISTS tasks_task",
+            "INSERT tasks_task",
+            "UPDATE tasks_taskcounter",
+            "SAVEPOINT",
+            "INSERT tasks_taskcounter",
+            "RELEASE SAVEPOINT",
+            "INSERT webhooks_outboxevent",
+        ]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            create_task(owner_id=self.user.id, title="Test Task", status="completed")
+
+    def test_get_task(self):
+        with QueryBudgetTestUtils.assert_queries(self, ["SELECT tasks_task"]):
+            get_task_for_owner(task_uuid=self.task.uuid, owner_id=self.user.id)
+
+    def test_list_tasks_with_every_filter_combination(self):
+        for size in range(len(QueryBudgetTestUtils.LIST_FILTERS) + 1):
+            for filter_names in combinations(QueryBudgetTestUtils.LIST_FILTERS, size):
+                with self.subTest(filters=filter_names):
+                    query_params = {name: QueryBudgetTestUtils.LIST_FILTERS[name] for name in filter_names}
+                    with QueryBudgetTestUtils.assert_queries(self, ["SELECT tasks_task"]):
+                        list(list_tasks_for_user(user_id=self.user.id, query_params=query_params))
+
+    def test_list_task_changes(self):
+        with QueryBudgetTestUtils.assert_queries(self, ["SELECT tasks_task", "SELECT tasks_deletedtask"]):
+            changed_tasks, deleted_tasks = list_task_changes_for_user(user_id=self.user.id, since=timezone.now())
+            list(changed_tasks), list(deleted_tasks)
+
+    def test_update_task(self):
+        with QueryBudgetTestUtils.assert_queries(self, ["UPDATE tasks_task", "INSERT webhooks_outboxevent"]):
+            update_task(task_uuid=self.task.uuid, owner_id=self.user.id, title="Test update")
+
+    def test_update_task_status(self):
+        TaskTestUtils.create_task(title="Test Task", owner_id=self.user.id, status="completed")
+        expected_queries = [
+            "SELECT tasks_task",
+            "UPDATE tasks_task",
+            "UPDATE tasks_taskcounter",
+            "UPDATE tasks_taskcounter",
+            "INSERT webhooks_outboxevent",
+        ]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            update_task(task_uuid=self.task.uuid, owner_id=self.user.id, status="completed")
+
+    def test_update_task_with_same_status(self):
+        expected_queries = ["SELECT tasks_task", "UPDATE tasks_task", "INSERT webhooks_outboxevent"]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            update_task(task_uuid=self.task.uuid, owner_id=self.user.id, status="to_do")
+
+    def test_update_missing_task(self):
+        with QueryBudgetTestUtils.assert_queries(self, ["UPDATE tasks_task", "EXISTS tasks_task"]):
+            with self.assertRaises(ObjectDoesNotExist):
+                update_task(task_uuid=self.UUID, owner_id=self.user.id, title="Test update")
+
+    def test_delete_task(self):
+        expected_queries = [
+            "SELECT tasks_task",
+            "DELETE tasks_task",
+            "INSERT tasks_deletedtask",
+            "UPDATE tasks_taskcounter",
+            "INSERT webhooks_outboxevent",
+        ]
+        with QueryBudgetTestUtils.assert_queries(self, expected_queries):
+            delete_task(task_uuid=self.task.uuid, owner_id=self.user.id)
+
+    def test_delete_missing_task(self):
+        with QueryBudgetTestUtils.assert_queries(self, ["SELECT tasks_task", "EXISTS tasks_task"]):
+            with self.assertRaises(ObjectDoesNotExist):
+                delete_task(task_uuid=self.UUID, owner_id=self.user.id)
+
+
+class QueryBudgetTestUtilsTestCase(BaseTaskTestCase):
+    def test_summarize_query(self):
+        summaries = {
+            'SELECT "tasks_task"."id" FROM "tasks_task"': "SELECT tasks_task",
+            'SELECT COUNT(*) AS "__count" FROM "tasks_task"': "COUNT tasks_task",
+            'SELECT 1 AS "a" FROM "tasks_task" LIMIT 1': "EXISTS tasks_task",
+            'INSERT INTO "tasks_task" ("uuid") VALUES (%s)': "INSERT tasks_task",
+            'SAVEPOINT "s1"': "SAVEPOINT",
+        }
+        for sql, summary in summaries.items():
+            self.assertEqual(QueryBudgetTestUtils.summarize_query(sql), summary)
+
+    def test_extra_query_fails_with_sql_diff(self):
+        with self.assertRaises(AssertionError) as context:
+            with QueryBudgetTestUtils.assert_queries(self, ["SELECT tasks_task"]):
+                list(list_tasks_for_user(user_id=self.user.id))
+                list_tasks_for_user(user_id=self.user.id).count()
+
+        message = str(context.exception)
+        self.assertIn("2 queries executed, 1 expected", message)
+        self.assertIn("+COUNT tasks_task", message)
+        self.assertIn('2. SELECT COUNT(*) AS "__count" FROM "tasks_task"', message)
@@ -1,10 +1,28 @@
-from backend.tasks.models import Task
+import difflib
+import re
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+from backend.tasks.models import DeletedTask, Task, TaskCounter
+from backend.tasks.services.task_counters import add_to_task_counters, count_task_statuses
 
 
 class TaskTestUtils:
     @classmethod
     def create_task(cls, title: str, owner_id: int, **kwargs):
-        return Task.objects.create(title=title, owner_id=owner_id, **kwargs)
+        task = Task.objects.create(title=title, owner_id=owner_id, **kwargs)
+        add_to_task_counters(owner_id, {task.status: 1})
+        return task
+
+    @classmethod
+    def bulk_create_tasks(cls, owner_id: int, count: int, **kwargs):
+        tasks = Task.objects.bulk_create(
+            Task(title=f"Task {index}", owner_id=owner_id, **kwargs) for index in range(count)
+        )
+        add_to_task_counters(owner_id, count_task_statuses(tasks))
+        return tasks
 
     @classmethod
     def get_first_task_for_user(cls, owner_id: int, **kwargs):
@@ -13,3 +31,77 @@ class TaskTestUtils:
     @classmethod
     def get_tasks_count_for_user(cls, owner_id: int, **kwargs):
         return Task.objects.filter(owner_id=owner_id, **kwargs).count()
+
+    @classmethod
+    def update_task(cls, task_id: int, **kwargs):
+        task = Task.objects.get(id=task_id)
+        previous_status = task.status
+        for field, value in kwargs.items():
+            setattr(task, field, value)
+        task.save()
+        if task.status != previous_status:
+            add_to_task_counters(task.owner_id, {previous_status: -1, task.status: 1})
+        return task
+
+    @classmethod
+    def get_task_counts_for_user(cls, owner_id: int):
+        return dict(TaskCounter.objects.filter(owner_id=owner_id).exclude(count=0).values_list("status", "count"))
+
+    @classmethod
+    def set_task_count(cls, owner_id: int, status: str, count: int):
+        TaskCounter.objects.update_or_create(owner_id=owner_id, status=status, defaults={"count": count})
+
+    @classmethod
+    def deleted_task_exists(cls, owner_id: int, **kwargs):
+        return DeletedTask.objects.filter(owner_id=owner_id, **kwargs).exists()
+
+
+class QueryBudgetTestUtils:
+    QUERY_PATTERNS = [
+        (re.compile(r'^SELECT COUNT\(\*\).*? FROM [("`]*(\w+)', re.S), "COUNT {}"),
+        (re.compile(r'^SELECT (?:\(1\)|1) AS "?a"? FROM [("`]*(\w+)', re.S), "EXISTS {}"),
+        (re.compile(r'^SELECT .*? FROM [("`]*(\w+)', re.S), "SELECT {}"),
+        (re.compile(r'^INSERT INTO ["`]?(\w+)'), "INSERT {}"),
+        (re.compile(r'^UPDATE ["`]?(\w+)'), "UPDATE {}"),
+        (re.compile(r'^DELETE FROM ["`]?(\w+)'), "DELETE {}"),
+        (re.compile(r"^(RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT|SAVEPOINT)"), "{}"),
+    ]
+
+    LIST_FILTERS = {
+        "title": "Test",
+        "description": "Test",
+        "search": "Test",
+        "status": "to_do",
+        "created_from": "2023-01-01",
+        "created_to": "2023-01-31",
+        "created_after": "2023-01-01T00:00:00Z",
+        "created_before": "2023-02-01T00:00:00Z",
+        "updated_since": "2023-01-01T00:00:00Z",
+    }
+
+    @classmethod
+    def summarize_query(cls, sql: str) -> str:
+        for pattern, summary in cls.QUERY_PATTERNS:
+            match = pattern.match(sql)
+            if match:
+                return summary.format(match.group(1))
+        return sql.split(" ", 1)[0]
+
+    @classmethod
+    @contextmanager
+    def assert_queries(cls, test_case, expected_queries: list[str], using: str = DEFAULT_DB_ALIAS):
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+
+        executed_queries = [cls.summarize_query(query["sql"]) for query in context.captured_queries]
+        if executed_queries != expected_queries:
+            diff = "\n".join(
+                difflib.unified_diff(expected_queries, executed_queries, "expected", "executed", lineterm="")
+            )
+            executed_sql = "\n".join(
+                f"{position}. {query['sql']}" for position, query in enumerate(context.captured_queries, start=1)
+            )
+            test_case.fail(
+                f"{len(executed_queries)} queries executed, {len(expected_queries)} expected:\n"
+                f"{diff}\n\nExecuted SQL:\n{executed_sql}"
+            )
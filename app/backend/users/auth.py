@@ -1,3 +1,4 @@
+from asgiref.sync import sync_to_async
 from django.contrib.auth import authenticate
 from django.core.exceptions import PermissionDenied
 from rest_framework.authtoken.models import Token
@@ -14,3 +15,16 @@ def auth_token_for_user_credentials(username: str, password: str) -> str:
         return auth_token.key
 
     raise PermissionDenied("Incorrect username or password supplied.")
+
+
+async def aauth_token_for_user_credentials(username: str, password: str) -> str:
+    assert username, "Username is required."
+    assert password, "Password is required."
+
+    user = await sync_to_async(authenticate)(username=username, password=password)
+
+    if user:
+        auth_token, _ = await Token.objects.aget_or_create(user=user)
+        return auth_token.key
+
+    raise PermissionDenied("Incorrect username or password supplied.")
@@ -0,0 +1,168 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+
+class TokenCache(ABC):
+    def __init__(self, timeout: int):
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Token]:
+        token = self._get(key)
+        with self._stats_lock:
+            if token is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return token
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Token]:
+        pass
+
+    @abstractmethod
+    def set(self, token: Token) -> None:
+        pass
+
+    @abstractmethod
+    def delete_user(self, user_id: int) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class LocalTokenCache(TokenCache):
+    def __init__(self, timeout: int, max_size: int):
+        super().__init__(timeout=timeout)
+        self.max_size = max_size
+        self._tokens = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[Token]:
+        with self._lock:
+            cached = self._tokens.get(key)
+            if cached is None:
+                return None
+            expires_at, token = cached
+            if expires_at <= time.monotonic():
+                del self._tokens[key]
+                return None
+            self._tokens.move_to_end(key)
+            return token
+
+    def set(self, token: Token) -> None:
+        with self._lock:
+            self._tokens[token.key] = (time.monotonic() + self.timeout, token)
+            self._tokens.move_to_end(token.key)
+            while len(self._tokens) > self.max_size:
+                self._tokens.popitem(last=False)
+
+    def delete_user(self, user_id: int) -> None:
+        with self._lock:
+            user_keys = [key for key, (_, token) in self._tokens.items() if token.user_id == user_id]
+            for key in user_keys:
+                del self._tokens[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+    def stats(self) -> dict:
+        return {**super().stats(), "size": len(self._tokens)}
+
+
+class DjangoTokenCache(TokenCache):
+    generation_key = "auth_token:generation"
+    token_key_prefix = "auth_token:key:"
+    user_key_prefix = "auth_token:user:"
+
+    def __init__(self, timeout: int, alias: str):
+        super().__init__(timeout=timeout)
+        self.cache = caches[alias]
+
+    def _get_generation(self) -> int:
+        generation = self.cache.get(self.generation_key)
+        if generation is None:
+            self.cache.add(self.generation_key, time.time_ns(), timeout=None)
+            generation = self.cache.get(self.generation_key)
+        return generation
+
+    def _get(self, key: str) -> Optional[Token]:
+        # Tokens are stored with the generation they were cached in, clear() moves to a new one.
+        token_key = f"{self.token_key_prefix}{key}"
+        cached = self.cache.get_many([self.generation_key, token_key])
+        if token_key not in cached:
+            return None
+        generation, token = cached[token_key]
+        if generation != cached.get(self.generation_key):
+            return None
+        return token
+
+    def set(self, token: Token) -> None:
+        self.cache.set_many(
+            {
+                f"{self.token_key_prefix}{token.key}": (self._get_generation(), token),
+                f"{self.user_key_prefix}{token.user_id}": token.key,
+            },
+            timeout=self.timeout,
+        )
+
+    def delete_user(self, user_id: int) -> None:
+        user_key = f"{self.user_key_prefix}{user_id}"
+        token_key = self.cache.get(user_key)
+        if token_key:
+            self.cache.delete_many([user_key, f"{self.token_key_prefix}{token_key}"])
+
+    def clear(self) -> None:
+        # The cache may be shared with other data, so it is not cleared as a whole.
+        try:
+            self.cache.incr(self.generation_key)
+        except ValueError:
+            self.cache.add(self.generation_key, time.time_ns(), timeout=None)
+
+
+_token_cache = None
+
+
+def get_token_cache() -> TokenCache:
+    global _token_cache
+    if _token_cache is None:
+        if settings.TOKEN_AUTH_CACHE_BACKEND == "django":
+            _token_cache = DjangoTokenCache(
+                timeout=settings.TOKEN_AUTH_CACHE_TIMEOUT,
+                alias=settings.TOKEN_AUTH_CACHE_ALIAS,
+            )
+        else:
+            _token_cache = LocalTokenCache(
+                timeout=settings.TOKEN_AUTH_CACHE_TIMEOUT,
+                max_size=settings.TOKEN_AUTH_CACHE_MAX_SIZE,
+            )
+    return _token_cache
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    def authenticate_credentials(self, key):
+        token_cache = get_token_cache()
+        token = token_cache.get(key)
+        if token is not None:
+            return (token.user, token)
+
+        user, token = super().authenticate_credentials(key)
+        token_cache.set(token)
+        return (user, token)
@@ -1,4 +1,4 @@
-from backend.users.auth import auth_token_for_user_credentials
+from backend.users.auth import aauth_token_for_user_credentials, auth_token_for_user_credentials
 from backend.users.tests.utils import AuthTokenTestUtils, UserTestUtils
 from django.core.exceptions import PermissionDenied
 from django.test import TestCase
@@ -26,3 +26,12 @@ class AuthenticateUserTestCase(TestCase):
         auth_token = AuthTokenTestUtils.create_auth_token_for_user(user_id=self.user.id)
         received_token = auth_token_for_user_credentials(username="test_user", password="test123")
         self.assertEqual(auth_token.key, received_token)
+
+    async def test_async_wrong_credentials_gets_permission_denied(self):
+        with self.assertRaisesMessage(PermissionDenied, "Incorrect username or password supplied."):
+            await aauth_token_for_user_credentials(username="test_user", password="pass")
+
+    async def test_async_authentication_creates_token(self):
+        first_token = await aauth_token_for_user_credentials(username="test_user", password="test123")
+        second_token = await aauth_token_for_user_credentials(username="test_user", password="test123")
+        self.assertEqual(first_token, second_token)
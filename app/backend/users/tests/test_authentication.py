@@ -0,0 +1,125 @@
+from freezegun import freeze_time
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.exceptions import AuthenticationFailed
+
+from backend.users.authentication import (
+    CachedTokenAuthentication,
+    DjangoTokenCache,
+    LocalTokenCache,
+    get_token_cache,
+)
+from backend.users.tests.utils import AuthTokenTestUtils, UserTestUtils
+
+
+class CachedTokenAuthenticationTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.user = UserTestUtils.create_user(username="test_user", password="test123")
+        cls.auth_token = AuthTokenTestUtils.create_auth_token_for_user(user_id=cls.user.id)
+
+    def setUp(self) -> None:
+        get_token_cache().clear()
+
+    def test_second_authentication_does_not_query_the_database(self):
+        authentication = CachedTokenAuthentication()
+        authentication.authenticate_credentials(self.auth_token.key)
+
+        with self.assertNumQueries(0):
+            user, token = authentication.authenticate_credentials(self.auth_token.key)
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(token.key, self.auth_token.key)
+
+    def test_invalid_token_gets_authentication_failed(self):
+        with self.assertRaises(AuthenticationFailed):
+            CachedTokenAuthentication().authenticate_credentials("not-a-token")
+
+    def test_deleted_token_is_invalidated(self):
+        authentication = CachedTokenAuthentication()
+        authentication.authenticate_credentials(self.auth_token.key)
+        self.auth_token.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            authentication.authenticate_credentials(self.auth_token.key)
+
+    def test_deactivated_user_is_invalidated(self):
+        authentication = CachedTokenAuthentication()
+        authentication.authenticate_credentials(self.auth_token.key)
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            authentication.authenticate_credentials(self.auth_token.key)
+
+
+class LocalTokenCacheTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.tokens = []
+        for username in ["first_user", "second_user", "third_user"]:
+            user = UserTestUtils.create_user(username=username)
+            cls.tokens.append(AuthTokenTestUtils.create_auth_token_for_user(user_id=user.id))
+
+    def test_counts_hits_and_misses(self):
+        token_cache = LocalTokenCache(timeout=60, max_size=10)
+        token_cache.get(self.tokens[0].key)
+        token_cache.set(self.tokens[0])
+        token_cache.get(self.tokens[0].key)
+
+        self.assertDictEqual(token_cache.stats(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_evicts_least_recently_used_token(self):
+        token_cache = LocalTokenCache(timeout=60, max_size=2)
+        token_cache.set(self.tokens[0])
+        token_cache.set(self.tokens[1])
+        token_cache.get(self.tokens[0].key)
+        token_cache.set(self.tokens[2])
+
+        self.assertIsNotNone(token_cache.get(self.tokens[0].key))
+        self.assertIsNone(token_cache.get(self.tokens[1].key))
+        self.assertIsNotNone(token_cache.get(self.tokens[2].key))
+
+    def test_expires_tokens_after_timeout(self):
+        token_cache = LocalTokenCache(timeout=60, max_size=10)
+        with freeze_time("2023-01-01 12:00:00") as frozen_time:
+            token_cache.set(self.tokens[0])
+            frozen_time.tick(59)
+            self.assertIsNotNone(token_cache.get(self.tokens[0].key))
+            frozen_time.tick(1)
+            self.assertIsNone(token_cache.get(self.tokens[0].key))
+
+
+class DjangoTokenCacheTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.user = UserTestUtils.create_user(username="test_user")
+        cls.auth_token = AuthTokenTestUtils.create_auth_token_for_user(user_id=cls.user.id)
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_delete_user_removes_cached_token(self):
+        token_cache = DjangoTokenCache(timeout=60, alias="default")
+        token_cache.set(self.auth_token)
+        self.assertEqual(token_cache.get(self.auth_token.key).user, self.user)
+
+        token_cache.delete_user(self.user.id)
+        self.assertIsNone(token_cache.get(self.auth_token.key))
+        self.assertDictEqual(token_cache.stats(), {"hits": 1, "misses": 1})
+
+    def test_clear_only_removes_cached_tokens(self):
+        token_cache = DjangoTokenCache(timeout=60, alias="default")
+        token_cache.set(self.auth_token)
+        cache.set("other:key", "value")
+
+        token_cache.clear()
+        self.assertIsNone(token_cache.get(self.auth_token.key))
+        self.assertEqual(cache.get("other:key"), "value")
+
+        token_cache.set(self.auth_token)
+        self.assertEqual(token_cache.get(self.auth_token.key).user, self.user)
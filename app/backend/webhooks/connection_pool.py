@@ -0,0 +1,61 @@
+import threading
+from collections import defaultdict
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from urllib.parse import urlsplit
+
+
+class HTTPConnectionPool:
+    # Keeps the keep-alive connections to each host open between deliveries, skipping the TCP and TLS handshakes.
+    def __init__(self, timeout: float, max_idle_per_host: int = 10):
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_connections = defaultdict(list)
+        self.lock = threading.Lock()
+
+    def _get_connection(self, scheme: str, netloc: str) -> tuple[HTTPConnection, bool]:
+        with self.lock:
+            idle_connections = self.idle_connections[(scheme, netloc)]
+            if idle_connections:
+                return idle_connections.pop(), True
+        connection_class = HTTPSConnection if scheme == "https" else HTTPConnection
+        return connection_class(netloc, timeout=self.timeout), False
+
+    def _put_connection(self, scheme: str, netloc: str, connection: HTTPConnection) -> None:
+        with self.lock:
+            idle_connections = self.idle_connections[(scheme, netloc)]
+            if len(idle_connections) < self.max_idle_per_host:
+                idle_connections.append(connection)
+                return
+        connection.close()
+
+    def post(self, url: str, body: bytes, headers: dict) -> int:
+        parts = urlsplit(url)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        while True:
+            connection, reused = self._get_connection(parts.scheme, parts.netloc)
+            try:
+                connection.request("POST", path, body=body, headers={"Content-Type": "application/json", **headers})
+                response = connection.getresponse()
+                response.read()
+            except (ConnectionError, HTTPException):
+                connection.close()
+                # The server closed an idle connection, the request is sent again over a new one.
+                if reused:
+                    continue
+                raise
+            except OSError:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._put_connection(parts.scheme, parts.netloc, connection)
+            return response.status
+
+    def close(self) -> None:
+        with self.lock:
+            connections = [connection for idle in self.idle_connections.values() for connection in idle]
+            self.idle_connections.clear()
+        for connection in connections:
+            connection.close()
@@ -0,0 +1,27 @@
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.webhooks.services import create_webhook_subscription
+
+
+class Command(BaseCommand):
+    help = "Subscribes a URL to the task events from now on."
+
+    def add_arguments(self, parser):
+        parser.add_argument("url", help="URL the batches of events are posted to.")
+        parser.add_argument("--owner", help="Username whose task events are sent. Defaults to every user.")
+        parser.add_argument("--secret", default="", help="Key of the HMAC-SHA256 signature of each request.")
+
+    def handle(self, *args, **options):
+        owner_id = None
+        if options["owner"]:
+            owner_id = User.objects.filter(username=options["owner"]).values_list("id", flat=True).first()
+            if not owner_id:
+                raise CommandError(f"User {options['owner']!r} does not exist.")
+
+        try:
+            subscription = create_webhook_subscription(url=options["url"], owner_id=owner_id, secret=options["secret"])
+        except ValidationError as e:
+            raise CommandError(e.messages[0])
+        self.stdout.write(f"Created subscription {subscription.uuid}.")
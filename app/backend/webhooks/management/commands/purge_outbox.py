@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from backend.webhooks.services import purge_delivered_events
+
+
+class Command(BaseCommand):
+    help = "Removes the outbox events already delivered to every webhook subscription, paused ones included."
+
+    def handle(self, *args, **options):
+        purged_events = purge_delivered_events()
+        self.stdout.write(f"Purged {purged_events} outbox events.")
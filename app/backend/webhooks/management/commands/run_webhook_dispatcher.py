@@ -0,0 +1,34 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from backend.webhooks.services import WebhookDispatcher
+
+
+class Command(BaseCommand):
+    help = "Delivers the outbox task events to the webhook subscriptions. Several dispatchers can run side by side."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, help="Outbox events read per round for each subscription cursor.")
+        parser.add_argument("--workers", type=int, help="Threads sending the requests. 1 sends them inline.")
+        parser.add_argument("--poll-interval", type=float, help="Seconds to wait when the outbox has no new events.")
+        parser.add_argument("--once", action="store_true", help="Deliver one batch of events and exit.")
+
+    def handle(self, *args, **options):
+        dispatcher = WebhookDispatcher(
+            batch_size=options["batch_size"], workers=options["workers"], poll_interval=options["poll_interval"]
+        )
+        if options["once"]:
+            try:
+                dispatcher.run_once()
+            finally:
+                dispatcher.close()
+        else:
+            signal.signal(signal.SIGTERM, lambda signum, frame: dispatcher.stop())
+            signal.signal(signal.SIGINT, lambda signum, frame: dispatcher.stop())
+            dispatcher.run()
+
+        self.stdout.write(
+            f"Delivered {dispatcher.delivered_count} events in {dispatcher.request_count} requests, "
+            f"{dispatcher.failed_count} failed."
+        )
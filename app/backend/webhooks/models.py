@@ -0,0 +1,45 @@
+from uuid import uuid4
+
+from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxEvent(models.Model):
+    owner = models.ForeignKey(User, related_name="outbox_events", on_delete=models.CASCADE)
+    task_uuid = models.UUIDField()
+
+    class EventTypeChoices(models.TextChoices):
+        CREATED = "task.created", "Task created"
+        UPDATED = "task.updated", "Task updated"
+        DELETED = "task.deleted", "Task deleted"
+
+    event_type = models.CharField(choices=EventTypeChoices.choices, max_length=20)
+    data = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    created = models.DateTimeField(auto_now_add=True, editable=False)
+
+    class Meta:
+        verbose_name = "Outbox event"
+        verbose_name_plural = "Outbox events"
+
+
+class WebhookSubscription(models.Model):
+    uuid = models.UUIDField(unique=True, default=uuid4, editable=False)
+    owner = models.ForeignKey(
+        User, related_name="webhook_subscriptions", null=True, blank=True, on_delete=models.CASCADE
+    )
+    url = models.URLField(max_length=500)
+    secret = models.CharField(max_length=100, blank=True)
+    is_active = models.BooleanField(default=True)
+    created = models.DateTimeField(auto_now_add=True, editable=False)
+    last_event_id = models.BigIntegerField(default=0)
+    failures = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(null=True, blank=True)
+    claim_token = models.UUIDField(null=True, blank=True, editable=False)
+    claimed_until = models.DateTimeField(null=True, blank=True, editable=False)
+
+    class Meta:
+        verbose_name = "Webhook subscription"
+        verbose_name_plural = "Webhook subscriptions"
@@ -0,0 +1,20 @@
+from .outbox_services import coalesce_events, create_webhook_subscription, purge_delivered_events, record_outbox_events
+from .dispatcher_services import (
+    WebhookDispatcher,
+    build_webhook_request,
+    claim_webhook_subscriptions,
+    get_settled_events,
+    release_webhook_subscriptions,
+)
+
+__all__ = [
+    "coalesce_events",
+    "create_webhook_subscription",
+    "purge_delivered_events",
+    "record_outbox_events",
+    "WebhookDispatcher",
+    "build_webhook_request",
+    "claim_webhook_subscriptions",
+    "get_settled_events",
+    "release_webhook_subscriptions",
+]
@@ -0,0 +1,209 @@
+import hashlib
+import hmac
+import json
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from http.client import HTTPException
+from typing import Optional
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from backend.webhooks.connection_pool import HTTPConnectionPool
+from backend.webhooks.models import OutboxEvent, WebhookSubscription
+from .outbox_services import coalesce_events
+
+
+def claim_webhook_subscriptions(claim_token: UUID, lease: timedelta, limit: int) -> list[WebhookSubscription]:
+    # A subscription is delivered by one dispatcher at a time, which keeps its events in order.
+    now = timezone.now()
+    with transaction.atomic():
+        subscriptions = list(
+            WebhookSubscription.objects.select_for_update(skip_locked=True)
+            .filter(is_active=True, next_attempt_at__lte=now)
+            .filter(Q(claimed_until__isnull=True) | Q(claimed_until__lt=now))
+            .order_by("next_attempt_at", "id")[:limit]
+        )
+        if subscriptions:
+            WebhookSubscription.objects.filter(id__in=[subscription.id for subscription in subscriptions]).update(
+                claim_token=claim_token, claimed_until=now + lease
+            )
+    return subscriptions
+
+
+def release_webhook_subscriptions(claim_token: UUID) -> int:
+    return WebhookSubscription.objects.filter(claim_token=claim_token).update(claim_token=None, claimed_until=None)
+
+
+def get_settled_events(events: list[OutboxEvent], after_id: int, settled_through_id: int) -> list[OutboxEvent]:
+    # A gap in the ids may be a transaction that has not committed yet. Events after it wait until every gap up to
+    # settled_through_id is known to be a rollback.
+    expected_id = after_id + 1
+    for index, event in enumerate(events):
+        if event.id != expected_id and event.id > settled_through_id:
+            return events[:index]
+        expected_id = event.id + 1
+    return events
+
+
+def get_transaction_horizon() -> Optional[int]:
+    # Takes a new transaction id on PostgreSQL. Mutations write the task before their outbox events, so every
+    # transaction holding an outbox id that is already taken has a lower one.
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_current_xact_id()::text::bigint")
+        return cursor.fetchone()[0]
+
+
+def get_oldest_running_transaction() -> Optional[int]:
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+        return cursor.fetchone()[0]
+
+
+def get_retry_delay(failures: int) -> timedelta:
+    delay = settings.WEBHOOKS_RETRY_BACKOFF_SECONDS * 2 ** (failures - 1)
+    return timedelta(seconds=min(delay, settings.WEBHOOKS_RETRY_MAX_BACKOFF_SECONDS))
+
+
+def build_webhook_request(subscription: WebhookSubscription, events: list[dict]) -> tuple[bytes, dict]:
+    body = json.dumps({"events": events}, cls=DjangoJSONEncoder).encode()
+    headers = {"X-Webhook-Subscription": str(subscription.uuid)}
+    if subscription.secret:
+        signature = hmac.new(subscription.secret.encode(), body, hashlib.sha256).hexdigest()
+        headers["X-Webhook-Signature"] = f"sha256={signature}"
+    return body, headers
+
+
+class WebhookDispatcher:
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        lease: Optional[float] = None,
+        timeout: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        self.batch_size = batch_size or settings.WEBHOOKS_BATCH_SIZE
+        self.workers = workers or settings.WEBHOOKS_WORKERS
+        self.lease = timedelta(seconds=lease or settings.WEBHOOKS_LEASE_SECONDS)
+        self.poll_interval = settings.WEBHOOKS_POLL_INTERVAL_SECONDS if poll_interval is None else poll_interval
+        self.connection_pool = HTTPConnectionPool(timeout=timeout or settings.WEBHOOKS_TIMEOUT_SECONDS)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        self.claim_token = uuid4()
+        self.settled_through_id = 0
+        self.gap_horizon: Optional[tuple[int, int]] = None
+        self.stopping = threading.Event()
+        self.delivered_count = 0
+        self.request_count = 0
+        self.failed_count = 0
+
+    def deliver(self, subscription: WebhookSubscription, events: list[dict]) -> Optional[str]:
+        body, headers = build_webhook_request(subscription, events)
+        try:
+            status = self.connection_pool.post(subscription.url, body, headers)
+        except (OSError, HTTPException) as e:
+            return f"{type(e).__name__}: {e}"
+        if not 200 <= status < 300:
+            return f"HTTP {status}"
+        return None
+
+    def record_delivery(self, subscription: WebhookSubscription, last_event_id: int, error: Optional[str]) -> None:
+        subscriptions = WebhookSubscription.objects.filter(id=subscription.id, claim_token=self.claim_token)
+        if error is None:
+            subscriptions.update(last_event_id=last_event_id, failures=0, last_error=None)
+            return
+        failures = subscription.failures + 1
+        subscriptions.update(
+            failures=failures, last_error=error, next_attempt_at=timezone.now() + get_retry_delay(failures)
+        )
+
+    def settle_gaps(self) -> None:
+        # Runs before reading the outbox: once the transactions that may hold the missing ids have all finished,
+        # anything they committed is visible to the next read, and the ids still missing are rollbacks.
+        oldest_running_transaction = get_oldest_running_transaction()
+        if self.gap_horizon is not None and oldest_running_transaction is not None:
+            seen_through_id, horizon = self.gap_horizon
+            if oldest_running_transaction > horizon:
+                self.settled_through_id = max(self.settled_through_id, seen_through_id)
+                self.gap_horizon = None
+
+    def read_events(self, after_id: int) -> list[OutboxEvent]:
+        events = list(OutboxEvent.objects.filter(id__gt=after_id).order_by("id")[: self.batch_size])
+        settled_events = get_settled_events(events, after_id, self.settled_through_id)
+        if len(settled_events) < len(events) and self.gap_horizon is None:
+            horizon = get_transaction_horizon()
+            if horizon is None:
+                # Other databases serialize their writers, so a gap before a committed event is a rollback.
+                self.settled_through_id = events[-1].id
+                return events
+            self.gap_horizon = (events[-1].id, horizon)
+        return settled_events
+
+    def run_once(self) -> int:
+        # Reads one batch of the outbox for each cursor of the due subscriptions, so a subscription that lags behind
+        # does not hold back the others, and sends each subscription one request.
+        subscriptions = claim_webhook_subscriptions(self.claim_token, self.lease, settings.WEBHOOKS_MAX_SUBSCRIPTIONS)
+        try:
+            self.settle_gaps()
+            subscriptions_by_cursor = defaultdict(list)
+            for subscription in subscriptions:
+                subscriptions_by_cursor[subscription.last_event_id].append(subscription)
+
+            read_count = 0
+            deliveries = []
+            for after_id, cursor_subscriptions in subscriptions_by_cursor.items():
+                events = self.read_events(after_id)
+                if not events:
+                    continue
+                read_count = max(read_count, len(events))
+                for subscription in cursor_subscriptions:
+                    subscription_events = [
+                        event for event in events if subscription.owner_id in (None, event.owner_id)
+                    ]
+                    coalesced_events = coalesce_events(subscription_events)
+                    if coalesced_events:
+                        deliveries.append((subscription, events[-1].id, coalesced_events))
+                    else:
+                        self.record_delivery(subscription, events[-1].id, None)
+
+            if self.executor is None:
+                errors = [self.deliver(subscription, events) for subscription, _, events in deliveries]
+            else:
+                errors = list(self.executor.map(lambda delivery: self.deliver(delivery[0], delivery[2]), deliveries))
+            for (subscription, last_event_id, coalesced_events), error in zip(deliveries, errors):
+                self.record_delivery(subscription, last_event_id, error)
+                self.request_count += 1
+                if error is None:
+                    self.delivered_count += len(coalesced_events)
+                else:
+                    self.failed_count += 1
+            return read_count
+        finally:
+            release_webhook_subscriptions(self.claim_token)
+
+    def run(self) -> None:
+        try:
+            while not self.stopping.is_set():
+                close_old_connections()
+                if self.run_once() < self.batch_size:
+                    self.stopping.wait(self.poll_interval)
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        self.stopping.set()
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+        self.connection_pool.close()
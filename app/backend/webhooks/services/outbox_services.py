@@ -0,0 +1,69 @@
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.db.models import Max, Min
+
+from backend.webhooks.models import OutboxEvent, WebhookSubscription
+
+OUTBOX_BATCH_SIZE = 500
+CREATED, UPDATED, DELETED = OutboxEvent.EventTypeChoices
+
+
+def record_outbox_events(owner_id: int, event_type: str, events: Iterable[tuple[UUID | str, dict]]) -> None:
+    # Called inside the mutation's transaction, so the outbox holds exactly the committed changes.
+    OutboxEvent.objects.bulk_create(
+        [
+            OutboxEvent(owner_id=owner_id, task_uuid=task_uuid, event_type=event_type, data=data)
+            for task_uuid, data in events
+        ],
+        batch_size=OUTBOX_BATCH_SIZE,
+    )
+
+
+def _coalesce_pair(event: Optional[dict], next_event: dict) -> Optional[dict]:
+    if event is None or event["type"] == DELETED or next_event["type"] == CREATED:
+        return next_event
+    if next_event["type"] == DELETED:
+        # A task created and deleted in the same batch is never announced.
+        return None if event["type"] == CREATED else next_event
+    return {**next_event, "type": event["type"], "data": {**event["data"], **next_event["data"]}}
+
+
+def coalesce_events(events: Iterable[OutboxEvent]) -> list[dict]:
+    # Events of the same task are merged in order into one, placed where its last event was.
+    coalesced_events = {}
+    for event in events:
+        task_uuid = str(event.task_uuid)
+        coalesced_event = _coalesce_pair(
+            coalesced_events.pop(task_uuid, None),
+            {
+                "id": event.id,
+                "type": event.event_type,
+                "task_uuid": task_uuid,
+                "owner_id": event.owner_id,
+                "occurred_at": event.created,
+                "data": event.data,
+            },
+        )
+        if coalesced_event is not None:
+            coalesced_events[task_uuid] = coalesced_event
+    return list(coalesced_events.values())
+
+
+def create_webhook_subscription(url: str, owner_id: Optional[int] = None, secret: str = "") -> WebhookSubscription:
+    # New subscriptions start from the current end of the outbox instead of replaying it.
+    last_event_id = OutboxEvent.objects.aggregate(last_event_id=Max("id"))["last_event_id"] or 0
+    subscription = WebhookSubscription(url=url, owner_id=owner_id, secret=secret, last_event_id=last_event_id)
+    subscription.full_clean()
+    subscription.save()
+    return subscription
+
+
+def purge_delivered_events() -> int:
+    # Events every subscription is past are not needed anymore. Paused subscriptions keep theirs for when they resume.
+    last_event_id = WebhookSubscription.objects.aggregate(last_event_id=Min("last_event_id"))["last_event_id"]
+    events = OutboxEvent.objects.all()
+    if last_event_id is not None:
+        events = events.filter(id__lte=last_event_id)
+    purged_events, _ = events.delete()
+    return purged_events
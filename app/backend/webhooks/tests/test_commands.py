@@ -0,0 +1,50 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+
+from backend.tasks.services import create_task
+from backend.webhooks.models import OutboxEvent, WebhookSubscription
+
+from .test_webhook_services import BaseWebhookTestCase
+
+
+class RunWebhookDispatcherCommandTestCase(BaseWebhookTestCase):
+    def test_once_delivers_a_batch_of_events(self):
+        call_command("create_webhook_subscription", self.server.url, stdout=StringIO())
+        create_task(owner_id=self.user.id, title="First")
+        create_task(owner_id=self.user.id, title="Second")
+
+        stdout = StringIO()
+        call_command("run_webhook_dispatcher", once=True, workers=1, stdout=stdout)
+
+        self.assertEqual(stdout.getvalue(), "Delivered 2 events in 1 requests, 0 failed.\n")
+        self.assertEqual(len(self.server.requests), 1)
+
+
+class CreateWebhookSubscriptionCommandTestCase(BaseWebhookTestCase):
+    def test_creates_a_subscription_for_an_owner(self):
+        stdout = StringIO()
+        call_command("create_webhook_subscription", self.server.url, owner="test_user", secret="key", stdout=stdout)
+
+        subscription = WebhookSubscription.objects.get()
+        self.assertEqual(stdout.getvalue(), f"Created subscription {subscription.uuid}.\n")
+        self.assertEqual((subscription.owner_id, subscription.secret), (self.user.id, "key"))
+
+    def test_fails_for_unknown_owners_and_invalid_urls(self):
+        with self.assertRaisesMessage(CommandError, "User 'unknown' does not exist."):
+            call_command("create_webhook_subscription", self.server.url, owner="unknown", stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command("create_webhook_subscription", "not a url", stdout=StringIO())
+        self.assertFalse(WebhookSubscription.objects.exists())
+
+
+class PurgeOutboxCommandTestCase(BaseWebhookTestCase):
+    def test_purges_the_delivered_events(self):
+        create_task(owner_id=self.user.id, title="Task")
+        call_command("create_webhook_subscription", self.server.url, stdout=StringIO())
+
+        stdout = StringIO()
+        call_command("purge_outbox", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue(), "Purged 1 outbox events.\n")
+        self.assertFalse(OutboxEvent.objects.exists())
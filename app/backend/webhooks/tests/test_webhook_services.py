@@ -0,0 +1,401 @@
+import hashlib
+import hmac
+import json
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+
+from mock import patch
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from backend.tasks.services import bulk_create_tasks, create_task, delete_task, update_task
+from backend.users.tests.utils import UserTestUtils
+from backend.webhooks.models import OutboxEvent, WebhookSubscription
+from backend.webhooks.services import (
+    WebhookDispatcher,
+    claim_webhook_subscriptions,
+    coalesce_events,
+    create_webhook_subscription,
+    get_settled_events,
+    purge_delivered_events,
+    record_outbox_events,
+    release_webhook_subscriptions,
+)
+
+
+class StubWebhookServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubWebhookHandler)
+        self.requests = []
+        self.statuses = []
+        self.thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/hooks"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+class StubWebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(
+            {
+                "path": self.path,
+                "headers": dict(self.headers),
+                "raw_body": body,
+                "body": json.loads(body),
+                "port": self.client_address[1],
+            }
+        )
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class BaseWebhookTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = UserTestUtils.create_user(username="test_user")
+        cls.other_user = UserTestUtils.create_user(username="other_user")
+
+    def setUp(self) -> None:
+        self.server = StubWebhookServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.dispatcher = WebhookDispatcher(batch_size=100, workers=1, poll_interval=0)
+        self.addCleanup(self.dispatcher.close)
+
+    def get_subscription(self, subscription: WebhookSubscription) -> WebhookSubscription:
+        return WebhookSubscription.objects.get(id=subscription.id)
+
+    def get_delivered_events(self, request_index: int = 0) -> list[tuple[str, str]]:
+        return [(event["type"], event["task_uuid"]) for event in self.server.requests[request_index]["body"]["events"]]
+
+
+class OutboxTestCase(BaseWebhookTestCase):
+    def test_records_an_event_for_each_task_mutation(self):
+        task = create_task(owner_id=self.user.id, title="Task")
+        update_task(task_uuid=task.uuid, owner_id=self.user.id, status="in_progress")
+        delete_task(task_uuid=task.uuid, owner_id=self.user.id)
+
+        events = list(OutboxEvent.objects.order_by("id"))
+        self.assertListEqual(
+            [(event.event_type, event.task_uuid, event.owner_id) for event in events],
+            [
+                ("task.created", task.uuid, self.user.id),
+                ("task.updated", task.uuid, self.user.id),
+                ("task.deleted", task.uuid, self.user.id),
+            ],
+        )
+        self.assertEqual(events[0].data["title"], "Task")
+        self.assertEqual(events[1].data["status"], "in_progress")
+        self.assertIn("last_updated", events[1].data)
+
+    def test_does_not_record_events_of_rolled_back_mutations(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            bulk_create_tasks(owner_id=self.user.id, tasks_data=[{"title": "First"}, {"title": "Second"}])
+            raise RuntimeError()
+
+        self.assertFalse(OutboxEvent.objects.exists())
+
+    def test_coalesces_the_events_of_each_task(self):
+        created_uuid, updated_uuid, deleted_uuid, discarded_uuid = uuid4(), uuid4(), uuid4(), uuid4()
+        record_outbox_events(self.user.id, "task.created", [(created_uuid, {"title": "A", "status": "pending"})])
+        record_outbox_events(self.user.id, "task.updated", [(updated_uuid, {"title": "B"})])
+        record_outbox_events(self.user.id, "task.updated", [(created_uuid, {"status": "completed"})])
+        record_outbox_events(self.user.id, "task.created", [(discarded_uuid, {"title": "C"})])
+        record_outbox_events(self.user.id, "task.updated", [(deleted_uuid, {"title": "D"})])
+        record_outbox_events(self.user.id, "task.updated", [(updated_uuid, {"status": "completed"})])
+        record_outbox_events(self.user.id, "task.deleted", [(deleted_uuid, {}), (discarded_uuid, {})])
+
+        events = coalesce_events(OutboxEvent.objects.order_by("id"))
+
+        self.assertListEqual(
+            [(event["type"], event["task_uuid"], event["data"]) for event in events],
+            [
+                ("task.created", str(created_uuid), {"title": "A", "status": "completed"}),
+                ("task.updated", str(updated_uuid), {"title": "B", "status": "completed"}),
+                ("task.deleted", str(deleted_uuid), {}),
+            ],
+        )
+
+    def test_recreated_tasks_keep_the_last_created_event(self):
+        task_uuid = uuid4()
+        record_outbox_events(self.user.id, "task.deleted", [(task_uuid, {})])
+        record_outbox_events(self.user.id, "task.created", [(task_uuid, {"title": "A"})])
+
+        events = coalesce_events(OutboxEvent.objects.order_by("id"))
+
+        self.assertListEqual([(event["type"], event["data"]) for event in events], [("task.created", {"title": "A"})])
+
+    def test_settled_events_stop_at_gaps_not_known_to_be_rollbacks(self):
+        events = [OutboxEvent(id=1), OutboxEvent(id=3), OutboxEvent(id=5), OutboxEvent(id=6)]
+
+        self.assertListEqual([event.id for event in get_settled_events(events, 0, 0)], [1])
+        self.assertListEqual([event.id for event in get_settled_events(events, 0, 3)], [1, 3])
+        self.assertListEqual([event.id for event in get_settled_events(events[1:], 2, 3)], [3])
+        self.assertListEqual([event.id for event in get_settled_events(events, 0, 6)], [1, 3, 5, 6])
+
+    def test_new_subscriptions_start_at_the_end_of_the_outbox(self):
+        create_task(owner_id=self.user.id, title="Task")
+
+        subscription = create_webhook_subscription(url=self.server.url)
+
+        self.assertEqual(subscription.last_event_id, OutboxEvent.objects.get().id)
+
+    def test_subscriptions_need_a_valid_url(self):
+        with self.assertRaises(ValidationError):
+            create_webhook_subscription(url="not a url")
+
+    def test_purges_the_events_delivered_to_every_subscription(self):
+        create_task(owner_id=self.user.id, title="First")
+        subscription = create_webhook_subscription(url=self.server.url)
+        create_task(owner_id=self.user.id, title="Second")
+        create_webhook_subscription(url=self.server.url, owner_id=self.user.id)
+        create_webhook_subscription(url=self.server.url, owner_id=self.user.id).delete()
+
+        self.assertEqual(purge_delivered_events(), 1)
+        self.assertEqual(OutboxEvent.objects.get().id, subscription.last_event_id + 1)
+
+        subscription.is_active = False
+        subscription.save()
+        self.assertEqual(purge_delivered_events(), 0)
+        self.assertTrue(OutboxEvent.objects.exists())
+
+        subscription.delete()
+        self.assertEqual(purge_delivered_events(), 1)
+        self.assertFalse(OutboxEvent.objects.exists())
+
+    def test_keeps_the_pending_events_of_a_paused_only_subscription(self):
+        subscription = create_webhook_subscription(url=self.server.url)
+        create_task(owner_id=self.user.id, title="Task")
+        WebhookSubscription.objects.filter(id=subscription.id).update(is_active=False)
+
+        self.assertEqual(purge_delivered_events(), 0)
+        self.assertEqual(OutboxEvent.objects.count(), 1)
+
+
+class ClaimWebhookSubscriptionsTestCase(BaseWebhookTestCase):
+    def test_claims_the_due_unclaimed_subscriptions(self):
+        due = create_webhook_subscription(url=self.server.url)
+        create_webhook_subscription(url=self.server.url).delete()
+        WebhookSubscription.objects.create(url=self.server.url, next_attempt_at=timezone.now() + timedelta(minutes=1))
+        WebhookSubscription.objects.create(url=self.server.url, is_active=False)
+        claim_token = uuid4()
+
+        subscriptions = claim_webhook_subscriptions(claim_token, timedelta(seconds=30), 10)
+
+        self.assertListEqual([subscription.id for subscription in subscriptions], [due.id])
+        self.assertEqual(self.get_subscription(due).claim_token, claim_token)
+        self.assertListEqual(claim_webhook_subscriptions(uuid4(), timedelta(seconds=30), 10), [])
+
+        self.assertEqual(release_webhook_subscriptions(claim_token), 1)
+        self.assertIsNone(self.get_subscription(due).claimed_until)
+
+
+class WebhookDispatcherTestCase(BaseWebhookTestCase):
+    def test_delivers_one_batched_request_to_each_subscription(self):
+        everyone = create_webhook_subscription(url=self.server.url)
+        owner = create_webhook_subscription(url=self.server.url + "?owner=1", owner_id=self.user.id)
+        first_task = create_task(owner_id=self.user.id, title="First")
+        other_task = create_task(owner_id=self.other_user.id, title="Other")
+        update_task(task_uuid=first_task.uuid, owner_id=self.user.id, title="Renamed")
+
+        self.assertEqual(self.dispatcher.run_once(), 3)
+
+        requests_by_path = {request["path"]: request for request in self.server.requests}
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertListEqual(
+            [(event["type"], event["task_uuid"]) for event in requests_by_path["/hooks"]["body"]["events"]],
+            [("task.created", str(other_task.uuid)), ("task.created", str(first_task.uuid))],
+        )
+        owner_events = requests_by_path["/hooks?owner=1"]["body"]["events"]
+        self.assertListEqual(
+            [(event["type"], event["task_uuid"], event["data"]["title"]) for event in owner_events],
+            [("task.created", str(first_task.uuid), "Renamed")],
+        )
+        self.assertEqual(requests_by_path["/hooks"]["headers"]["X-Webhook-Subscription"], str(everyone.uuid))
+        last_event_id = OutboxEvent.objects.latest("id").id
+        self.assertEqual(self.get_subscription(everyone).last_event_id, last_event_id)
+        self.assertEqual(self.get_subscription(owner).last_event_id, last_event_id)
+        self.assertEqual(
+            (self.dispatcher.delivered_count, self.dispatcher.request_count, self.dispatcher.failed_count), (3, 2, 0)
+        )
+
+    def test_signs_the_requests_of_subscriptions_with_a_secret(self):
+        create_webhook_subscription(url=self.server.url, secret="s3cr3t")
+        create_task(owner_id=self.user.id, title="Task")
+
+        self.dispatcher.run_once()
+
+        request = self.server.requests[0]
+        signature = hmac.new(b"s3cr3t", request["raw_body"], hashlib.sha256).hexdigest()
+        self.assertEqual(request["headers"]["X-Webhook-Signature"], f"sha256={signature}")
+
+    def test_reuses_keep_alive_connections_between_rounds(self):
+        create_webhook_subscription(url=self.server.url)
+        create_task(owner_id=self.user.id, title="First")
+        self.dispatcher.run_once()
+        create_task(owner_id=self.user.id, title="Second")
+        self.dispatcher.run_once()
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.requests[0]["port"], self.server.requests[1]["port"])
+
+    def test_advances_subscriptions_without_matching_events_without_a_request(self):
+        subscription = create_webhook_subscription(url=self.server.url, owner_id=self.other_user.id)
+        create_task(owner_id=self.user.id, title="Task")
+
+        self.dispatcher.run_once()
+
+        self.assertListEqual(self.server.requests, [])
+        self.assertEqual(self.get_subscription(subscription).last_event_id, OutboxEvent.objects.get().id)
+
+    @override_settings(WEBHOOKS_RETRY_BACKOFF_SECONDS=5)
+    def test_failed_deliveries_back_off_and_are_retried_in_order(self):
+        subscription = create_webhook_subscription(url=self.server.url)
+        task = create_task(owner_id=self.user.id, title="Task")
+        self.server.statuses.append(500)
+
+        self.dispatcher.run_once()
+
+        subscription = self.get_subscription(subscription)
+        self.assertEqual((subscription.last_event_id, subscription.failures), (0, 1))
+        self.assertEqual(subscription.last_error, "HTTP 500")
+        self.assertGreater(subscription.next_attempt_at, timezone.now() + timedelta(seconds=4))
+        self.assertEqual(self.dispatcher.failed_count, 1)
+
+        update_task(task_uuid=task.uuid, owner_id=self.user.id, title="Renamed")
+        self.assertEqual(self.dispatcher.run_once(), 0)
+        self.assertEqual(len(self.server.requests), 1)
+
+        WebhookSubscription.objects.update(next_attempt_at=timezone.now())
+        self.dispatcher.run_once()
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertListEqual(self.get_delivered_events(0), [("task.created", str(task.uuid))])
+        self.assertListEqual(self.get_delivered_events(1), [("task.created", str(task.uuid))])
+        self.assertEqual(self.server.requests[1]["body"]["events"][0]["data"]["title"], "Renamed")
+        subscription = self.get_subscription(subscription)
+        self.assertEqual((subscription.last_event_id, subscription.failures), (OutboxEvent.objects.latest("id").id, 0))
+
+    def test_unreachable_subscriptions_record_the_connection_error(self):
+        with StubWebhookServer() as closed_server:
+            url = closed_server.url
+        subscription = create_webhook_subscription(url=url)
+        create_task(owner_id=self.user.id, title="Task")
+
+        self.dispatcher.run_once()
+
+        subscription = self.get_subscription(subscription)
+        self.assertEqual(subscription.failures, 1)
+        self.assertTrue(subscription.last_error.startswith("ConnectionRefusedError"))
+
+    def test_delivers_through_worker_threads(self):
+        dispatcher = WebhookDispatcher(batch_size=100, workers=4)
+        self.addCleanup(dispatcher.close)
+        for index in range(5):
+            create_webhook_subscription(url=f"{self.server.url}?subscription={index}")
+        create_task(owner_id=self.user.id, title="Task")
+
+        dispatcher.run_once()
+
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(WebhookSubscription.objects.filter(last_event_id=OutboxEvent.objects.get().id).count(), 5)
+        self.assertFalse(WebhookSubscription.objects.filter(claim_token__isnull=False).exists())
+
+    def test_reads_the_outbox_in_batches(self):
+        dispatcher = WebhookDispatcher(batch_size=2, workers=1)
+        self.addCleanup(dispatcher.close)
+        create_webhook_subscription(url=self.server.url)
+        tasks = [create_task(owner_id=self.user.id, title=f"Task {index}") for index in range(3)]
+
+        self.assertEqual(dispatcher.run_once(), 2)
+        self.assertEqual(dispatcher.run_once(), 1)
+        self.assertEqual(dispatcher.run_once(), 0)
+
+        self.assertListEqual(
+            [self.get_delivered_events(0), self.get_delivered_events(1)],
+            [
+                [("task.created", str(tasks[0].uuid)), ("task.created", str(tasks[1].uuid))],
+                [("task.created", str(tasks[2].uuid))],
+            ],
+        )
+
+    def test_lagging_subscriptions_do_not_hold_back_the_others(self):
+        dispatcher = WebhookDispatcher(batch_size=2, workers=1)
+        self.addCleanup(dispatcher.close)
+        lagging = create_webhook_subscription(url=f"{self.server.url}?lagging=1")
+        tasks = [create_task(owner_id=self.user.id, title=f"Task {index}") for index in range(3)]
+        current = create_webhook_subscription(url=self.server.url)
+        new_task = create_task(owner_id=self.user.id, title="New task")
+
+        self.assertEqual(dispatcher.run_once(), 2)
+
+        requests_by_path = {request["path"]: request for request in self.server.requests}
+        self.assertListEqual(
+            [event["task_uuid"] for event in requests_by_path["/hooks?lagging=1"]["body"]["events"]],
+            [str(tasks[0].uuid), str(tasks[1].uuid)],
+        )
+        self.assertListEqual(
+            [event["task_uuid"] for event in requests_by_path["/hooks"]["body"]["events"]], [str(new_task.uuid)]
+        )
+        last_event_id = OutboxEvent.objects.latest("id").id
+        self.assertEqual(self.get_subscription(current).last_event_id, last_event_id)
+        self.assertEqual(self.get_subscription(lagging).last_event_id, last_event_id - 2)
+
+    def test_skips_gaps_of_rolled_back_transactions(self):
+        create_webhook_subscription(url=self.server.url)
+        tasks = [create_task(owner_id=self.user.id, title=f"Task {index}") for index in range(3)]
+        OutboxEvent.objects.filter(task_uuid=tasks[1].uuid).delete()
+
+        self.assertEqual(self.dispatcher.run_once(), 2)
+
+        self.assertListEqual(
+            self.get_delivered_events(), [("task.created", str(tasks[0].uuid)), ("task.created", str(tasks[2].uuid))]
+        )
+
+    @patch("backend.webhooks.services.dispatcher_services.get_oldest_running_transaction")
+    @patch("backend.webhooks.services.dispatcher_services.get_transaction_horizon", return_value=100)
+    def test_waits_for_the_transactions_that_may_fill_a_gap(self, _, mock_oldest_running_transaction):
+        subscription = create_webhook_subscription(url=self.server.url)
+        tasks = [create_task(owner_id=self.user.id, title=f"Task {index}") for index in range(3)]
+        late_event = OutboxEvent.objects.get(task_uuid=tasks[1].uuid)
+        late_event_id = late_event.id
+        late_event.delete()
+
+        mock_oldest_running_transaction.return_value = 90
+        self.assertEqual(self.dispatcher.run_once(), 1)
+        self.dispatcher.run_once()
+        self.assertEqual(len(self.server.requests), 1)
+
+        late_event.id = late_event_id
+        late_event.save(force_insert=True)
+        mock_oldest_running_transaction.return_value = 101
+        self.assertEqual(self.dispatcher.run_once(), 2)
+
+        self.assertListEqual(self.get_delivered_events(0), [("task.created", str(tasks[0].uuid))])
+        self.assertListEqual(
+            self.get_delivered_events(1), [("task.created", str(tasks[1].uuid)), ("task.created", str(tasks[2].uuid))]
+        )
+        self.assertEqual(self.get_subscription(subscription).last_event_id, OutboxEvent.objects.latest("id").id)
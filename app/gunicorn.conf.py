@@ -0,0 +1,42 @@
+import multiprocessing
+import os
+
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "sync")
+asgi_worker = worker_class.startswith("uvicorn")
+
+wsgi_app = "project.asgi:application" if asgi_worker else "project.wsgi:application"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8082")
+
+# Sync workers block on each request, so they are oversubscribed (2 * CPU + 1). Async workers multiplex
+# connections on an event loop and only need one per CPU.
+default_workers = multiprocessing.cpu_count() if asgi_worker else multiprocessing.cpu_count() * 2 + 1
+workers = int(os.environ.get("GUNICORN_WORKERS", default_workers))
+threads = int(os.environ.get("GUNICORN_THREADS", 1))
+
+preload_app = True
+
+# Recycle workers after a bounded number of requests, with jitter so they do not all restart together.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 100))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+
+accesslog = os.environ.get("GUNICORN_ACCESSLOG", "-") or None
+errorlog = "-"
+
+
+def on_starting(server):
+    # Token and user signals only invalidate the "local" token cache of the worker that handles them.
+    from django.conf import settings
+
+    if server.cfg.workers > 1 and settings.TOKEN_AUTH_CACHE_BACKEND == "local":
+        raise RuntimeError("TOKEN_AUTH_CACHE_BACKEND=local cannot be used with more than one worker.")
+    if asgi_worker and any(database["CONN_MAX_AGE"] != 0 for database in settings.DATABASES.values()):
+        raise RuntimeError("DATABASE_CONN_MAX_AGE must be 0 with uvicorn workers.")
+
+
+def when_ready(server):
+    # With persistent connections every worker thread keeps its own Postgres connection open.
+    if not asgi_worker:
+        server.log.info("Workers may hold up to %s database connections", workers * threads)
@@ -49,9 +49,13 @@ INSTALLED_APPS = [
     "django_filters",
     "backend.users",
     "backend.tasks",
+    "backend.jobs",
+    "backend.webhooks",
 ]
 
 MIDDLEWARE = [
+    "backend.db.middleware.ConnectionSetupTimingMiddleware",
+    "api.middleware.ApiMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -85,17 +89,50 @@ WSGI_APPLICATION = "project.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
+# Under ASGI every request runs its database code in a new thread, and a persistent connection would be left open
+# for each of them, so uvicorn workers close their connections after each request.
+ASGI_WORKER = env("GUNICORN_WORKER_CLASS", default="sync").startswith("uvicorn")
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": "backend.db.postgresql",
         "HOST": env("DATABASE_HOST"),
         "NAME": env("DATABASE_NAME"),
         "USER": env("DATABASE_USER"),
         "PASSWORD": env("DATABASE_PASSWORD"),
         "PORT": env("DATABASE_PORT"),
+        "CONN_MAX_AGE": env.int("DATABASE_CONN_MAX_AGE", default=0 if ASGI_WORKER else 60),
+        "CONN_HEALTH_CHECKS": env.bool("DATABASE_CONN_HEALTH_CHECKS", default=True),
+        "DISABLE_SERVER_SIDE_CURSORS": env.bool("DATABASE_DISABLE_SERVER_SIDE_CURSORS", default=False),
+        "OPTIONS": {
+            "connect_timeout": env.int("DATABASE_CONNECT_TIMEOUT", default=5),
+        },
     },
 }
 
+if env("DATABASE_REPLICA_HOST", default=None):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": env("DATABASE_REPLICA_HOST"),
+        "PORT": env("DATABASE_REPLICA_PORT", default=DATABASES["default"]["PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["backend.db.routers.PrimaryReplicaRouter"]
+
+# Read-only queries go to the replica, except for owners who wrote in the last READ_REPLICA_STICKINESS_SECONDS
+
+READ_REPLICA_DATABASE = "replica" if "replica" in DATABASES else None
+READ_REPLICA_STICKINESS_SECONDS = env.int("READ_REPLICA_STICKINESS_SECONDS", default=5)
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    "default": env.cache_url("CACHE_URL", default="locmemcache://"),
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
@@ -140,6 +177,92 @@ STATIC_URL = "/static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Token authentication cache, "django" (cache framework) or "local" (per process LRU, only for a single process)
+
+TOKEN_AUTH_CACHE_BACKEND = env("TOKEN_AUTH_CACHE_BACKEND", default="django")
+# Cached tokens are invalidated by the save and delete signals of Token and User. Queryset update() calls and raw SQL
+# send no signals, so after them get_token_cache().delete_user() or clear() must be called, otherwise a deactivated
+# user keeps authenticating until the timeout expires.
+TOKEN_AUTH_CACHE_TIMEOUT = env.int("TOKEN_AUTH_CACHE_TIMEOUT", default=60)
+TOKEN_AUTH_CACHE_MAX_SIZE = env.int("TOKEN_AUTH_CACHE_MAX_SIZE", default=10000)
+TOKEN_AUTH_CACHE_ALIAS = env("TOKEN_AUTH_CACHE_ALIAS", default="default")
+
+# Tasks list response cache timeout in seconds, 0 disables the cache
+
+TASKS_LIST_CACHE_TIMEOUT = env.int("TASKS_LIST_CACHE_TIMEOUT", default=0)
+
+# Days deleted tasks are kept for the changes endpoint, older since tokens need a full sync
+
+TASKS_TOMBSTONES_RETENTION_DAYS = env.int("TASKS_TOMBSTONES_RETENTION_DAYS", default=30)
+
+# Changes endpoint page size, and how far back each since token starts to cover changes that committed late
+
+TASKS_CHANGES_PAGE_SIZE = env.int("TASKS_CHANGES_PAGE_SIZE", default=500)
+TASKS_CHANGES_OVERLAP_SECONDS = env.int("TASKS_CHANGES_OVERLAP_SECONDS", default=60)
+
+# Tasks search backend, defaults to full-text search on PostgreSQL and icontains elsewhere
+
+TASKS_SEARCH_BACKEND = env("TASKS_SEARCH_BACKEND", default=None)
+
+# Rows fetched per database round trip and written per chunk by the tasks export
+
+TASKS_EXPORT_CHUNK_SIZE = env.int("TASKS_EXPORT_CHUNK_SIZE", default=2000)
+
+# Rows validated and inserted per transaction by the tasks import, and row errors reported per import
+
+TASKS_IMPORT_BATCH_SIZE = env.int("TASKS_IMPORT_BATCH_SIZE", default=5000)
+TASKS_IMPORT_MAX_ERRORS = env.int("TASKS_IMPORT_MAX_ERRORS", default=1000)
+
+# Scheduler: tasks claimed and fired per transaction, seconds claimed ahead of their run time, seconds a claim
+# lasts before another scheduler can take the task over, and threads firing tasks
+
+TASKS_SCHEDULER_BATCH_SIZE = env.int("TASKS_SCHEDULER_BATCH_SIZE", default=500)
+TASKS_SCHEDULER_HORIZON_SECONDS = env.float("TASKS_SCHEDULER_HORIZON_SECONDS", default=5)
+TASKS_SCHEDULER_LEASE_SECONDS = env.float("TASKS_SCHEDULER_LEASE_SECONDS", default=30)
+TASKS_SCHEDULER_WORKERS = env.int("TASKS_SCHEDULER_WORKERS", default=4)
+
+# Maximum occurrences of each recurring task listed in a due_after/due_before window, and longest window in days
+
+TASKS_RECURRENCE_MAX_OCCURRENCES = env.int("TASKS_RECURRENCE_MAX_OCCURRENCES", default=1000)
+TASKS_RECURRENCE_MAX_WINDOW_DAYS = env.int("TASKS_RECURRENCE_MAX_WINDOW_DAYS", default=366)
+
+# Background jobs: jobs claimed by a worker at once, seconds a claim lasts if its worker stops extending it, seconds
+# an idle worker waits, attempts per job with the retry backoff, days finished jobs are kept and directory where the
+# files uploaded for background jobs wait for the workers
+
+JOBS_BATCH_SIZE = env.int("JOBS_BATCH_SIZE", default=1)
+JOBS_LEASE_SECONDS = env.float("JOBS_LEASE_SECONDS", default=60)
+JOBS_POLL_INTERVAL_SECONDS = env.float("JOBS_POLL_INTERVAL_SECONDS", default=1)
+JOBS_MAX_ATTEMPTS = env.int("JOBS_MAX_ATTEMPTS", default=3)
+JOBS_RETRY_BACKOFF_SECONDS = env.float("JOBS_RETRY_BACKOFF_SECONDS", default=5)
+JOBS_RETRY_MAX_BACKOFF_SECONDS = env.float("JOBS_RETRY_MAX_BACKOFF_SECONDS", default=600)
+JOBS_RETENTION_DAYS = env.int("JOBS_RETENTION_DAYS", default=7)
+JOBS_FILES_DIR = env("JOBS_FILES_DIR", default=str(BASE_DIR / "job_files"))
+
+# Webhooks: outbox events read per dispatcher round, subscriptions claimed per round, threads sending the requests,
+# seconds a claim lasts, request timeout, seconds an idle dispatcher waits and retry backoff of a failing subscription
+
+WEBHOOKS_BATCH_SIZE = env.int("WEBHOOKS_BATCH_SIZE", default=500)
+WEBHOOKS_MAX_SUBSCRIPTIONS = env.int("WEBHOOKS_MAX_SUBSCRIPTIONS", default=100)
+WEBHOOKS_WORKERS = env.int("WEBHOOKS_WORKERS", default=8)
+WEBHOOKS_LEASE_SECONDS = env.float("WEBHOOKS_LEASE_SECONDS", default=120)
+WEBHOOKS_TIMEOUT_SECONDS = env.float("WEBHOOKS_TIMEOUT_SECONDS", default=5)
+WEBHOOKS_POLL_INTERVAL_SECONDS = env.float("WEBHOOKS_POLL_INTERVAL_SECONDS", default=1)
+WEBHOOKS_RETRY_BACKOFF_SECONDS = env.float("WEBHOOKS_RETRY_BACKOFF_SECONDS", default=5)
+WEBHOOKS_RETRY_MAX_BACKOFF_SECONDS = env.float("WEBHOOKS_RETRY_MAX_BACKOFF_SECONDS", default=600)
+
+# Maximum number of tasks accepted by the bulk endpoints
+
+TASKS_BULK_MAX_ITEMS = env.int("TASKS_BULK_MAX_ITEMS", default=5000)
+
+# Serve the auth token and task list/create/update/delete endpoints with async views (for ASGI deployments)
+
+ASYNC_API_VIEWS = env.bool("ASYNC_API_VIEWS", default=False)
+
+# Per view query count, DB time, serialization time and response size (Server-Timing header and /metrics)
+
+API_METRICS_ENABLED = env.bool("API_METRICS_ENABLED", default=False)
+
 # Default pagination
 
 PAGINATION_PAGE_SIZE = 10
@@ -1,4 +1,5 @@
 echo -e "Initializing Django ..."
-python ./manage.py makemigrations;
-python ./manage.py migrate;
-python ./manage.py runserver 0.0.0.0:8082;
\ No newline at end of file
+if [ "$APP_SERVER" = "runserver" ]; then
+    exec python ./manage.py runserver 0.0.0.0:8082
+fi
+exec gunicorn --config gunicorn.conf.py
\ No newline at end of file
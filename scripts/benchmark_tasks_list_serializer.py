@@ -0,0 +1,51 @@
+from statistics import median
+from time import perf_counter
+
+from api.tasks.renderers import TasksJSONRenderer
+from api.tasks.views import TasksList
+from backend.tasks.models import Task
+from django.contrib.auth.models import User
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+PAGE_SIZES = [10, 50, 100, 500]
+REPEAT = 30
+
+
+def drf_path(tasks):
+    return JSONRenderer().render(TasksList.TasksListSerializer(list(tasks), many=True).data)
+
+
+def fast_path(tasks):
+    return TasksJSONRenderer().render(TasksList.serialize_tasks(tasks))
+
+
+def time_path(render, tasks):
+    timings = []
+    for _ in range(REPEAT):
+        start = perf_counter()
+        render(tasks)
+        timings.append(perf_counter() - start)
+    return median(timings)
+
+
+with transaction.atomic():
+    user = User.objects.create(username="tasks_list_serializer_benchmark")
+    Task.objects.bulk_create(
+        Task(owner=user, title=f"Tarea {i} ñ", description="Descripción " * 10, status="to_do")
+        for i in range(max(PAGE_SIZES))
+    )
+    tasks_list = Task.objects.filter(owner=user).order_by("-created", "id")
+
+    print(f"> {REPEAT} ejecuciones por tamaño de página (mediana)")
+    for page_size in PAGE_SIZES:
+        page = tasks_list[:page_size]
+        assert drf_path(page) == fast_path(page), "Both paths must render the same bytes"
+        drf_time = time_path(drf_path, page)
+        fast_time = time_path(fast_path, page)
+        print(
+            f"{page_size} tareas: DRF {drf_time * 1000:.2f} ms, "
+            f"rápido {fast_time * 1000:.2f} ms ({drf_time / fast_time:.1f}x)"
+        )
+
+    transaction.set_rollback(True)
@@ -0,0 +1,87 @@
+import argparse
+import http.client
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+
+def percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(percent / 100 * len(values)) - 1))
+    return values[index]
+
+
+def run_worker(url: str, method: str, body: str, headers: dict, deadline: float) -> tuple[list[float], int]:
+    parts = urlsplit(url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    connection = connection_class(parts.netloc, timeout=30)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+
+    latencies, errors = [], 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            continue
+        if response.status >= 400:
+            errors += 1
+        else:
+            latencies.append(time.perf_counter() - start)
+    connection.close()
+    return latencies, errors
+
+
+def run_load_test(
+    url: str, token: str, concurrency: int, duration: float, method: str = "GET", data: str = ""
+) -> dict:
+    headers = {"Authorization": f"Token {token}"} if token else {}
+    if data:
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+    deadline = time.perf_counter() + duration
+    start_barrier = threading.Barrier(concurrency)
+
+    def worker():
+        start_barrier.wait()
+        return run_worker(url, method, data or None, headers, deadline)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda _: worker(), range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for worker_latencies, _ in results for latency in worker_latencies]
+    return {
+        "url": url,
+        "method": method,
+        "concurrency": concurrency,
+        "duration": round(elapsed, 2),
+        "requests": len(latencies),
+        "errors": sum(errors for _, errors in results),
+        "requests_per_second": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test tasks API endpoints and report requests/sec and latency.")
+    parser.add_argument("urls", nargs="+", help="Endpoints to compare, e.g. the WSGI and ASGI deployments.")
+    parser.add_argument("--token", default="", help="API token sent in the Authorization header.")
+    parser.add_argument("--method", default="GET", help="HTTP method, e.g. POST for the create endpoint.")
+    parser.add_argument("--data", default="", help="Form encoded body, e.g. 'title=Load test&status=to_do'.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent connections.")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run against each url.")
+    args = parser.parse_args()
+
+    for url in args.urls:
+        result = run_load_test(url, args.token, args.concurrency, args.duration, method=args.method, data=args.data)
+        print(json.dumps(result))
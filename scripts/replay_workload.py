@@ -0,0 +1,204 @@
+import argparse
+import http.client
+import json
+import random
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlencode, urlsplit
+
+WORKLOADS = {
+    "mixed": {
+        "operations": {"list": 60, "create": 15, "update": 15, "delete": 5, "auth": 5},
+        "list_params": [{}, {"page": 2}, {"status": "to_do"}, {"pagination": "cursor"}, {"search": "informe"}],
+    },
+    "read_heavy": {
+        "operations": {"list": 90, "create": 4, "update": 4, "delete": 1, "auth": 1},
+        "list_params": [{}, {"page": 2}, {"page": 10}, {"status": "completed"}, {"created_from": "2024-01-01"}],
+    },
+    "write_heavy": {
+        "operations": {"list": 20, "create": 40, "update": 25, "delete": 15},
+        "list_params": [{}],
+    },
+}
+TASK_STATUSES = ["to_do", "in_progress", "completed", "stand_by"]
+
+
+def percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(percent / 100 * len(values)) - 1))
+    return values[index]
+
+
+class VirtualUser:
+    def __init__(self, base_url: str, username: str, password: str, workload: dict, seed: int):
+        parts = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.connection = connection_class(parts.netloc, timeout=30)
+        self.api_path = parts.path.rstrip("/") + "/api/v1"
+        self.username, self.password = username, password
+        self.workload = workload
+        self.random = random.Random(seed)
+        self.token = None
+        self.task_uuids = []
+        self.latencies = {operation: [] for operation in [*workload["operations"], "auth"]}
+        self.errors = dict.fromkeys(self.latencies, 0)
+
+    def request(self, operation: str, method: str, path: str, data: dict = None):
+        headers = {"Authorization": f"Token {self.token}"} if self.token else {}
+        body = None
+        if data is not None:
+            body = urlencode(data)
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        start = time.perf_counter()
+        try:
+            self.connection.request(method, self.api_path + path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            content = response.read()
+        except (OSError, http.client.HTTPException):
+            self.errors[operation] += 1
+            self.connection.close()
+            return None
+        latency = time.perf_counter() - start
+
+        if response.status >= 400:
+            self.errors[operation] += 1
+            return None
+        self.latencies[operation].append(latency)
+        return json.loads(content) if content else {}
+
+    def auth(self):
+        self.token = None
+        credentials = {"username": self.username, "password": self.password}
+        response_data = self.request("auth", "POST", "/auth/token/", credentials)
+        if response_data:
+            self.token = response_data["token"]
+
+    def list(self):
+        query_params = self.random.choice(self.workload["list_params"])
+        path = "/tasks/list/" + (f"?{urlencode(query_params)}" if query_params else "")
+        response_data = self.request("list", "GET", path)
+        if response_data and len(self.task_uuids) < 100:
+            self.task_uuids += [task["uuid"] for task in response_data["results"]]
+
+    def create(self):
+        task_data = {"title": f"Benchmark {self.random.randrange(10**6)}", "status": self.random.choice(TASK_STATUSES)}
+        response_data = self.request("create", "POST", "/tasks/create/", task_data)
+        if response_data:
+            self.task_uuids.append(response_data["task_uuid"])
+
+    def update(self):
+        if not self.task_uuids:
+            return self.create()
+        task_data = {"title": f"Benchmark {self.random.randrange(10**6)}", "status": self.random.choice(TASK_STATUSES)}
+        self.request("update", "POST", f"/tasks/update/{self.random.choice(self.task_uuids)}/", task_data)
+
+    def delete(self):
+        if not self.task_uuids:
+            return self.create()
+        task_uuid = self.task_uuids.pop(self.random.randrange(len(self.task_uuids)))
+        self.request("delete", "DELETE", f"/tasks/delete/{task_uuid}/")
+
+    def run(self, deadline: float):
+        operations = list(self.workload["operations"])
+        weights = list(self.workload["operations"].values())
+        self.auth()
+        while time.perf_counter() < deadline:
+            if not self.token:
+                self.auth()
+                continue
+            getattr(self, self.random.choices(operations, weights=weights)[0])()
+        self.connection.close()
+        return self
+
+
+def get_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ""
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_second": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def replay_workload(args, workload: dict) -> dict:
+    virtual_users = [
+        VirtualUser(args.base_url, f"{args.prefix}{index % args.users:06d}", args.password, workload, args.seed + index)
+        for index in range(args.concurrency)
+    ]
+    start_barrier = threading.Barrier(args.concurrency)
+
+    def run(virtual_user):
+        start_barrier.wait()
+        return virtual_user.run(deadline)
+
+    deadline = time.perf_counter() + args.duration
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        virtual_users = list(executor.map(run, virtual_users))
+    elapsed = time.perf_counter() - started
+
+    operations = {}
+    for operation in virtual_users[0].latencies:
+        latencies = [latency for user in virtual_users for latency in user.latencies[operation]]
+        errors = sum(user.errors[operation] for user in virtual_users)
+        operations[operation] = summarize(latencies, errors, elapsed)
+
+    all_latencies = [
+        latency for user in virtual_users for latencies in user.latencies.values() for latency in latencies
+    ]
+    return {
+        "label": args.label,
+        "revision": get_revision(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "base_url": args.base_url,
+        "workload": args.workload_file or args.workload,
+        "concurrency": args.concurrency,
+        "duration": round(elapsed, 2),
+        "total": summarize(all_latencies, sum(operation["errors"] for operation in operations.values()), elapsed),
+        "operations": operations,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Replays a scripted workload against the tasks API with the users created by seed_benchmark_data."
+    )
+    parser.add_argument("base_url", help="Server url, e.g. http://localhost:8082")
+    parser.add_argument("--workload", default="mixed", help=f"Built-in workload: {', '.join(WORKLOADS)}.")
+    parser.add_argument("--workload-file", help="JSON file with a custom workload, same format as the built-in ones.")
+    parser.add_argument("--users", type=int, default=100, help="Number of seeded users to log in with.")
+    parser.add_argument("--prefix", default="bench_user_", help="Username prefix of the seeded users.")
+    parser.add_argument("--password", default="bench", help="Password of the seeded users.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Virtual users running at the same time.")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run the workload.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the virtual users.")
+    parser.add_argument("--label", default="", help="Free text stored with the results, e.g. the release.")
+    parser.add_argument("--output", help="JSON lines file the results are appended to.")
+    args = parser.parse_args()
+
+    if args.workload_file:
+        with open(args.workload_file) as workload_file:
+            workload = json.load(workload_file)
+    else:
+        workload = WORKLOADS[args.workload]
+
+    result = replay_workload(args, workload)
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, "a") as output_file:
+            output_file.write(json.dumps(result) + "\n")